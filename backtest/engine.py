@@ -2,9 +2,10 @@
 
 import pandas as pd
 import numpy as np
+from itertools import islice
 from typing import Dict, Any, Optional, List
 from tqdm import tqdm
-from strategy.base_strategy import BaseStrategy, Position, Signal, SignalType
+from strategy.base_strategy import BaseStrategy, Position, Signal, SignalType, SHARED_INDICATORS_ATTR
 from execution.position_manager import PositionManager
 from execution.risk_manager import RiskManager
 from execution.order_executor import OrderExecutor, Order
@@ -133,6 +134,28 @@ class BacktestEngine:
         
         logger.info(f"백테스트 엔진 초기화: 초기 자본 {self.initial_capital} {self.currency}")
     
+    def prepare_buffers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        파라미터 스윕용 데이터 준비 - 파라미터와 무관한 지표를 한 번만 계산
+        
+        반환된 데이터프레임을 run()에 넘기면 같은 전략 클래스의 다른 파라미터
+        조합들이 미리 계산된 지표 열을 재사용한다.
+        
+        Args:
+            df: OHLCV 데이터프레임
+            
+        Returns:
+            공유 지표 열이 추가된 데이터프레임 (attrs에 열 목록 기록)
+        """
+        shared = self.strategy.calculate_shared_indicators(df)
+        
+        prepared = df.copy()
+        for name, values in shared.items():
+            prepared[name] = np.ascontiguousarray(values, dtype=np.float64)
+        prepared.attrs[SHARED_INDICATORS_ATTR] = tuple(shared)
+        
+        return prepared
+    
     def run(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         백테스트 실행
@@ -217,6 +240,13 @@ class BacktestEngine:
             "atr": atr_values,
         }
         
+        # 리스크 가디언 변동성 평균은 봉마다 갱신 (현재 봉 판단 후 반영)
+        record_volatility = (
+            self.risk_guardian.record_volatility
+            if self.risk_guardian and atr_values is not None
+            else None
+        )
+        
         # 배치 크기 (상태 업데이트 빈도 조정)
         batch_size = 5000  # 5000바마다 상태 업데이트 (더 큰 배치)
         
@@ -241,6 +271,8 @@ class BacktestEngine:
                     current_volume,
                     current_regime,
                 )
+                if record_volatility is not None:
+                    record_volatility(atr_values[local_idx], current_price)
             
             # 웹 서버 상태 업데이트 (배치마다)
             if _update_status_func:
@@ -256,6 +288,10 @@ class BacktestEngine:
         final_timestamp = df_with_indicators.index[-1]
         self.portfolio.update_equity(final_price, final_timestamp)
         
+        # 버퍼링된 거래 일지 기록
+        if self.trade_journal:
+            self.trade_journal.flush()
+        
         # 결과 정리
         result = self._compile_results(df_with_indicators)
         
@@ -414,7 +450,7 @@ class BacktestEngine:
             
             # 리스크 가디언 청산 확인
             if self.risk_guardian:
-                should_close, reason = self.risk_guardian.should_close_position(
+                should_close, _, _ = self.risk_guardian.should_close_position(
                     current_position,
                     current_price,
                     current_timestamp,
@@ -588,7 +624,7 @@ class BacktestEngine:
                     
                     # 리스크 가디언 확인
                     if self.risk_guardian:
-                        can_trade, reason = self.risk_guardian.can_open_position(
+                        can_trade, reason, detail = self.risk_guardian.can_open_position(
                             current_equity=self.portfolio.equity,
                             current_price=current_price,
                             atr_value=atr[array_idx] if atr is not None else 0.0,
@@ -596,7 +632,7 @@ class BacktestEngine:
                             volume_ma=volume_ma or current_volume,
                         )
                         if not can_trade:
-                            logger.debug(f"리스크 가디언: 진입 차단 - {reason}")
+                            logger.opt(lazy=True).debug("리스크 가디언: 진입 차단 - {}", lambda: self.risk_guardian.describe(reason, detail))
                             return None
                 
                 return signal
@@ -695,7 +731,7 @@ class BacktestEngine:
             # 진입 시점 데이터 (포지션 metadata에서 가져오기)
             entry_volume = current_volume
             entry_volume_ma = current_volume
-            if hasattr(position, 'metadata') and position.metadata:
+            if position.metadata:
                 entry_volume = position.metadata.get("entry_volume", current_volume)
                 entry_volume_ma = position.metadata.get("entry_volume_ma", current_volume)
             
@@ -740,7 +776,7 @@ class BacktestEngine:
                 if self.trade_journal:
                     entry_decision = {}
                     if self.trading_mind and self.trading_mind.thought_log:
-                        for thought in reversed(self.trading_mind.thought_log[-10:]):
+                        for thought in islice(reversed(self.trading_mind.thought_log), 10):
                             if thought.get("type") == "entry_decision" and thought.get("decision") == "enter":
                                 entry_decision = thought
                                 break
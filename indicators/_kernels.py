@@ -0,0 +1,81 @@
+"""지표 계산 Numba 커널 (pandas ewm(adjust=False)과 동일한 결과)"""
+
+import numpy as np
+from utils.jit import njit
+
+# 입력 배열 시그니처 (pandas copy-on-write가 돌려주는 읽기 전용 배열 포함)
+_F8 = "float64[::1]"
+_F8_RO = "Array(float64, 1, 'C', readonly=True)"
+
+
+def span_alpha(span: float) -> float:
+    """ewm(span=...)과 같은 alpha (pandas와 동일하게 com을 거쳐 계산)"""
+    return 1.0 / (1.0 + (span - 1.0) / 2.0)
+
+
+def alpha_alpha(alpha: float) -> float:
+    """ewm(alpha=...)과 같은 alpha (pandas와 동일하게 com을 거쳐 계산)"""
+    return 1.0 / (1.0 + (1.0 - alpha) / alpha)
+
+
+@njit([f"float64[::1]({arr}, float64)" for arr in (_F8, _F8_RO)], cache=True)
+def ewm_mean(values, alpha):
+    """
+    지수 가중 평균 (NaN 없는 입력 전용)
+    
+    pandas ewm(adjust=False).mean()과 같은 순서로 연산해 결과가 비트 단위로 일치한다.
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    
+    old_wt = 1.0 - alpha
+    norm = old_wt + alpha
+    weighted = values[0]
+    out[0] = weighted
+    for i in range(1, n):
+        weighted = (old_wt * weighted + alpha * values[i]) / norm
+        out[i] = weighted
+    return out
+
+
+@njit(
+    [f"UniTuple(float64[::1], 3)({arr}, float64, float64, float64)" for arr in (_F8, _F8_RO)],
+    cache=True,
+)
+def ema_triple(close, a1, a2, a3):
+    """
+    세 기간의 EMA를 한 번의 순회로 계산 (NaN 없는 입력 전용)
+    
+    Args:
+        close: 종가 배열
+        a1, a2, a3: 각 EMA의 alpha (span_alpha(period))
+    """
+    n = close.shape[0]
+    out1 = np.empty(n)
+    out2 = np.empty(n)
+    out3 = np.empty(n)
+    if n == 0:
+        return out1, out2, out3
+    
+    b1 = 1.0 - a1
+    b2 = 1.0 - a2
+    b3 = 1.0 - a3
+    norm1 = b1 + a1
+    norm2 = b2 + a2
+    norm3 = b3 + a3
+    
+    w1 = w2 = w3 = close[0]
+    out1[0] = w1
+    out2[0] = w2
+    out3[0] = w3
+    for i in range(1, n):
+        x = close[i]
+        w1 = (b1 * w1 + a1 * x) / norm1
+        w2 = (b2 * w2 + a2 * x) / norm2
+        w3 = (b3 * w3 + a3 * x) / norm3
+        out1[i] = w1
+        out2[i] = w2
+        out3[i] = w3
+    return out1, out2, out3
@@ -2,8 +2,9 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Sequence, Tuple
 from indicators.base import BaseIndicator
+from indicators._kernels import ewm_mean, ema_triple, span_alpha
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,7 +34,54 @@ class EMA(BaseIndicator):
         if self.source not in df.columns:
             raise ValueError(f"소스 컬럼 '{self.source}'이(가) 없습니다.")
         
-        return df[self.source].ewm(span=self.period, adjust=False).mean()
+        values = df[self.source].to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            # NaN 가중치 처리는 pandas에 맡김
+            return df[self.source].ewm(span=self.period, adjust=False).mean()
+        
+        return pd.Series(
+            ewm_mean(np.ascontiguousarray(values), span_alpha(self.period)),
+            index=df.index,
+            name=self.source,
+        )
+    
+    @staticmethod
+    def calculate_triple(
+        emas: Sequence["EMA"],
+        df: pd.DataFrame,
+    ) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        같은 소스의 EMA 세 개를 한 번의 순회로 계산
+        
+        캐시된 EMA가 있거나 소스에 NaN이 있으면 개별 계산으로 처리한다.
+        
+        Args:
+            emas: EMA 인스턴스 3개
+            df: OHLCV 데이터프레임
+            
+        Returns:
+            각 EMA 시리즈
+        """
+        source = emas[0].source
+        if (
+            any(ema.source != source for ema in emas)
+            or source not in df.columns
+            or any(ema._cache is not None and len(ema._cache) == len(df) for ema in emas)
+        ):
+            return tuple(ema(df) for ema in emas)
+        
+        values = df[source].to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            return tuple(ema(df) for ema in emas)
+        
+        outputs = ema_triple(
+            np.ascontiguousarray(values),
+            *(span_alpha(ema.period) for ema in emas),
+        )
+        results = tuple(pd.Series(out, index=df.index, name=source) for out in outputs)
+        for ema, result in zip(emas, results):
+            ema._cache = result
+        return results
 
 
 class SMA(BaseIndicator):
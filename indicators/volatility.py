@@ -4,6 +4,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from indicators.base import BaseIndicator
+from indicators._kernels import ewm_mean, span_alpha, alpha_alpha
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -49,15 +50,20 @@ class ATR(BaseIndicator):
         # ATR 계산
         if self.method == "wilder":
             # Wilder's smoothing (EMA with alpha = 1/period)
-            atr = true_range.ewm(alpha=1.0 / self.period, adjust=False).mean()
+            alpha = alpha_alpha(1.0 / self.period)
         elif self.method == "sma":
-            atr = true_range.rolling(window=self.period).mean()
+            return true_range.rolling(window=self.period).mean()
         elif self.method == "ema":
-            atr = true_range.ewm(span=self.period, adjust=False).mean()
+            alpha = span_alpha(self.period)
         else:
             raise ValueError(f"알 수 없는 method: {self.method}")
         
-        return atr
+        values = true_range.to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            # NaN 가중치 처리는 pandas에 맡김
+            return true_range.ewm(alpha=alpha, adjust=False).mean()
+        
+        return pd.Series(ewm_mean(values, alpha), index=true_range.index, name=true_range.name)
 
 
 class BollingerBands(BaseIndicator):
@@ -27,7 +27,7 @@ from utils.helpers import load_yaml
 from utils.logger import setup_logger, get_logger
 from datetime import datetime
 from backtest.engine import set_status_updater
-from web.status import update_backtest_status
+from web.status import update_backtest_status, notify_results_saved
 from web.server import run_server as run_web_server
 import threading
 import time
@@ -238,6 +238,7 @@ def run_backtest(config: dict, start_date: str = None, end_date: str = None):
             )
             
             logger.info(f"데이터베이스 저장 완료: session_id={session_id}")
+            notify_results_saved(session_id)
             logger.info(f"성과 평가: {reflection['performance_rating']}/10")
             
         except Exception as e:
@@ -471,6 +472,7 @@ def run_optimize(
         backtest_config = config.get("backtest", {})
         strategy_config = config.get("strategy", {})
         strategy_name = strategy_config.get("name", "EMA_BB_TurtleTrailing")
+        strategy_cls = StrategyRegistry.get_class(strategy_name)
         
         total_combinations = len(continuous_optimizer.param_combinations)
         max_iterations = min(max_iterations, total_combinations)  # 조합 수만큼만
@@ -499,7 +501,7 @@ def run_optimize(
             optimized_config = continuous_optimizer.apply_params_to_config(config, current_params)
             
             # 백테스트 실행
-            strategy = StrategyRegistry.get_strategy(strategy_name, optimized_config)
+            strategy = strategy_cls(optimized_config)
             engine = BacktestEngine(strategy, backtest_config)
             result = engine.run(df)
             
@@ -268,35 +268,47 @@ class ContinuousOptimizer:
         # 이 메서드는 이제 사용하지 않지만 호환성을 위해 유지
         return current_params
     
+    @staticmethod
     def apply_params_to_config(
-        self,
         config: Dict[str, Any],
         params: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """파라미터를 설정에 적용"""
-        new_config = self._deep_copy_config(config)
-        
-        # EMA 기간 적용
-        indicators_config = new_config.setdefault("indicators", {})
-        ema_config = indicators_config.setdefault("ema", {})
-        ema_config["periods"] = [
-            params.get("ema_fast", 20),
-            params.get("ema_mid", 40),
-            params.get("ema_slow", 80),
-        ]
+        """
+        파라미터를 설정에 적용
         
-        # ATR multiplier 적용
-        strategy_config = new_config.setdefault("strategy", {})
-        exit_config = strategy_config.setdefault("exit", {})
-        stop_loss_config = exit_config.setdefault("stop_loss", {})
-        stop_loss_config["atr_multiplier"] = params.get("atr_multiplier", 2.0)
+        변경되는 두 경로(indicators.ema.periods, strategy.exit.stop_loss.atr_multiplier)만
+        새 딕셔너리로 만들고 나머지 하위 설정은 원본과 공유한다 (원본은 변경하지 않음).
+        """
+        indicators_config = config.get("indicators", {})
+        strategy_config = config.get("strategy", {})
+        exit_config = strategy_config.get("exit", {})
         
-        return new_config
-    
-    def _deep_copy_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """설정 딕셔너리 깊은 복사"""
-        import copy
-        return copy.deepcopy(config)
+        return {
+            **config,
+            # EMA 기간 적용
+            "indicators": {
+                **indicators_config,
+                "ema": {
+                    **indicators_config.get("ema", {}),
+                    "periods": [
+                        params.get("ema_fast", 20),
+                        params.get("ema_mid", 40),
+                        params.get("ema_slow", 80),
+                    ],
+                },
+            },
+            # ATR multiplier 적용
+            "strategy": {
+                **strategy_config,
+                "exit": {
+                    **exit_config,
+                    "stop_loss": {
+                        **exit_config.get("stop_loss", {}),
+                        "atr_multiplier": params.get("atr_multiplier", 2.0),
+                    },
+                },
+            },
+        }
     
     def get_current_best_params(self) -> Dict[str, Any]:
         """현재 최적 파라미터 반환"""
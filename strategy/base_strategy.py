@@ -1,7 +1,7 @@
 """전략 베이스 클래스"""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from enum import Enum
 import pandas as pd
@@ -9,6 +9,9 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 미리 계산된(파라미터 무관) 지표 열 이름을 담는 DataFrame.attrs 키
+SHARED_INDICATORS_ATTR = "shared_indicators"
+
 
 class Regime(Enum):
     """시장 레짐"""
@@ -47,7 +50,7 @@ class Position:
     quantity: float
     stop_loss: float
     regime_at_entry: Regime
-    metadata: Optional[Dict] = None
+    metadata: Dict = field(default_factory=dict)
 
 
 class BaseStrategy(ABC):
@@ -78,6 +81,18 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def calculate_shared_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        최적화 파라미터와 무관한 지표 계산 (파라미터 스윕 전 1회 계산해 재사용)
+        
+        Args:
+            df: OHLCV 데이터프레임
+            
+        Returns:
+            열 이름 → 지표 시리즈 (기본: 없음)
+        """
+        return {}
+    
     @abstractmethod
     def detect_regime(self, df: pd.DataFrame) -> pd.Series:
         """
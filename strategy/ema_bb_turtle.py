@@ -2,7 +2,7 @@
 
 import pandas as pd
 from typing import Dict, Any, Optional
-from strategy.base_strategy import BaseStrategy, Regime, Signal, SignalType, Position
+from strategy.base_strategy import BaseStrategy, Regime, Signal, SignalType, Position, SHARED_INDICATORS_ATTR
 from strategy.regime_detector import RegimeDetector
 from strategy.signal_generator import SignalGenerator
 from indicators.trend import EMA
@@ -16,6 +16,9 @@ logger = get_logger(__name__)
 class EMABBTurtleStrategy(BaseStrategy):
     """EMA + Bollinger Bands + Turtle Trailing 전략"""
     
+    # EMA 기간/ATR 배수와 무관한 지표 열
+    _SHARED_COLUMNS = ("bb_middle", "bb_upper", "bb_lower", "ATR", "VolumeMA")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         전략 초기화
@@ -75,25 +78,36 @@ class EMABBTurtleStrategy(BaseStrategy):
         """지표 계산"""
         result_df = df.copy()
         
-        # EMA 계산
-        result_df["EMA_20"] = self.ema20(result_df)
-        result_df["EMA_40"] = self.ema40(result_df)
-        result_df["EMA_80"] = self.ema80(result_df)
-        
-        # Bollinger Bands 계산
-        bb_result = self.bb.calculate_full(result_df)
-        result_df["bb_middle"] = bb_result["bb_middle"]
-        result_df["bb_upper"] = bb_result["bb_upper"]
-        result_df["bb_lower"] = bb_result["bb_lower"]
-        
-        # ATR 계산
-        result_df["ATR"] = self.atr(result_df)
+        # EMA 계산 (세 기간을 한 번의 순회로)
+        ema_fast, ema_mid, ema_slow = EMA.calculate_triple(
+            (self.ema20, self.ema40, self.ema80), result_df
+        )
+        result_df["EMA_20"] = ema_fast
+        result_df["EMA_40"] = ema_mid
+        result_df["EMA_80"] = ema_slow
         
-        # Volume MA 계산
-        result_df["VolumeMA"] = self.volume_ma(result_df)
+        # BB / ATR / Volume MA (prepare_buffers로 미리 계산된 열이면 재사용)
+        if not set(self._SHARED_COLUMNS).issubset(df.attrs.get(SHARED_INDICATORS_ATTR, ())):
+            for name, values in self.calculate_shared_indicators(result_df).items():
+                result_df[name] = values
         
         return result_df
     
+    def calculate_shared_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """EMA 기간/ATR 배수와 무관한 지표 계산 (Bollinger Bands, ATR, Volume MA)"""
+        # Bollinger Bands 계산
+        bb_result = self.bb.calculate_full(df)
+        
+        return {
+            "bb_middle": bb_result["bb_middle"],
+            "bb_upper": bb_result["bb_upper"],
+            "bb_lower": bb_result["bb_lower"],
+            # ATR 계산
+            "ATR": self.atr(df),
+            # Volume MA 계산
+            "VolumeMA": self.volume_ma(df),
+        }
+    
     def detect_regime(self, df: pd.DataFrame) -> pd.Series:
         """레짐 탐지"""
         return self.regime_detector.detect(df)
@@ -37,11 +37,23 @@ class StrategyRegistry:
         Returns:
             전략 인스턴스
         """
+        return cls.get_class(name)(config)
+    
+    @classmethod
+    def get_class(cls, name: str) -> Type[BaseStrategy]:
+        """
+        전략 클래스 조회 (반복 생성 시 한 번만 조회해 재사용)
+        
+        Args:
+            name: 전략 이름
+            
+        Returns:
+            전략 클래스
+        """
         if name not in cls._strategies:
             raise ValueError(f"등록되지 않은 전략: {name}")
         
-        strategy_class = cls._strategies[name]
-        return strategy_class(config)
+        return cls._strategies[name]
     
     @classmethod
     def list_strategies(cls) -> list:
@@ -0,0 +1,24 @@
+"""결정 로그 기록기 테스트"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from trading.decision_logger import _DecisionWriter
+
+
+def test_close_writes_records_queued_after_stop(tmp_path):
+    """기록 스레드가 종료 센티널을 읽은 뒤 들어온 기록도 close()에서 기록"""
+    path = tmp_path / "decisions.jsonl"
+    writer = _DecisionWriter()
+    writer.put(path, "first\n")
+    
+    # 기록 스레드 종료 직후 다른 스레드가 큐에 넣은 상황 재현
+    writer._queue.put(writer._STOP)
+    writer._thread.join()
+    writer._queue.put((path, "second\n"))
+    
+    writer.close()
+    
+    assert path.read_text(encoding="utf-8") == "first\nsecond\n"
+    assert writer._queue.empty()
@@ -0,0 +1,59 @@
+"""실패 분석기 테스트"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+import pytest
+import trading  # noqa: F401 - backtest.engine보다 먼저 임포트해야 스마트 거래 모듈이 로드됨
+from trading.failure_analyzer import FailureAnalyzer
+
+
+@pytest.fixture
+def history():
+    """ATR 열이 있는 시장 이력"""
+    return pd.DataFrame({
+        "close": np.linspace(100, 90, 30),
+        "atr": np.ones(30),
+        "volume": np.full(30, 100.0),
+    }, index=pd.date_range("2024-01-01", periods=30, freq="1min"))
+
+
+def test_missing_exit_price_gives_zero_exit_volatility(history):
+    """청산가가 없으면 청산 변동성은 0 (진입가로 대체하지 않음)"""
+    analysis = FailureAnalyzer({}).analyze_trade_failure(
+        {"pnl": -50.0},
+        {"price": 100.0, "atr": 1.0, "stop_loss": 97.0},
+        {"atr": 2.0},
+        history,
+    )
+    market = analysis["market_conditions"]
+    
+    assert market["entry_volatility"] == pytest.approx(1.0)
+    assert market["exit_volatility"] == 0.0
+    assert market["volatility_change"] == pytest.approx(-1.0)
+
+
+def test_batch_matches_single_trade_analysis(history):
+    """일괄 분석이 거래별 분석과 같은 변동성/손실 값"""
+    trades = pd.DataFrame({
+        "pnl": [-50.0, -50.0],
+        "entry_price": [100.0, 100.0],
+        "exit_price": [np.nan, 95.0],
+        "entry_atr": [1.0, 1.0],
+        "exit_atr": [2.0, 2.0],
+        "stop_loss": [97.0, 97.0],
+    })
+    result = FailureAnalyzer({}).analyze_many(trades)
+    
+    for idx, exit_price in enumerate([None, 95.0]):
+        exit_data = {"atr": 2.0} if exit_price is None else {"atr": 2.0, "price": exit_price}
+        market = FailureAnalyzer({}).analyze_trade_failure(
+            {"pnl": -50.0}, {"price": 100.0, "atr": 1.0, "stop_loss": 97.0}, exit_data, history,
+        )["market_conditions"]
+        assert result["exit_volatility"].iloc[idx] == pytest.approx(market["exit_volatility"])
+        assert result["volatility_change"].iloc[idx] == pytest.approx(market["volatility_change"])
+    
+    assert result["actual_loss"].tolist() == pytest.approx([0.0, 5.0])
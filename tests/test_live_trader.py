@@ -0,0 +1,53 @@
+"""실시간 거래자 테스트"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from threading import Thread
+from unittest.mock import patch
+
+import pytest
+import trading  # noqa: F401 - backtest.engine보다 먼저 임포트해야 스마트 거래 모듈이 로드됨
+from trading.live_trader import LiveTrader
+from utils.helpers import load_yaml
+
+
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "settings.yaml"
+
+
+@pytest.fixture
+def trader(monkeypatch, tmp_path):
+    """웹훅 모드 실시간 거래자 (결정 로그 디렉터리는 임시 디렉터리에 생성)"""
+    monkeypatch.chdir(tmp_path)
+    trader = LiveTrader(load_yaml(str(CONFIG_PATH)))
+    trader._webhook_mode = True
+    return trader
+
+
+def test_webhook_mode_runs_initial_optimization_once(trader):
+    """웹훅 모드 시작 시 초기 최적화는 한 번만 실행"""
+    with patch.object(LiveTrader, "_run_optimization") as run_optimization, \
+            patch.object(LiveTrader, "_wait_for_stop", return_value=True):
+        trader.start_trading(auto_optimize=True)
+    
+    assert run_optimization.call_count == 1
+    assert not trader.is_trading
+
+
+def test_restart_after_stop(trader):
+    """stop() 이후 다시 start_trading을 호출하면 워커와 대기 루프가 재개됨"""
+    for _ in range(2):
+        runner = Thread(target=trader.start_trading, kwargs={"auto_optimize": False})
+        runner.start()
+        
+        # 대기 루프에 들어갈 때까지 기다림 (즉시 반환하면 재시작 실패)
+        runner.join(timeout=0.5)
+        assert runner.is_alive()
+        assert trader.is_trading
+        assert all(worker.is_alive() for worker in trader._workers)
+        
+        trader.stop()
+        runner.join(timeout=5.0)
+        assert not runner.is_alive()
+        assert not any(worker.is_alive() for worker in trader._workers)
@@ -0,0 +1,104 @@
+"""리스크 가디언 테스트"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import date, datetime
+from types import SimpleNamespace
+import trading  # noqa: F401 - backtest.engine보다 먼저 임포트해야 스마트 거래 모듈이 로드됨
+from trading import risk_guardian as risk_guardian_module
+from trading.risk_guardian import RiskGuardian, RiskStatus
+
+
+@pytest.fixture
+def guardian():
+    """평균 변동성(ATR/가격)이 1%로 기록된 리스크 가디언"""
+    guardian = RiskGuardian({"risk": {"initial_capital": 100000}})
+    for _ in range(50):
+        guardian.record_volatility(1.0, 100.0)
+    return guardian
+
+
+def _can_open(guardian, atr_value):
+    return guardian.can_open_position(
+        current_equity=100000,
+        current_price=100.0,
+        atr_value=atr_value,
+        volume=1000.0,
+        volume_ma=1000.0,
+    )
+
+
+def test_volatility_filter_blocks_high_volatility(guardian):
+    """평균의 3배를 넘는 변동성에서는 진입 차단"""
+    can_trade, status, detail = _can_open(guardian, 5.0)
+    
+    assert not can_trade
+    assert status == RiskStatus.VOLATILITY
+    assert guardian.describe(status, detail) == f"변동성 과다: {detail[0]:.2f}x 평균"
+
+
+def test_volatility_filter_allows_normal_volatility(guardian):
+    """평소 수준 변동성에서는 진입 허용"""
+    can_trade, status, _ = _can_open(guardian, 1.5)
+    
+    assert can_trade
+    assert status == RiskStatus.OK
+
+
+def test_record_volatility_ignores_warmup_nan():
+    """지표 워밍업 구간의 NaN ATR은 평균에 반영하지 않음"""
+    guardian = RiskGuardian({})
+    guardian.record_volatility(float("nan"), 100.0)
+    guardian.record_volatility(2.0, 100.0)
+    
+    assert guardian._get_average_volatility() == pytest.approx(0.02)
+
+
+def test_daily_stats_reset_at_local_midnight(monkeypatch):
+    """일일 통계는 현지 자정에 새 날로 초기화 (거래가 없어도 조회 시 0)"""
+    clock = SimpleNamespace(time=lambda: datetime(2024, 1, 1, 23, 59).timestamp())
+    monkeypatch.setattr(risk_guardian_module, "time", clock)
+    guardian = RiskGuardian({"risk": {"initial_capital": 100000}})
+    guardian.update_after_trade({"pnl": -10.0}, 99990.0)
+    
+    assert (guardian.daily_pnl, guardian.daily_trades) == (-10.0, 1)
+    
+    clock.time = lambda: datetime(2024, 1, 2, 0, 1).timestamp()
+    assert (guardian.daily_pnl, guardian.daily_trades) == (0.0, 0)
+    assert guardian.current_date == date(2024, 1, 1)
+    
+    guardian.update_after_trade({"pnl": 5.0}, 99995.0)
+    assert (guardian.daily_pnl, guardian.daily_trades) == (5.0, 1)
+    assert guardian.current_date == date(2024, 1, 2)
+
+
+def test_backtest_engine_feeds_volatility(monkeypatch, tmp_path):
+    """백테스트 엔진이 봉마다 리스크 가디언 변동성 평균을 갱신"""
+    monkeypatch.chdir(tmp_path)  # 결정 로그/일지는 작업 디렉터리 기준 경로에 기록됨
+    from backtest.engine import BacktestEngine
+    from strategy.strategy_registry import StrategyRegistry
+    from utils.helpers import load_yaml
+    
+    config = load_yaml(str(Path(__file__).parent.parent / "config" / "settings.yaml"))
+    dates = pd.date_range("2024-01-01", periods=400, freq="1min")
+    np.random.seed(42)
+    prices = 50000 + np.cumsum(np.random.randn(400) * 50)
+    df = pd.DataFrame({
+        "open": prices,
+        "high": prices + 30,
+        "low": prices - 30,
+        "close": prices,
+        "volume": np.random.randint(100, 1000, 400).astype(float),
+    }, index=dates)
+    
+    strategy = StrategyRegistry.get_strategy(config["strategy"]["name"], config)
+    backtest_config = {**config.get("backtest", {}), "use_smart_trading": True}
+    engine = BacktestEngine(strategy, backtest_config)
+    engine.run(df)
+    
+    assert engine.risk_guardian._get_average_volatility() > 0
@@ -0,0 +1,159 @@
+"""스마트 진입/청산 테스트 (커널/벡터 경로와 봉 단위 경로 비교)"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+import pytest
+import trading  # noqa: F401 - backtest.engine보다 먼저 임포트해야 스마트 거래 모듈이 로드됨
+from strategy.base_strategy import Position, Regime, Signal, SignalType
+from trading import smart_entry as smart_entry_module
+from trading.smart_entry import SmartEntry
+from trading.smart_exit import SmartExit
+
+CONFIG = {"strategy": {"entry": {"filters": {"min_confidence": 0.55}}}}
+
+
+@pytest.fixture
+def df():
+    """EMA/거래량 MA/레짐 컬럼이 있는 데이터프레임"""
+    n = 300
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    volume = rng.uniform(100, 1000, n)
+    df = pd.DataFrame({
+        "open": close,
+        "high": close + rng.uniform(0, 1, n),
+        "low": close - rng.uniform(0, 1, n),
+        "close": close,
+        "volume": volume,
+    }, index=pd.date_range("2024-01-01", periods=n, freq="1min"))
+    df["EMA_20"] = df["close"].ewm(span=20).mean()
+    df["EMA_80"] = df["close"].ewm(span=80).mean()
+    df["volume_ma"] = df["volume"].rolling(20, min_periods=1).mean()
+    df["regime"] = np.where(df["EMA_20"] > df["EMA_80"], Regime.BULL, Regime.BEAR)
+    return df
+
+
+@pytest.fixture
+def directions():
+    """봉별 시그널 방향 (1: 롱, -1: 숏, 0: 없음)"""
+    return np.random.default_rng(11).choice(np.array([-1, 0, 1], dtype=np.int8), 300)
+
+
+def _per_bar(smart_entry, df, directions):
+    """evaluate_entry_quality를 봉마다 호출한 결과"""
+    allowed = np.zeros(len(df), dtype=bool)
+    confidence = np.zeros(len(df))
+    for idx, direction in enumerate(directions):
+        if direction == 0:
+            continue
+        signal_type = SignalType.LONG_ENTRY if direction > 0 else SignalType.SHORT_ENTRY
+        signal = Signal(signal_type, df["close"].iloc[idx], df.index[idx], Regime.BULL)
+        allowed[idx], confidence[idx], _ = smart_entry.evaluate_entry_quality(df, idx, signal, Regime.BULL)
+    return allowed, confidence
+
+
+def test_entry_batch_matches_per_bar(df, directions):
+    """일괄 평가 커널이 봉 단위 평가와 같은 결과"""
+    allowed, confidence = SmartEntry(CONFIG).evaluate_entry_quality_batch(df, directions)
+    expected_allowed, expected_confidence = _per_bar(SmartEntry(CONFIG), df, directions)
+    
+    assert allowed.any()
+    np.testing.assert_array_equal(allowed, expected_allowed)
+    np.testing.assert_allclose(confidence, expected_confidence)
+
+
+def test_entry_numpy_fallback_matches_kernel(df, directions, monkeypatch):
+    """numba가 없을 때의 NumPy 경로가 커널과 같은 결과"""
+    allowed, confidence = SmartEntry(CONFIG).evaluate_entry_quality_batch(df, directions)
+    monkeypatch.setattr(smart_entry_module, "HAS_NUMBA", False)
+    fallback_allowed, fallback_confidence = SmartEntry(CONFIG).evaluate_entry_quality_batch(df, directions)
+    
+    np.testing.assert_array_equal(allowed, fallback_allowed)
+    np.testing.assert_allclose(confidence, fallback_confidence)
+
+
+def test_entry_prepare_rebinds_modified_frame(df, directions):
+    """제자리에서 바꾼 데이터프레임은 prepare() 후 새 값으로 평가"""
+    smart_entry = SmartEntry(CONFIG)
+    smart_entry.prepare(df)
+    _per_bar(smart_entry, df, directions)
+    
+    df["close"] = df["close"].to_numpy()[::-1].copy()
+    smart_entry.prepare(df)
+    
+    np.testing.assert_allclose(
+        _per_bar(smart_entry, df, directions)[1],
+        _per_bar(SmartEntry(CONFIG), df, directions)[1],
+    )
+
+
+def test_entry_rebinds_for_new_frame(df, directions):
+    """다른 데이터프레임이 들어오면 다시 바인딩"""
+    smart_entry = SmartEntry(CONFIG)
+    _per_bar(smart_entry, df, directions)
+    
+    other = df.copy()
+    other["close"] = other["close"].to_numpy()[::-1].copy()
+    
+    np.testing.assert_allclose(
+        _per_bar(smart_entry, other, directions)[1],
+        _per_bar(SmartEntry(CONFIG), other, directions)[1],
+    )
+
+
+def test_entry_rebinds_after_in_place_append(df):
+    """같은 데이터프레임에 행을 추가하면 새 마지막 봉도 새 값으로 평가"""
+    df = df.iloc[:60].copy()
+    df["regime"] = Regime.BULL
+    smart_entry = SmartEntry(CONFIG)
+    smart_entry.evaluate_entry_quality(df, 59, Signal(SignalType.LONG_ENTRY, 0.0, df.index[59], Regime.BULL), Regime.BULL)
+    
+    # 거래량이 늘며 상승하는 봉 3개를 제자리에서 추가
+    for _ in range(3):
+        bar = df.iloc[-1].copy()
+        bar[["open", "high", "low", "close"]] *= 1.02
+        bar["volume"] = 5000.0
+        bar["EMA_20"] += 1.0
+        df.loc[df.index[-1] + pd.Timedelta(minutes=1)] = bar
+    
+    signal = Signal(SignalType.LONG_ENTRY, df["close"].iloc[-1], df.index[-1], Regime.BULL)
+    expected = SmartEntry(CONFIG).evaluate_entry_quality(df, 62, signal, Regime.BULL)
+    assert expected[0]
+    assert smart_entry.evaluate_entry_quality(df, 62, signal, Regime.BULL) == expected
+
+
+def test_exit_vectorized_matches_scalar():
+    """틱 일괄 처리가 포지션별 청산 판단과 같은 결과"""
+    smart_exit = SmartExit({})
+    rng = np.random.default_rng(3)
+    entry_time = pd.Timestamp("2024-01-01 00:00")
+    now = pd.Timestamp("2024-01-01 13:00")
+    positions = []
+    for i in range(40):
+        direction = "long" if i % 2 == 0 else "short"
+        entry_price = float(rng.uniform(90, 110))
+        stop_loss = entry_price * (0.97 if direction == "long" else 1.03)
+        positions.append(Position(
+            entry_price, entry_time + pd.Timedelta(hours=i % 3 * 6), direction, 1.0, stop_loss, Regime.BULL,
+            metadata={"pe_mask": int(i % 4)},
+        ))
+    prices = np.array([p.entry_price for p in positions]) * rng.uniform(0.93, 1.08, len(positions))
+    atrs = rng.uniform(0.5, 3.0, len(positions))
+    
+    result = smart_exit.apply_tick_vectorized(prices, atrs, SmartExit.positions_soa(positions), now.value)
+    
+    for i, position in enumerate(positions):
+        price, atr = float(prices[i]), float(atrs[i])
+        assert result["stop_loss"][i] == pytest.approx(smart_exit.calculate_trailing_stop(position, price, atr))
+        assert result["take_profit"][i] == smart_exit.should_take_profit(position, price, atr)[0]
+        assert result["cut_loss"][i] == smart_exit.should_cut_loss_early(
+            position, price, position.entry_time, now,
+        )[0]
+        partial_exit, partial_exit_pct = smart_exit.check_partial_exit(position, price)
+        assert result["partial_exit"][i] == partial_exit
+        assert result["partial_exit_pct"][i] == pytest.approx(partial_exit_pct)
+        assert result["pe_mask"][i] == position.metadata["pe_mask"]
@@ -0,0 +1,178 @@
+"""TradingView 웹훅 테스트"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import hashlib
+import hmac
+import json
+from datetime import datetime
+
+import pytest
+import trading  # noqa: F401 - backtest.engine보다 먼저 임포트해야 스마트 거래 모듈이 로드됨
+from web import tradingview_webhook as tvw
+from web.server import app
+
+
+@pytest.fixture
+def client():
+    """Flask 테스트 클라이언트"""
+    return app.test_client()
+
+
+@pytest.fixture
+def secret(monkeypatch):
+    """웹훅 시크릿 설정"""
+    monkeypatch.setattr(tvw, "WEBHOOK_SECRET", b"s3cret")
+    return b"s3cret"
+
+
+def test_parse_detailed_format():
+    """상세 형식(symbol/OHLCV) 정규화"""
+    bar = tvw._parse_tradingview_data({
+        "symbol": "ETHUSDT",
+        "exchange": "BINANCE",
+        "timeframe": "1m",
+        "timestamp": "2024-01-01T00:01:00",
+        "open": 2500.0,
+        "high": 2510.0,
+        "low": 2490.0,
+        "close": 2505.0,
+        "volume": 1000,
+        "action": "buy",
+    })
+    
+    assert bar["symbol"] == "ETHUSDT"
+    assert bar["timestamp"] == "2024-01-01T00:01:00"
+    assert (bar["open"], bar["high"], bar["low"], bar["close"]) == (2500.0, 2510.0, 2490.0, 2505.0)
+    assert bar["volume"] == 1000.0
+    assert bar["action"] == "buy"
+
+
+def test_parse_simple_format():
+    """간단한 형식(ticker/price)은 price를 OHLC 전체에 사용"""
+    bar = tvw._parse_tradingview_data({"ticker": "ETHUSDT", "price": "2500.5", "time": 1700000000000})
+    
+    assert bar["symbol"] == "ETHUSDT"
+    assert bar["open"] == bar["high"] == bar["low"] == bar["close"] == 2500.5
+    assert bar["volume"] == 0.0
+    assert bar["timestamp"] == datetime.fromtimestamp(1700000000).isoformat()
+
+
+def test_parse_detailed_format_without_open_falls_back_to_close():
+    """open/price가 없는 상세 형식은 close로 open/high/low를 채움 (이전 파서는 0.0)"""
+    bar = tvw._parse_tradingview_data({"symbol": "ETHUSDT", "close": 2505.0, "volume": 10})
+    
+    assert bar["open"] == bar["high"] == bar["low"] == bar["close"] == 2505.0
+    assert bar["volume"] == 10.0
+
+
+def test_parse_unsubstituted_template_uses_defaults():
+    """치환되지 않은 템플릿 변수는 기본값으로 대체"""
+    bar = tvw._parse_tradingview_data({"symbol": "{{ticker}}", "timeframe": "{{interval}}", "close": 1.0})
+    
+    assert bar["symbol"] == "UNKNOWN"
+    assert bar["timeframe"] == "1m"
+
+
+def test_parse_without_price_fails():
+    """가격 필드가 없으면 None"""
+    assert tvw._parse_tradingview_data({"symbol": "ETHUSDT"}) is None
+    assert tvw._parse_tradingview_data({"close": "abc"}) is None
+
+
+@pytest.mark.parametrize("ts, expected", [
+    (1700000000, 1700000000),
+    (1700000000000, 1700000000),
+    (1700000000000000, 1700000000),
+    ("1700000000000", 1700000000),
+])
+def test_parse_timestamp_units(ts, expected):
+    """초/밀리초/마이크로초 타임스탬프 단위 판별"""
+    assert tvw._parse_timestamp(ts) == datetime.fromtimestamp(expected)
+
+
+def test_secret_not_configured_accepts_all(monkeypatch):
+    """시크릿 미설정 시 검증 생략"""
+    monkeypatch.setattr(tvw, "WEBHOOK_SECRET", b"")
+    assert tvw._verify_webhook_secret(b"{}", "")
+
+
+def test_secret_accepts_shared_secret_and_signature(secret):
+    """시크릿 자체 또는 본문 HMAC-SHA256 서명 허용"""
+    raw = b'{"close": 1.0}'
+    signature = hmac.new(secret, raw, hashlib.sha256).hexdigest()
+    
+    assert tvw._verify_webhook_secret(raw, "s3cret")
+    assert tvw._verify_webhook_secret(raw, signature)
+    assert not tvw._verify_webhook_secret(raw, "wrong")
+    assert not tvw._verify_webhook_secret(b'{"close": 2.0}', signature)
+
+
+def test_webhook_rejects_bad_secret(client, secret):
+    """시크릿이 틀리면 401"""
+    response = client.post(
+        "/webhook/tradingview",
+        data=json.dumps({"close": 1.0}),
+        content_type="application/json",
+        headers={"X-Webhook-Secret": "wrong"},
+    )
+    
+    assert response.status_code == 401
+
+
+def test_webhook_accepts_valid_secret(client, secret):
+    """시크릿이 맞으면 202로 접수"""
+    response = client.post(
+        "/webhook/tradingview",
+        data=json.dumps({"ticker": "ETHUSDT", "price": 2500.0}),
+        content_type="application/json",
+        headers={"X-Webhook-Secret": "s3cret"},
+    )
+    
+    assert response.status_code == 202
+    assert response.get_json()["status"] == "success"
+
+
+def test_next_batch_limits_size(monkeypatch):
+    """버퍼의 봉을 최대 배치 크기 단위로 묶음"""
+    monkeypatch.setattr(tvw, "_bar_queue", tvw.queue.Queue())
+    for i in range(tvw._BATCH_MAX_SIZE + 6):
+        tvw._bar_queue.put({"close": float(i)})
+    
+    first = tvw._next_batch()
+    second = tvw._next_batch()
+    
+    assert len(first) == tvw._BATCH_MAX_SIZE
+    assert len(second) == 6
+    assert second[-1]["close"] == float(tvw._BATCH_MAX_SIZE + 5)
+
+
+def test_dispatch_batch_prefers_batch_callback(monkeypatch):
+    """배치 콜백이 있으면 봉 단위 콜백 대신 한 번에 전달"""
+    batches, bars = [], []
+    monkeypatch.setattr(tvw, "_tradingview_batch_callback", batches.append)
+    monkeypatch.setattr(tvw, "_tradingview_callback", bars.append)
+    
+    tvw._dispatch_batch([{"close": 1.0}, {"close": 2.0}])
+    
+    assert batches == [[{"close": 1.0}, {"close": 2.0}]]
+    assert bars == []
+
+
+def test_dispatch_batch_falls_back_to_bar_callback(monkeypatch):
+    """배치 콜백이 없으면 봉마다 콜백 호출 (한 봉의 실패가 나머지를 막지 않음)"""
+    bars = []
+    
+    def callback(bar):
+        if bar["close"] == 1.0:
+            raise ValueError("실패")
+        bars.append(bar)
+    
+    monkeypatch.setattr(tvw, "_tradingview_batch_callback", None)
+    monkeypatch.setattr(tvw, "_tradingview_callback", callback)
+    
+    tvw._dispatch_batch([{"close": 1.0}, {"close": 2.0}])
+    
+    assert bars == [{"close": 2.0}]
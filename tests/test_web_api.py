@@ -0,0 +1,118 @@
+"""웹 API 테스트 (ETag 재검증, 상태 스트림)"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+import trading  # noqa: F401 - backtest.engine보다 먼저 임포트해야 스마트 거래 모듈이 로드됨
+from web import api
+from web.server import app
+from web.status import notify_results_saved
+
+
+@pytest.fixture
+def client():
+    """Flask 테스트 클라이언트"""
+    return app.test_client()
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """결과/거래 테이블이 있는 메모리 SQLite DB로 API의 DB 로거 교체"""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE myno_backtest_results (session_id TEXT, run_date TEXT, total_return REAL)"))
+        conn.execute(text("CREATE TABLE myno_trade_details (session_id TEXT, entry_time TEXT, pnl REAL)"))
+        conn.execute(text("INSERT INTO myno_backtest_results VALUES ('s1', '2024-01-01 00:00:00', 1.5)"))
+        conn.execute(text(
+            "INSERT INTO myno_trade_details VALUES "
+            "('s1', '2024-01-01 00:01:00', 10.0), ('s1', '2024-01-01 00:02:00', -5.0)"
+        ))
+    monkeypatch.setattr(api, "_db_logger", SimpleNamespace(engine=engine))
+    monkeypatch.setattr(api, "_db_logger_ready", True)
+    monkeypatch.setattr(api, "_response_cache", {})
+    return engine
+
+
+@pytest.mark.parametrize("path", ["/api/results/latest", "/api/trades/s1"])
+def test_etag_revalidation(client, db, path):
+    """같은 ETag로 재요청하면 본문 없이 304"""
+    response = client.get(path)
+    etag = response.headers["ETag"]
+    
+    assert response.status_code == 200
+    assert response.get_json()
+    assert response.headers["Cache-Control"] == "no-cache"
+    
+    revalidated = client.get(path, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert revalidated.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("suffix", [":gzip", ":br"])
+def test_etag_revalidation_after_compression(client, db, suffix):
+    """압축 미들웨어가 붙인 ETag 접미사가 있어도 304"""
+    etag = client.get("/api/trades/s1").headers["ETag"].strip('"')
+    tagged = f'"{etag}{suffix}"'
+    
+    revalidated = client.get("/api/trades/s1", headers={"If-None-Match": tagged})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == tagged
+
+
+def test_trades_etag_changes_with_new_trade(client, db):
+    """거래가 추가되면 ETag가 바뀌어 전체 본문 전송"""
+    etag = client.get("/api/trades/s1").headers["ETag"]
+    with db.begin() as conn:
+        conn.execute(text("INSERT INTO myno_trade_details VALUES ('s1', '2024-01-01 00:03:00', 2.0)"))
+    
+    response = client.get("/api/trades/s1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.get_json()) == 3
+
+
+def test_trades_stream_aborts_on_db_error(db):
+    """스트리밍 중 DB 오류는 잘린 배열로 끝내지 않고 다시 발생"""
+    db_logger = SimpleNamespace(engine=db)
+    with db.begin() as conn:
+        conn.execute(text("DROP TABLE myno_trade_details"))
+    
+    chunks = api._stream_trades(db_logger, "s1")
+    assert next(chunks) == b"["
+    with pytest.raises(Exception):
+        list(chunks)
+
+
+@pytest.mark.parametrize("encoding, content_encoding", [("gzip", "gzip"), ("identity", None)])
+def test_index_revalidation(client, encoding, content_encoding):
+    """대시보드 페이지는 인코딩별 ETag로 304"""
+    response = client.get("/", headers={"Accept-Encoding": encoding})
+    etag = response.headers["ETag"]
+    
+    assert response.status_code == 200
+    assert response.headers.get("Content-Encoding") == content_encoding
+    
+    revalidated = client.get("/", headers={"Accept-Encoding": encoding, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+
+
+def test_status_stream_sends_results_event(client):
+    """결과 저장 완료 시 상태 스트림이 'results' 이벤트 전송"""
+    response = client.get("/api/status/stream", buffered=False)
+    events = iter(response.response)
+    try:
+        assert next(events).startswith(b"data: ")
+        
+        notify_results_saved("s1")
+        
+        assert next(events).startswith(b"data: ")
+        assert next(events) == b"event: results\ndata: {}\n\n"
+    finally:
+        response.close()
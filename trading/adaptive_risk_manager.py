@@ -1,12 +1,48 @@
 """적응형 리스크 관리자 - 시드에 따라 사람처럼 리스크를 관리"""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from utils.logger import get_logger
 import numpy as np
 
 logger = get_logger(__name__)
 
+# 시드 단계별 리스크 (사람처럼)
+_STAGE_NAMES = ("seedling", "growing", "mature", "prosperous")
+# 단계 경계 (현재 자산 / 초기 자산 비율): 10%, 50%, 100%
+_STAGE_EDGES = np.array([0.1, 0.5, 1.0])
+# 단계 테이블 열 순서
+_STAGE_FIELDS = ("max_risk_per_trade", "max_daily_risk", "min_confidence", "max_trades_per_day")
+_STAGE_TABLE = np.array([
+    [0.005, 0.01, 0.85, 3],   # seedling: 초기 단계 (시드의 10% 이하), 높은 신뢰도만
+    [0.01, 0.02, 0.75, 5],    # growing: 성장 단계 (시드의 10-50%)
+    [0.015, 0.03, 0.70, 8],   # mature: 성숙 단계 (시드의 50-100%)
+    [0.02, 0.05, 0.65, 10],   # prosperous: 번영 단계 (시드의 100% 이상)
+], dtype=np.float64)
+
+
+def _stage_config(stage_id: int) -> Dict[str, Any]:
+    """단계 테이블 행을 설정 딕셔너리로 변환"""
+    config = dict(zip(_STAGE_FIELDS, _STAGE_TABLE[stage_id].tolist()))
+    config["max_trades_per_day"] = int(config["max_trades_per_day"])
+    return config
+
+
+# 시드 단계별 리스크 설정 (단계 이름 → 설정, 모듈 로드 시 한 번 생성하는 읽기 전용 뷰)
+_SEED_STAGES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    name: MappingProxyType(_stage_config(i)) for i, name in enumerate(_STAGE_NAMES)
+})
+
+# 리스크 거절 사유 메시지 템플릿 (current, limit) - 거절 시에만 포맷
+_REASON_FMT = {
+    "max_risk_per_trade": "거래당 리스크 초과: {:.2%} > {:.2%}",
+    "max_daily_risk": "일일 리스크 초과: {:.2%} > {:.2%}",
+    "min_confidence": "신뢰도 부족: {:.1%} < {:.1%}",
+    "max_trades_per_day": "일일 거래 수 초과: {} >= {}",
+    "consecutive_losses": "연속 손실로 인한 거래 중단: {}회",
+}
+
 
 class AdaptiveRiskManager:
     """적응형 리스크 관리자 - 시드 기반 동적 리스크 조정"""
@@ -26,36 +62,9 @@ class AdaptiveRiskManager:
         self.current_equity = self.initial_capital
         self.peak_equity = self.initial_capital
         
-        # 시드 단계별 리스크 (사람처럼)
-        self.seed_stages = {
-            "seedling": {  # 초기 단계 (시드의 10% 이하)
-                "max_risk_per_trade": 0.005,  # 0.5%
-                "max_daily_risk": 0.01,  # 1%
-                "min_confidence": 0.85,  # 높은 신뢰도만
-                "max_trades_per_day": 3,
-            },
-            "growing": {  # 성장 단계 (시드의 10-50%)
-                "max_risk_per_trade": 0.01,  # 1%
-                "max_daily_risk": 0.02,  # 2%
-                "min_confidence": 0.75,
-                "max_trades_per_day": 5,
-            },
-            "mature": {  # 성숙 단계 (시드의 50-100%)
-                "max_risk_per_trade": 0.015,  # 1.5%
-                "max_daily_risk": 0.03,  # 3%
-                "min_confidence": 0.70,
-                "max_trades_per_day": 8,
-            },
-            "prosperous": {  # 번영 단계 (시드의 100% 이상)
-                "max_risk_per_trade": 0.02,  # 2%
-                "max_daily_risk": 0.05,  # 5%
-                "min_confidence": 0.65,
-                "max_trades_per_day": 10,
-            },
-        }
-        
-        # 현재 시드 단계
-        self.current_stage = "seedling"
+        # 현재 시드 단계 (행 인덱스: 0=seedling ... 3=prosperous)
+        self.current_stage_id = 0
+        self._apply_stage_config(self.current_stage_id)
         
         # 일일 통계
         self.daily_risk_used = 0.0
@@ -84,38 +93,49 @@ class AdaptiveRiskManager:
         
         # 시드 단계 결정 (현재 자산 / 초기 자산 비율)
         equity_ratio = equity / self.initial_capital
+        new_stage_id = int(np.searchsorted(_STAGE_EDGES, equity_ratio, side="right"))
         
-        if equity_ratio < 0.1:
-            new_stage = "seedling"
-        elif equity_ratio < 0.5:
-            new_stage = "growing"
-        elif equity_ratio < 1.0:
-            new_stage = "mature"
-        else:
-            new_stage = "prosperous"
-        
-        if new_stage != self.current_stage:
-            logger.info(f"시드 단계 변경: {self.current_stage} → {new_stage} (자산 비율: {equity_ratio:.1%})")
-            self.current_stage = new_stage
+        if new_stage_id != self.current_stage_id:
+            logger.info(f"시드 단계 변경: {self.current_stage} → {_STAGE_NAMES[new_stage_id]} (자산 비율: {equity_ratio:.1%})")
+            self.current_stage_id = new_stage_id
+            self._apply_stage_config(new_stage_id)
     
-    def get_current_stage_config(self) -> Dict[str, Any]:
-        """현재 시드 단계의 설정 반환"""
-        return self.seed_stages[self.current_stage]
+    @property
+    def current_stage(self) -> str:
+        """현재 시드 단계 이름"""
+        return _STAGE_NAMES[self.current_stage_id]
     
-    def can_take_risk(
+    @property
+    def seed_stages(self) -> Mapping[str, Mapping[str, Any]]:
+        """시드 단계별 리스크 설정 (단계 이름 → 설정, 읽기 전용)"""
+        return _SEED_STAGES
+    
+    def _apply_stage_config(self, stage_id: int):
+        """단계 전환 시 자주 읽는 단계 설정값을 속성으로 캐싱"""
+        row = _STAGE_TABLE[stage_id]
+        self._max_risk_per_trade = float(row[0])
+        self._max_daily_risk = float(row[1])
+        self._min_confidence = float(row[2])
+        self._max_trades_per_day = int(row[3])
+    
+    def get_current_stage_config(self) -> Mapping[str, Any]:
+        """현재 시드 단계의 설정 반환 (읽기 전용)"""
+        return _SEED_STAGES[self.current_stage]
+    
+    def can_take_risk_fast(
         self,
         risk_amount: float,
         confidence: float,
     ) -> tuple[bool, str, Dict[str, Any]]:
         """
-        리스크를 감수할 수 있는지 확인
+        리스크를 감수할 수 있는지 확인 (사유 문자열 생성 없이)
         
         Args:
             risk_amount: 리스크 금액
             confidence: 거래 신뢰도
             
         Returns:
-            (가능 여부, 이유, 상세 정보)
+            (가능 여부, 사유 코드, 상세 정보)
         """
         # 일일 리셋
         today = datetime.now().date()
@@ -124,66 +144,92 @@ class AdaptiveRiskManager:
             self.daily_trades = 0
             self.current_date = today
         
-        stage_config = self.get_current_stage_config()
-        
         # 리스크 비율 계산
         risk_ratio = risk_amount / self.current_equity if self.current_equity > 0 else 0.0
         
         # 1. 거래당 최대 리스크 확인
-        if risk_ratio > stage_config["max_risk_per_trade"]:
-            return False, f"거래당 리스크 초과: {risk_ratio:.2%} > {stage_config['max_risk_per_trade']:.2%}", {
+        if risk_ratio > self._max_risk_per_trade:
+            return False, "max_risk_per_trade", {
                 "reason": "max_risk_per_trade",
                 "current": risk_ratio,
-                "limit": stage_config["max_risk_per_trade"],
+                "limit": self._max_risk_per_trade,
             }
         
         # 2. 일일 최대 리스크 확인
         daily_risk_ratio = (self.daily_risk_used + risk_amount) / self.current_equity
-        if daily_risk_ratio > stage_config["max_daily_risk"]:
-            return False, f"일일 리스크 초과: {daily_risk_ratio:.2%} > {stage_config['max_daily_risk']:.2%}", {
+        if daily_risk_ratio > self._max_daily_risk:
+            return False, "max_daily_risk", {
                 "reason": "max_daily_risk",
                 "current": daily_risk_ratio,
-                "limit": stage_config["max_daily_risk"],
+                "limit": self._max_daily_risk,
             }
         
         # 3. 신뢰도 확인
-        if confidence < stage_config["min_confidence"]:
-            return False, f"신뢰도 부족: {confidence:.1%} < {stage_config['min_confidence']:.1%}", {
+        if confidence < self._min_confidence:
+            return False, "min_confidence", {
                 "reason": "min_confidence",
                 "current": confidence,
-                "limit": stage_config["min_confidence"],
+                "limit": self._min_confidence,
             }
         
         # 4. 일일 거래 수 확인
-        if self.daily_trades >= stage_config["max_trades_per_day"]:
-            return False, f"일일 거래 수 초과: {self.daily_trades} >= {stage_config['max_trades_per_day']}", {
+        if self.daily_trades >= self._max_trades_per_day:
+            return False, "max_trades_per_day", {
                 "reason": "max_trades_per_day",
                 "current": self.daily_trades,
-                "limit": stage_config["max_trades_per_day"],
+                "limit": self._max_trades_per_day,
             }
         
         # 5. 연속 손실 확인 (시드 단계에 따라)
-        if self.current_stage == "seedling" and self.consecutive_losses >= 2:
-            return False, f"연속 손실로 인한 거래 중단: {self.consecutive_losses}회", {
+        if self.current_stage_id == 0 and self.consecutive_losses >= 2:
+            return False, "consecutive_losses", {
                 "reason": "consecutive_losses",
                 "current": self.consecutive_losses,
                 "limit": 2,
             }
         elif self.consecutive_losses >= 3:
-            return False, f"연속 손실로 인한 거래 중단: {self.consecutive_losses}회", {
+            return False, "consecutive_losses", {
                 "reason": "consecutive_losses",
                 "current": self.consecutive_losses,
                 "limit": 3,
             }
         
         # 모든 조건 통과
-        return True, "OK", {
+        return True, "approved", {
             "reason": "approved",
             "risk_ratio": risk_ratio,
             "daily_risk_ratio": daily_risk_ratio,
             "confidence": confidence,
         }
     
+    def can_take_risk(
+        self,
+        risk_amount: float,
+        confidence: float,
+    ) -> tuple[bool, str, Dict[str, Any]]:
+        """
+        리스크를 감수할 수 있는지 확인 (기존 API 호환용 래퍼)
+        
+        거절 시 사유 문자열을 항상 포맷하므로, 반복 호출하는 경로에서는
+        can_take_risk_fast()를 쓰고 로그/UI 출력 시점에 format_risk_reason()을 호출.
+        
+        Args:
+            risk_amount: 리스크 금액
+            confidence: 거래 신뢰도
+            
+        Returns:
+            (가능 여부, 이유, 상세 정보)
+        """
+        allowed, reason_code, details = self.can_take_risk_fast(risk_amount, confidence)
+        if allowed:
+            return True, "OK", details
+        return False, self.format_risk_reason(details), details
+    
+    @staticmethod
+    def format_risk_reason(details: Dict[str, Any]) -> str:
+        """거절 상세 정보로부터 사유 문자열 생성"""
+        return _REASON_FMT[details["reason"]].format(details["current"], details["limit"])
+    
     def calculate_position_size(
         self,
         entry_price: float,
@@ -203,8 +249,6 @@ class AdaptiveRiskManager:
         Returns:
             포지션 사이즈 (수량)
         """
-        stage_config = self.get_current_stage_config()
-        
         # 손실 금액 계산
         if direction == "long":
             price_diff = abs(entry_price - stop_loss_price)
@@ -215,11 +259,11 @@ class AdaptiveRiskManager:
             return 0.0
         
         # 신뢰도에 따른 리스크 조정
-        confidence_multiplier = confidence / stage_config["min_confidence"]
+        confidence_multiplier = confidence / self._min_confidence
         confidence_multiplier = min(confidence_multiplier, 1.5)  # 최대 1.5배
         
         # 리스크 금액 계산
-        base_risk = stage_config["max_risk_per_trade"] * self.current_equity
+        base_risk = self._max_risk_per_trade * self.current_equity
         adjusted_risk = base_risk * confidence_multiplier
         
         # 포지션 사이즈
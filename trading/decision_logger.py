@@ -1,14 +1,107 @@
 """결정 로거 - 모든 거래 결정과 이유를 상세히 로깅"""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, IO
 from datetime import datetime
+from collections import deque
 from utils.logger import get_logger
+import atexit
 import json
+import os
+import queue
+import threading
 from pathlib import Path
 
 logger = get_logger(__name__)
 
 
+class _DecisionWriter:
+    """백그라운드 파일 기록기 - 거래 스레드에서 디스크 I/O 제거"""
+    
+    _STOP = object()
+    
+    def __init__(self):
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def put(self, filename: Path, line: str):
+        """기록할 줄을 큐에 추가 (최초 호출 시 또는 기록 스레드가 죽었으면 스레드 시작)"""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            with self._lock:
+                thread = self._thread
+                if thread is None or not thread.is_alive():
+                    self._thread = threading.Thread(target=self._drain, name="DecisionWriter", daemon=True)
+                    self._thread.start()
+        self._queue.put((filename, line))
+    
+    def close(self):
+        """대기 중인 기록을 모두 쓰고 기록 스레드 종료"""
+        with self._lock:
+            thread = self._thread
+            if thread is not None and thread.is_alive():
+                self._queue.put(self._STOP)
+                thread.join()
+            # 다음 put 호출 시 스레드를 다시 시작
+            self._thread = None
+            
+            # 종료 센티널 뒤에 들어온 기록은 기록 스레드가 읽지 않으므로 여기서 직접 기록
+            if not self._queue.empty():
+                self._queue.put(self._STOP)
+                self._drain()
+    
+    def _reset_after_fork(self):
+        """fork된 자식 프로세스에서 상태 초기화 (부모의 기록 스레드는 자식에 복제되지 않음)"""
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def _drain(self):
+        """큐 소비 루프 - 쌓인 항목을 한 번에 모아서 기록"""
+        current_path: Optional[Path] = None
+        handle: Optional[IO[str]] = None
+        running = True
+        
+        while running:
+            items = [self._queue.get()]
+            try:
+                while True:
+                    items.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            for item in items:
+                if item is self._STOP:
+                    running = False
+                    continue
+                filename, line = item
+                try:
+                    if filename != current_path:
+                        if handle is not None:
+                            handle.close()
+                        handle = open(filename, "a", encoding="utf-8")
+                        current_path = filename
+                    handle.write(line)
+                except Exception as e:
+                    logger.error(f"결정 로그 저장 실패: {e}")
+            
+            if handle is not None:
+                try:
+                    handle.flush()
+                except Exception as e:
+                    logger.error(f"결정 로그 저장 실패: {e}")
+        
+        if handle is not None:
+            handle.close()
+
+
+# 프로세스 공용 기록기 (DecisionLogger 인스턴스마다 스레드를 만들지 않음)
+_writer = _DecisionWriter()
+atexit.register(_writer.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_writer._reset_after_fork)
+
+
 class DecisionLogger:
     """결정 로거 - 거래 결정 상세 로깅"""
     
@@ -24,9 +117,9 @@ class DecisionLogger:
         self.output_path = Path(output_path)
         self.output_path.mkdir(parents=True, exist_ok=True)
         
-        # 결정 로그
-        self.decision_log: List[Dict[str, Any]] = []
+        # 결정 로그 (최근 max_memory_logs개만 유지)
         self.max_memory_logs = 1000
+        self.decision_log: deque = deque(maxlen=self.max_memory_logs)
         
         logger.info(f"결정 로거 초기화: {self.output_path}")
     
@@ -59,10 +152,6 @@ class DecisionLogger:
         
         self.decision_log.append(log_entry)
         
-        # 메모리 로그 관리
-        if len(self.decision_log) > self.max_memory_logs:
-            self.decision_log.pop(0)
-        
         # 파일에 저장
         self._save_to_file(log_entry)
         
@@ -107,17 +196,23 @@ class DecisionLogger:
         logger.info(f"  실제 결과: {'승리' if pnl > 0 else '손실'}")
     
     def _save_to_file(self, log_entry: Dict[str, Any]):
-        """파일에 저장"""
+        """파일에 저장 (직렬화만 하고 기록은 백그라운드 스레드에 위임)"""
         date_str = datetime.now().strftime("%Y%m%d")
         filename = self.output_path / f"decisions_{date_str}.jsonl"
         
         try:
-            with open(filename, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+            line = json.dumps(log_entry, ensure_ascii=False) + "\n"
         except Exception as e:
             logger.error(f"결정 로그 저장 실패: {e}")
+            return
+        
+        _writer.put(filename, line)
+    
+    def flush(self):
+        """대기 중인 결정 로그를 파일에 모두 기록"""
+        _writer.close()
     
     def get_recent_decisions(self, limit: int = 20) -> List[Dict[str, Any]]:
         """최근 결정 반환"""
-        return self.decision_log[-limit:] if self.decision_log else []
+        return list(self.decision_log)[-limit:] if self.decision_log else []
 
@@ -3,11 +3,61 @@
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from utils.logger import get_logger
-import numpy as np
+from utils.jit import njit
 from collections import defaultdict
 
 logger = get_logger(__name__)
 
+# should_enter 게이트 결과 코드
+ENTER_OK = 0
+ENTER_WIN_RATE_THRESHOLD = 1
+ENTER_PATTERN_WIN_RATE = 2
+ENTER_PATTERN_AVG_PNL = 3
+ENTER_RECENT_PERFORMANCE = 4
+
+# 조건별 성과를 추적할 이산 진입 조건
+_TRACKED_CONDITIONS = ("regime", "bb_position", "conf_bucket")
+
+
+def _confidence_bucket(confidence: float) -> str:
+    """신뢰도 구간 (high/mid/low)"""
+    if confidence >= 0.9:
+        return "high"
+    if confidence >= 0.75:
+        return "mid"
+    return "low"
+
+
+@njit("int64(float64, float64, int64, int64, float64, float64, float64, int64)", cache=True)
+def _should_enter_kernel(
+    predicted_win_rate: float,
+    threshold: float,
+    wins: int,
+    losses: int,
+    avg_pnl: float,
+    recent_win_rate: float,
+    recent_avg_pnl: float,
+    n_history: int,
+) -> int:
+    """진입 게이트 수치 커널 - 결과 코드(ENTER_*) 반환 (모듈 전역 정수는 numba가 상수로 고정)"""
+    # 1. 최소 승률 임계값 확인
+    if predicted_win_rate < threshold:
+        return ENTER_WIN_RATE_THRESHOLD
+    
+    # 2. 패턴 성과 확인 (충분한 데이터가 있을 때)
+    total_trades = wins + losses
+    if total_trades >= 5:
+        if wins / total_trades < threshold:
+            return ENTER_PATTERN_WIN_RATE
+        if avg_pnl < 0:
+            return ENTER_PATTERN_AVG_PNL
+    
+    # 3. 최근 성과 확인 (너무 나쁘면 거래 중단)
+    if n_history >= 20 and recent_win_rate < 0.30 and recent_avg_pnl < 0:
+        return ENTER_RECENT_PERFORMANCE
+    
+    return ENTER_OK
+
 
 class ExperienceLearner:
     """경험 학습자 - 승률이 높을 때만 배팅하도록 진화"""
@@ -33,8 +83,8 @@ class ExperienceLearner:
             "avg_pnl": 0.0,
         })
         
-        # 진입 조건별 성과
-        self.condition_performance: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+        # 진입 조건별 성과 ((조건 이름, 값) → 통계)
+        self.condition_performance: Dict[tuple, Dict[str, Any]] = defaultdict(lambda: {
             "wins": 0,
             "losses": 0,
             "total_pnl": 0.0,
@@ -50,6 +100,9 @@ class ExperienceLearner:
         self.recent_win_rate = 0.0
         self.recent_avg_pnl = 0.0
         
+        # 예상 승률 캐시 (패턴 키 → 승률, 거래 기록 시 무효화)
+        self._win_rate_cache: Dict[Optional[str], float] = {}
+        
         logger.info("경험 학습자 초기화 완료")
         logger.info(f"초기 최소 승률: {self.min_win_rate_threshold:.1%}")
         logger.info(f"목표 승률: {self.target_win_rate:.1%}")
@@ -70,6 +123,9 @@ class ExperienceLearner:
         """
         is_win = trade_result.get("pnl", 0.0) > 0
         
+        # 통계가 바뀌므로 예상 승률 캐시 무효화
+        self._win_rate_cache.clear()
+        
         # 거래 이력 추가
         trade_record = {
             "timestamp": datetime.now(),
@@ -97,15 +153,22 @@ class ExperienceLearner:
             pattern_stats["total_pnl"] += trade_result.get("pnl", 0.0)
             pattern_stats["avg_pnl"] = pattern_stats["total_pnl"] / (pattern_stats["wins"] + pattern_stats["losses"])
         
-        # 조건별 성과 분석
-        for condition_key, condition_value in entry_conditions.items():
-            if isinstance(condition_value, (int, float, str, bool)):
-                condition_stats = self.condition_performance[f"{condition_key}:{condition_value}"]
-                if is_win:
-                    condition_stats["wins"] += 1
-                else:
-                    condition_stats["losses"] += 1
-                condition_stats["total_pnl"] += trade_result.get("pnl", 0.0)
+        # 조건별 성과 분석 (이산 조건만 추적 - 연속값 키로 인한 무한 증가 방지)
+        pnl = trade_result.get("pnl", 0.0)
+        tracked_values = (
+            entry_conditions.get("regime"),
+            entry_conditions.get("bb_position"),
+            _confidence_bucket(entry_conditions.get("confidence", 0.0)),
+        )
+        for condition_key, condition_value in zip(_TRACKED_CONDITIONS, tracked_values):
+            if condition_value is None:
+                continue
+            condition_stats = self.condition_performance[(condition_key, condition_value)]
+            if is_win:
+                condition_stats["wins"] += 1
+            else:
+                condition_stats["losses"] += 1
+            condition_stats["total_pnl"] += pnl
         
         # 최근 성과 업데이트
         self._update_recent_performance()
@@ -122,13 +185,7 @@ class ExperienceLearner:
             key_parts.append(f"regime:{conditions['regime']}")
         
         # 신뢰도 구간
-        confidence = conditions.get("confidence", 0.0)
-        if confidence >= 0.9:
-            key_parts.append("conf:high")
-        elif confidence >= 0.75:
-            key_parts.append("conf:mid")
-        else:
-            key_parts.append("conf:low")
+        key_parts.append(f"conf:{_confidence_bucket(conditions.get('confidence', 0.0))}")
         
         # 볼린저 밴드 위치
         if "bb_position" in conditions:
@@ -178,52 +235,61 @@ class ExperienceLearner:
         Returns:
             (진입 가능 여부, 이유, 상세 정보)
         """
-        # 1. 최소 승률 임계값 확인
-        if predicted_win_rate < self.min_win_rate_threshold:
-            return False, f"예상 승률 부족: {predicted_win_rate:.1%} < {self.min_win_rate_threshold:.1%}", {
+        threshold = self.min_win_rate_threshold
+        
+        pattern_key = self._extract_pattern_key(entry_conditions)
+        pattern_stats = self.pattern_performance.get(pattern_key) if pattern_key else None
+        if pattern_stats is not None:
+            wins, losses, avg_pnl = pattern_stats["wins"], pattern_stats["losses"], pattern_stats["avg_pnl"]
+        else:
+            wins, losses, avg_pnl = 0, 0, 0.0
+        
+        code = _should_enter_kernel(
+            predicted_win_rate,
+            threshold,
+            wins,
+            losses,
+            avg_pnl,
+            self.recent_win_rate,
+            self.recent_avg_pnl,
+            len(self.trade_history),
+        )
+        
+        if code == ENTER_OK:
+            return True, "OK", {
+                "reason": "approved",
+                "predicted_win_rate": predicted_win_rate,
+                "threshold": threshold,
+            }
+        
+        # 거절 사유 문자열은 거절된 경우에만 생성
+        if code == ENTER_WIN_RATE_THRESHOLD:
+            return False, f"예상 승률 부족: {predicted_win_rate:.1%} < {threshold:.1%}", {
                 "reason": "win_rate_threshold",
                 "predicted": predicted_win_rate,
-                "threshold": self.min_win_rate_threshold,
+                "threshold": threshold,
             }
         
-        # 2. 패턴 성과 확인
-        pattern_key = self._extract_pattern_key(entry_conditions)
-        if pattern_key and pattern_key in self.pattern_performance:
-            pattern_stats = self.pattern_performance[pattern_key]
-            total_trades = pattern_stats["wins"] + pattern_stats["losses"]
-            
-            if total_trades >= 5:  # 충분한 데이터가 있을 때
-                pattern_win_rate = pattern_stats["wins"] / total_trades if total_trades > 0 else 0.0
-                
-                if pattern_win_rate < self.min_win_rate_threshold:
-                    return False, f"패턴 승률 부족: {pattern_win_rate:.1%} < {self.min_win_rate_threshold:.1%}", {
-                        "reason": "pattern_win_rate",
-                        "pattern": pattern_key,
-                        "win_rate": pattern_win_rate,
-                        "threshold": self.min_win_rate_threshold,
-                    }
-                
-                # 평균 손익 확인
-                if pattern_stats["avg_pnl"] < 0:
-                    return False, f"패턴 평균 손익 음수: {pattern_stats['avg_pnl']:.2f}", {
-                        "reason": "pattern_avg_pnl",
-                        "pattern": pattern_key,
-                        "avg_pnl": pattern_stats["avg_pnl"],
-                    }
+        if code == ENTER_PATTERN_WIN_RATE:
+            pattern_win_rate = wins / (wins + losses)
+            return False, f"패턴 승률 부족: {pattern_win_rate:.1%} < {threshold:.1%}", {
+                "reason": "pattern_win_rate",
+                "pattern": pattern_key,
+                "win_rate": pattern_win_rate,
+                "threshold": threshold,
+            }
+        
+        if code == ENTER_PATTERN_AVG_PNL:
+            return False, f"패턴 평균 손익 음수: {avg_pnl:.2f}", {
+                "reason": "pattern_avg_pnl",
+                "pattern": pattern_key,
+                "avg_pnl": avg_pnl,
+            }
         
-        # 3. 최근 성과 확인 (너무 나쁘면 거래 중단)
-        if len(self.trade_history) >= 20:
-            if self.recent_win_rate < 0.30 and self.recent_avg_pnl < 0:
-                return False, f"최근 성과 불량: 승률 {self.recent_win_rate:.1%}, 평균 손익 {self.recent_avg_pnl:.2f}", {
-                    "reason": "recent_performance",
-                    "win_rate": self.recent_win_rate,
-                    "avg_pnl": self.recent_avg_pnl,
-                }
-        
-        return True, "OK", {
-            "reason": "approved",
-            "predicted_win_rate": predicted_win_rate,
-            "threshold": self.min_win_rate_threshold,
+        return False, f"최근 성과 불량: 승률 {self.recent_win_rate:.1%}, 평균 손익 {self.recent_avg_pnl:.2f}", {
+            "reason": "recent_performance",
+            "win_rate": self.recent_win_rate,
+            "avg_pnl": self.recent_avg_pnl,
         }
     
     def predict_win_rate(self, entry_conditions: Dict[str, Any]) -> float:
@@ -242,15 +308,27 @@ class ExperienceLearner:
         
         pattern_key = self._extract_pattern_key(entry_conditions)
         
-        if pattern_key and pattern_key in self.pattern_performance:
-            pattern_stats = self.pattern_performance[pattern_key]
-            total_trades = pattern_stats["wins"] + pattern_stats["losses"]
+        # 같은 패턴은 다음 거래 기록 전까지 결과가 같으므로 캐시 사용
+        cached = self._win_rate_cache.get(pattern_key)
+        if cached is not None:
+            return cached
+        
+        win_rate = self._predict_pattern_win_rate(pattern_key)
+        self._win_rate_cache[pattern_key] = win_rate
+        return win_rate
+    
+    def _predict_pattern_win_rate(self, pattern_key: Optional[str]) -> float:
+        """패턴 통계로부터 예상 승률 계산"""
+        pattern_stats = self.pattern_performance.get(pattern_key) if pattern_key else None
+        
+        if pattern_stats is not None:
+            wins = pattern_stats["wins"]
+            total_trades = wins + pattern_stats["losses"]
             
             if total_trades >= 3:
-                win_rate = pattern_stats["wins"] / total_trades
-                # 신뢰도 가중 (거래 수가 많을수록 신뢰)
+                # 신뢰도 가중 (거래 수가 많을수록 신뢰): 0.50 쪽으로 수축
                 confidence_weight = min(total_trades / 20, 1.0)
-                return win_rate * confidence_weight + 0.50 * (1 - confidence_weight)
+                return wins / total_trades * confidence_weight + 0.50 * (1 - confidence_weight)
         
         # 패턴이 없으면 최근 전체 승률 사용
         return self.recent_win_rate if self.recent_win_rate > 0 else 0.50
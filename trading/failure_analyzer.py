@@ -1,13 +1,387 @@
 """실패 분석기 - 거래 실패 원인을 상세히 분석하고 기록"""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
+from collections import Counter, deque
+from dataclasses import dataclass
+from math import fabs
+import io
+import sys
 from utils.logger import get_logger
+from utils.jit import njit
 import pandas as pd
 import numpy as np
 
 logger = get_logger(__name__)
 
+# 트렌드 분류: 20바 가격 변화율(%) 경계와 라벨
+# (-2 이상/0.5 이하 경계는 포함 방향이 달라 하한/상한 경계를 나눠 탐색)
+_TREND_LOWER_EDGES = np.array([-2.0, -0.5])
+_TREND_UPPER_EDGES = np.array([0.5, 2.0])
+_TREND_LABELS = tuple(sys.intern(s) for s in ("strong_down", "down", "sideways", "up", "strong_up"))
+
+# 시장 이력이 없을 때의 시장 상황 기본값
+_EMPTY_MARKET_CONDITIONS = {
+    "entry_volatility": 0.0,
+    "exit_volatility": 0.0,
+    "volatility_change": 0.0,
+    "entry_volume": 0.0,
+    "exit_volume": 0.0,
+    "volume_change": 0.0,
+    "trend_direction": "unknown",
+    "trend_reversal": False,
+}
+
+# 일지 구분선
+_BAR = "=" * 60
+
+# 실패 원인(issue) / 실수(mistake) 메시지 템플릿
+_TPL_ENTRY_VOLUME_LOW = "진입 시 거래량 부족: 평균의 {ratio:.1%}"
+_MSG_ENTRY_VOLUME_LOW = "거래량이 평균의 50% 미만인데 진입함 - 유동성 부족으로 불리한 가격 체결 가능"
+_TPL_ENTRY_VOLUME_LIGHT = "진입 시 거래량 낮음: 평균의 {ratio:.1%}"
+_TPL_EXIT_VOLUME_SPIKE = "청산 시 거래량 급증: {exit_ratio:.1%} (진입 시: {entry_ratio:.1%})"
+_MSG_EXIT_VOLUME_SPIKE = "청산 시점에 거래량이 급증했는데 이미 손실 포지션 - 반대 방향으로 강한 움직임 신호를 놓침"
+_TPL_VOLUME_SURGE = "거래량 급등: {surge:.1%} 증가"
+_MSG_VOLUME_SURGE = "거래량이 급등했는데 손실 포지션 유지 - 시장이 반대 방향으로 강하게 움직임을 놓침"
+_TPL_AVERAGING_DOWN = "물타기로 인한 대규모 손실: {pnl:.2f} (손실률 {loss_pct:.1f}%)"
+_MSG_AVERAGING_DOWN = "손실 포지션에 물타기를 해서 손실 확대"
+_TPL_AVERAGING_LOSS = "손실률 {loss_pct:.1f}%까지 방치 - 조기 손절 필요했음"
+_MSG_RISK_RULE_VIOLATION = "리스크 관리 원칙 위반"
+_TPL_LONG_HOLD = "장기 보유: {hours:.1f}시간"
+_TPL_LONG_HOLD_MISTAKE = "{hours:.1f}시간 동안 손실 포지션 보유 - 조기 청산 필요했음"
+_TPL_EARLY_EXIT = "조기 청산: {hours:.1f}시간"
+_MSG_EARLY_EXIT = "너무 빨리 청산 - 노이즈에 반응했을 가능성"
+_TPL_BAD_ENTRY_TIMING = "나쁜 진입 타이밍: 진입 직후 {move:.1f}% 하락"
+_MSG_BAD_ENTRY_TIMING = "진입 직후 가격이 불리하게 움직임 - 진입 신호가 약했거나 노이즈에 반응"
+_TPL_STOP_TOO_FAR = "스탑로스 너무 멀리: {distance:.1f}%"
+_TPL_STOP_TOO_FAR_MISTAKE = "스탑로스가 {distance:.1f}%나 멀어서 손실 확대"
+_TPL_STOP_VIOLATED = "스탑로스 미준수: 설정 {distance:.1f}%, 실제 {actual:.1f}%"
+_MSG_STOP_VIOLATED = "스탑로스를 설정했지만 더 큰 손실로 청산 - 슬리피지나 갭 발생"
+_TPL_POSITION_OVERSIZED = "과도한 포지션: 자산의 {ratio:.1%}"
+_TPL_POSITION_OVERSIZED_MISTAKE = "포지션이 자산의 {ratio:.1%}로 너무 큼 - 리스크 과다"
+_TPL_REGIME_CHANGE = "레짐 전환: {entry} → {exit}"
+_TPL_REGIME_CHANGE_MISTAKE = "진입 시 {entry} 레짐이었지만 {exit}로 전환됨"
+_MSG_REGIME_MISSED = "레짐 전환 신호를 놓치고 포지션 유지"
+_MSG_REGIME_EXIT = "레짐 전환 시 즉시 청산해야 함"
+
+
+def _classify_trend(price_change: float) -> str:
+    """가격 변화율(%)을 트렌드 라벨로 분류"""
+    if price_change != price_change:  # NaN
+        return "sideways"
+    idx = (
+        np.searchsorted(_TREND_LOWER_EDGES, price_change, side="right")
+        + np.searchsorted(_TREND_UPPER_EDGES, price_change, side="left")
+    )
+    return _TREND_LABELS[idx]
+
+
+# 수치 커널 결과 플래그 (비트마스크)
+_F_ENTRY_VOLUME_LOW = 1 << 0      # 진입 거래량 평균의 50% 미만
+_F_ENTRY_VOLUME_LIGHT = 1 << 1    # 진입 거래량 평균의 70% 미만
+_F_EXIT_VOLUME_SPIKE = 1 << 2     # 청산 시 거래량 급증
+_F_VOLUME_SURGE = 1 << 3          # 진입 대비 거래량 2배 이상 증가
+_F_AVERAGING_DOWN = 1 << 4        # 물타기 추정
+_F_STOP_TOO_FAR = 1 << 5          # 스탑로스 5% 초과
+_F_STOP_VIOLATED = 1 << 6         # 스탑로스보다 큰 실제 손실
+_F_POSITION_OVERSIZED = 1 << 7    # 자산의 30% 초과 포지션
+
+# 진입 거래량 비율 구간 경계와 구간별 플래그
+_ENTRY_VOLUME_EDGES = np.array([0.5, 0.7, 1.0])
+_ENTRY_VOLUME_FLAGS = np.array([_F_ENTRY_VOLUME_LOW, _F_ENTRY_VOLUME_LIGHT, 0, 0], dtype=np.int64)
+_ENTRY_VOLUME_AVERAGE_BUCKET = 3  # 평균 이상 구간
+
+# 수치 커널 결과 값 인덱스
+_V_ENTRY_VOLATILITY = 0
+_V_EXIT_VOLATILITY = 1
+_V_VOLATILITY_CHANGE = 2
+_V_VOLUME_CHANGE = 3
+_V_ENTRY_VOLUME_RATIO = 4
+_V_EXIT_VOLUME_RATIO = 5
+_V_VOLUME_SURGE = 6
+_V_LOSS_PCT = 7
+_V_STOP_DISTANCE = 8
+_V_ACTUAL_LOSS = 9
+_V_POSITION_RATIO = 10
+_N_VALUES = 11
+
+# 배치 분석 결과 열 이름 (값 인덱스 순서 / 플래그 비트)
+_VALUE_COLUMNS = (
+    "entry_volatility",
+    "exit_volatility",
+    "volatility_change",
+    "volume_change",
+    "entry_volume_ratio",
+    "exit_volume_ratio",
+    "volume_surge",
+    "loss_pct",
+    "stop_distance",
+    "actual_loss",
+    "position_ratio",
+)
+_FLAG_COLUMNS = (
+    ("entry_volume_low", _F_ENTRY_VOLUME_LOW),
+    ("entry_volume_light", _F_ENTRY_VOLUME_LIGHT),
+    ("exit_volume_spike", _F_EXIT_VOLUME_SPIKE),
+    ("volume_surge_flag", _F_VOLUME_SURGE),
+    ("averaging_down", _F_AVERAGING_DOWN),
+    ("stop_too_far", _F_STOP_TOO_FAR),
+    ("stop_violated", _F_STOP_VIOLATED),
+    ("position_oversized", _F_POSITION_OVERSIZED),
+)
+
+
+@njit(
+    "Tuple((int64, float64[::1]))(" + ", ".join(["float64"] * 14) + ")",
+    cache=True,
+    error_model="numpy",
+)
+def _numeric_failure_kernel(
+    entry_price: float,
+    exit_price: float,
+    volatility_exit_price: float,
+    fill_price: float,
+    entry_atr: float,
+    exit_atr: float,
+    entry_volume: float,
+    exit_volume: float,
+    entry_volume_ma: float,
+    exit_volume_ma: float,
+    stop_loss: float,
+    position_size: float,
+    account_equity: float,
+    pnl: float,
+):
+    """실패 분석 수치 커널 - (플래그 비트마스크, 비율 값 배열) 반환"""
+    flags = 0
+    values = np.zeros(_N_VALUES, dtype=np.float64)
+    
+    # 변동성 / 거래량 변화 (청산가가 없으면 청산 변동성 0 - 진입가로 대체하지 않음)
+    if entry_price > 0:
+        values[_V_ENTRY_VOLATILITY] = (entry_atr / entry_price) * 100
+    if volatility_exit_price > 0:
+        values[_V_EXIT_VOLATILITY] = (exit_atr / volatility_exit_price) * 100
+    values[_V_VOLATILITY_CHANGE] = values[_V_EXIT_VOLATILITY] - values[_V_ENTRY_VOLATILITY]
+    if entry_volume > 0:
+        values[_V_VOLUME_CHANGE] = ((exit_volume - entry_volume) / entry_volume) * 100
+    
+    # 진입 시 거래량 부족 (구간: <50%, <70%, <100%, 그 이상)
+    if entry_volume_ma > 0:
+        entry_volume_ratio = entry_volume / entry_volume_ma
+        values[_V_ENTRY_VOLUME_RATIO] = entry_volume_ratio
+        bucket = np.searchsorted(_ENTRY_VOLUME_EDGES, entry_volume_ratio, side="right")
+        flags |= _ENTRY_VOLUME_FLAGS[bucket]
+        
+        # 청산 시 거래량 급증 (반대 신호) - 진입 거래량이 평균 미만이었던 경우
+        if exit_volume_ma > 0:
+            exit_volume_ratio = exit_volume / exit_volume_ma
+            values[_V_EXIT_VOLUME_RATIO] = exit_volume_ratio
+            if exit_volume_ratio > 1.5 and bucket < _ENTRY_VOLUME_AVERAGE_BUCKET:
+                flags |= _F_EXIT_VOLUME_SPIKE
+    
+    # 거래량 급등 후 손실
+    if exit_volume > 0 and entry_volume > 0:
+        volume_surge = (exit_volume - entry_volume) / entry_volume
+        values[_V_VOLUME_SURGE] = volume_surge
+        if volume_surge > 2.0:
+            flags |= _F_VOLUME_SURGE
+    
+    # 진입가 대비 % 환산용 역수 (나눗셈 대신 곱셈)
+    inv_ep_pct = 100.0 / entry_price if entry_price > 0 else 0.0
+    
+    # 물타기: 큰 손실 + 큰 포지션 + 5% 이상 손실률
+    if pnl < -100 and position_size > 1.0 and entry_price > 0:
+        loss_pct = fabs(fill_price - entry_price) * inv_ep_pct
+        values[_V_LOSS_PCT] = loss_pct
+        if loss_pct > 5.0:
+            flags |= _F_AVERAGING_DOWN
+    
+    # 스탑로스 설정 문제
+    if entry_price > 0 and stop_loss != entry_price:
+        stop_distance = fabs(entry_price - stop_loss) * inv_ep_pct
+        values[_V_STOP_DISTANCE] = stop_distance
+        if stop_distance > 5.0:
+            flags |= _F_STOP_TOO_FAR
+        
+        actual_loss = fabs(entry_price - exit_price) * inv_ep_pct
+        values[_V_ACTUAL_LOSS] = actual_loss
+        if actual_loss > stop_distance * 1.2:
+            flags |= _F_STOP_VIOLATED
+    
+    # 포지션 사이즈 문제
+    if account_equity > 0:
+        position_ratio = (position_size * entry_price) / account_equity
+        values[_V_POSITION_RATIO] = position_ratio
+        if position_ratio > 0.3:
+            flags |= _F_POSITION_OVERSIZED
+    
+    return flags, values
+
+
+def _numeric_failure_batch(
+    entry_price: np.ndarray,
+    exit_price: np.ndarray,
+    volatility_exit_price: np.ndarray,
+    fill_price: np.ndarray,
+    entry_atr: np.ndarray,
+    exit_atr: np.ndarray,
+    entry_volume: np.ndarray,
+    exit_volume: np.ndarray,
+    entry_volume_ma: np.ndarray,
+    exit_volume_ma: np.ndarray,
+    stop_loss: np.ndarray,
+    position_size: np.ndarray,
+    account_equity: np.ndarray,
+    pnl: np.ndarray,
+):
+    """_numeric_failure_kernel의 벡터화 버전 - 거래 배열 전체를 한 번에 계산"""
+    n = len(entry_price)
+    flags = np.zeros(n, dtype=np.int64)
+    values = np.zeros((n, _N_VALUES), dtype=np.float64)
+    
+    def _div(num, den, mask):
+        # 마스크 밖 분모를 1.0으로 대체한 분기 없는 나눗셈 (결과는 0)
+        return np.where(mask, num / np.where(mask, den, 1.0), 0.0)
+    
+    ep_ok = entry_price > 0.0
+    safe_ep = np.where(ep_ok, entry_price, 1.0)
+    
+    # 변동성 / 거래량 변화
+    values[:, _V_ENTRY_VOLATILITY] = np.where(ep_ok, entry_atr / safe_ep * 100.0, 0.0)
+    values[:, _V_EXIT_VOLATILITY] = _div(exit_atr, volatility_exit_price, volatility_exit_price > 0) * 100
+    values[:, _V_VOLATILITY_CHANGE] = values[:, _V_EXIT_VOLATILITY] - values[:, _V_ENTRY_VOLATILITY]
+    values[:, _V_VOLUME_CHANGE] = _div(exit_volume - entry_volume, entry_volume, entry_volume > 0) * 100
+    
+    # 진입 시 거래량 부족 / 청산 시 거래량 급증
+    entry_ma_ok = entry_volume_ma > 0
+    entry_volume_ratio = _div(entry_volume, entry_volume_ma, entry_ma_ok)
+    values[:, _V_ENTRY_VOLUME_RATIO] = entry_volume_ratio
+    bucket = np.searchsorted(_ENTRY_VOLUME_EDGES, entry_volume_ratio, side="right")
+    flags |= np.where(entry_ma_ok, _ENTRY_VOLUME_FLAGS[bucket], 0)
+    
+    exit_ma_ok = entry_ma_ok & (exit_volume_ma > 0)
+    exit_volume_ratio = _div(exit_volume, exit_volume_ma, exit_ma_ok)
+    values[:, _V_EXIT_VOLUME_RATIO] = exit_volume_ratio
+    flags |= np.where(
+        exit_ma_ok & (exit_volume_ratio > 1.5) & (bucket < _ENTRY_VOLUME_AVERAGE_BUCKET),
+        _F_EXIT_VOLUME_SPIKE,
+        0,
+    )
+    
+    # 거래량 급등 후 손실
+    surge_ok = (exit_volume > 0) & (entry_volume > 0)
+    volume_surge = _div(exit_volume - entry_volume, entry_volume, surge_ok)
+    values[:, _V_VOLUME_SURGE] = volume_surge
+    flags |= np.where(surge_ok & (volume_surge > 2.0), _F_VOLUME_SURGE, 0)
+    
+    inv_ep_pct = np.where(ep_ok, 100.0 / safe_ep, 0.0)
+    
+    # 물타기
+    averaging_ok = (pnl < -100) & (position_size > 1.0) & ep_ok
+    loss_pct = np.where(averaging_ok, np.abs(fill_price - entry_price) * inv_ep_pct, 0.0)
+    values[:, _V_LOSS_PCT] = loss_pct
+    flags |= np.where(averaging_ok & (loss_pct > 5.0), _F_AVERAGING_DOWN, 0)
+    
+    # 스탑로스 설정 문제
+    stop_ok = ep_ok & (stop_loss != entry_price)
+    stop_distance = np.where(stop_ok, np.abs(entry_price - stop_loss) * inv_ep_pct, 0.0)
+    actual_loss = np.where(stop_ok, np.abs(entry_price - exit_price) * inv_ep_pct, 0.0)
+    values[:, _V_STOP_DISTANCE] = stop_distance
+    values[:, _V_ACTUAL_LOSS] = actual_loss
+    flags |= np.where(stop_ok & (stop_distance > 5.0), _F_STOP_TOO_FAR, 0)
+    flags |= np.where(stop_ok & (actual_loss > stop_distance * 1.2), _F_STOP_VIOLATED, 0)
+    
+    # 포지션 사이즈 문제
+    equity_ok = account_equity > 0
+    position_ratio = _div(position_size * entry_price, account_equity, equity_ok)
+    values[:, _V_POSITION_RATIO] = position_ratio
+    flags |= np.where(equity_ok & (position_ratio > 0.3), _F_POSITION_OVERSIZED, 0)
+    
+    return flags, values
+
+
+def _batch_column(df: pd.DataFrame, name: str, default) -> np.ndarray:
+    """배치 입력 열을 float 배열로 변환 (누락 열/NaN은 기본값)"""
+    if name not in df.columns:
+        return np.broadcast_to(np.asarray(default, dtype=np.float64), (len(df),)).copy()
+    values = df[name].to_numpy(dtype=np.float64)
+    return np.where(np.isnan(values), default, values)
+
+
+def _as_float(value: Any, default: float) -> float:
+    """None/누락 값을 기본값으로 대체해 float 변환"""
+    return float(default if value is None else value)
+
+
+def _as_timestamp(value: Any) -> pd.Timestamp:
+    """이미 Timestamp면 그대로, 아니면 한 번만 파싱"""
+    return value if isinstance(value, pd.Timestamp) else pd.Timestamp(value)
+
+
+@dataclass
+class _TradeContext:
+    """실패 분석용 거래 스냅샷 - 딕셔너리 값을 한 번만 읽어 평탄화"""
+    pnl: float
+    entry_price: float
+    exit_price: float  # 손실 계산용 (없으면 진입가)
+    volatility_exit_price: float  # 청산 변동성 계산용 (없으면 0)
+    fill_price: float
+    stop_loss: float
+    position_size: float
+    account_equity: float
+    entry_atr: float
+    exit_atr: float
+    entry_volume: float
+    exit_volume: float
+    entry_volume_ma: float
+    exit_volume_ma: float
+    exit_pnl: float
+    entry_regime: str
+    exit_regime: str
+    entry_time: Any
+    exit_time: Any
+    entry_ts: pd.Timestamp
+    exit_ts: pd.Timestamp
+    
+    @classmethod
+    def from_trade(
+        cls,
+        trade_result: Dict[str, Any],
+        entry_data: Dict[str, Any],
+        exit_data: Dict[str, Any],
+    ) -> "_TradeContext":
+        """거래 결과/진입/청산 데이터로부터 생성"""
+        entry_price = _as_float(entry_data.get("price"), 0.0)
+        exit_price = exit_data.get("price")
+        entry_volume = _as_float(entry_data.get("volume"), 0.0)
+        exit_volume = _as_float(exit_data.get("volume"), 0.0)
+        entry_time = entry_data.get("timestamp")
+        exit_time = exit_data.get("timestamp")
+        
+        return cls(
+            pnl=_as_float(trade_result.get("pnl"), 0.0),
+            entry_price=entry_price,
+            exit_price=_as_float(exit_price, entry_price),
+            volatility_exit_price=_as_float(exit_price, 0.0),
+            fill_price=_as_float(trade_result.get("exit_price"), entry_price),
+            stop_loss=_as_float(entry_data.get("stop_loss"), entry_price),
+            position_size=_as_float(trade_result.get("position_size"), 0.0),
+            account_equity=_as_float(trade_result.get("account_equity"), 100000),
+            entry_atr=_as_float(entry_data.get("atr"), 0.0),
+            exit_atr=_as_float(exit_data.get("atr"), 0.0),
+            entry_volume=entry_volume,
+            exit_volume=exit_volume,
+            entry_volume_ma=_as_float(entry_data.get("volume_ma"), entry_volume),
+            exit_volume_ma=_as_float(exit_data.get("volume_ma"), exit_volume),
+            exit_pnl=_as_float(exit_data.get("pnl"), 0.0),
+            entry_regime=entry_data.get("regime", "unknown"),
+            exit_regime=exit_data.get("regime", "unknown"),
+            entry_time=entry_time,
+            exit_time=exit_time,
+            entry_ts=_as_timestamp(entry_time),
+            exit_ts=_as_timestamp(exit_time),
+        )
+
 
 class FailureAnalyzer:
     """실패 분석기 - 왜 틀렸는지 상세 분석"""
@@ -22,8 +396,11 @@ class FailureAnalyzer:
         self.config = config
         
         # 실패 패턴 데이터베이스
-        self.failure_patterns: List[Dict[str, Any]] = []
         self.max_patterns = 500
+        self.failure_patterns: deque = deque(maxlen=self.max_patterns)
+        
+        # 레짐 전환 메시지 캐시 ((진입 레짐, 청산 레짐) → (사유, 실수))
+        self._regime_msg_cache: Dict[tuple, tuple] = {}
         
         logger.info("실패 분석기 초기화 완료")
     
@@ -46,179 +423,217 @@ class FailureAnalyzer:
         Returns:
             실패 분석 결과
         """
-        if trade_result.get("pnl", 0.0) >= 0:
+        pnl = trade_result.get("pnl", 0.0)
+        if pnl >= 0:
             # 수익 거래는 분석하지 않음
             return {}
         
+        # 딕셔너리 값은 여기서 한 번만 읽고 이후 분석은 평탄화된 컨텍스트 사용
+        ctx = _TradeContext.from_trade(trade_result, entry_data, exit_data)
+        
         analysis = {
             "timestamp": datetime.now().isoformat(),
             "trade_id": trade_result.get("trade_id", "unknown"),
-            "pnl": trade_result.get("pnl", 0.0),
-            "entry_time": entry_data.get("timestamp"),
-            "exit_time": exit_data.get("timestamp"),
+            "pnl": pnl,
+            "entry_time": ctx.entry_time,
+            "exit_time": ctx.exit_time,
             "failure_reasons": [],
             "market_conditions": {},
             "decision_mistakes": [],
             "risk_mistakes": [],
             "timing_mistakes": [],
-            "detailed_journal": "",
         }
         
-        # 1. 시장 상황 분석
-        market_analysis = self._analyze_market_conditions(
-            entry_data, exit_data, market_history
+        # 수치 계산은 커널에서 한 번에 처리하고, 문자열은 발생한 플래그에 대해서만 생성
+        flags, values = _numeric_failure_kernel(
+            ctx.entry_price,
+            ctx.exit_price,
+            ctx.volatility_exit_price,
+            ctx.fill_price,
+            ctx.entry_atr,
+            ctx.exit_atr,
+            ctx.entry_volume,
+            ctx.exit_volume,
+            ctx.entry_volume_ma,
+            ctx.exit_volume_ma,
+            ctx.stop_loss,
+            ctx.position_size,
+            ctx.account_equity,
+            ctx.pnl,
+        )
+        
+        # 시장 이력이 없으면 이력 기반 분석을 건너뜀 (시작 직후/저유동성 상황)
+        has_history = not market_history.empty
+        closes = (
+            market_history["close"].to_numpy()
+            if has_history and "close" in market_history.columns
+            else None
         )
+        
+        # 1. 시장 상황 분석
+        if has_history:
+            market_analysis = self._analyze_market_conditions(
+                ctx, market_history, closes, values
+            )
+        else:
+            market_analysis = dict(_EMPTY_MARKET_CONDITIONS)
         analysis["market_conditions"] = market_analysis
         
         # 2. 거래량 분석
-        volume_analysis = self._analyze_volume_pattern(
-            entry_data, exit_data, market_history
-        )
+        volume_analysis = self._analyze_volume_pattern(flags, values)
         if volume_analysis.get("issues"):
             analysis["failure_reasons"].extend(volume_analysis["issues"])
             analysis["decision_mistakes"].extend(volume_analysis.get("mistakes", []))
         
         # 3. 물타기 분석
-        averaging_analysis = self._analyze_averaging_down(
-            trade_result, entry_data, market_history
-        )
+        averaging_analysis = self._analyze_averaging_down(ctx, flags, values)
         if averaging_analysis.get("detected"):
             analysis["failure_reasons"].append(averaging_analysis["reason"])
             analysis["risk_mistakes"].extend(averaging_analysis.get("mistakes", []))
         
         # 4. 타이밍 분석
-        timing_analysis = self._analyze_timing(
-            entry_data, exit_data, market_history
-        )
+        timing_analysis = self._analyze_timing(ctx, market_history, closes)
         if timing_analysis.get("issues"):
             analysis["failure_reasons"].extend(timing_analysis["issues"])
             analysis["timing_mistakes"].extend(timing_analysis.get("mistakes", []))
         
         # 5. 리스크 관리 분석
-        risk_analysis = self._analyze_risk_management(
-            trade_result, entry_data, exit_data
-        )
+        risk_analysis = self._analyze_risk_management(flags, values)
         if risk_analysis.get("issues"):
             analysis["failure_reasons"].extend(risk_analysis["issues"])
             analysis["risk_mistakes"].extend(risk_analysis.get("mistakes", []))
         
         # 6. 레짐 전환 분석
-        regime_analysis = self._analyze_regime_change(
-            entry_data, exit_data, market_history
-        )
+        regime_analysis = self._analyze_regime_change(ctx)
         if regime_analysis.get("detected"):
             analysis["failure_reasons"].append(regime_analysis["reason"])
             analysis["decision_mistakes"].extend(regime_analysis.get("mistakes", []))
         
-        # 7. 상세 일지 생성
-        analysis["detailed_journal"] = self._generate_detailed_journal(analysis)
+        # 패턴 저장 (일지 문자열은 저장하지 않고 get_journal에서 필요 시 생성)
+        self.failure_patterns.append(dict(analysis))
         
-        # 패턴 저장
-        self.failure_patterns.append(analysis)
-        if len(self.failure_patterns) > self.max_patterns:
-            self.failure_patterns.pop(0)
+        # 7. 상세 일지 생성 (호출자에게 반환하는 결과에만 포함)
+        analysis["detailed_journal"] = self._generate_detailed_journal(analysis)
         
         return analysis
     
+    def analyze_many(
+        self,
+        trades_df: pd.DataFrame,
+        histories: Optional[Dict[Any, pd.DataFrame]] = None,
+    ) -> pd.DataFrame:
+        """
+        손실 거래 일괄 수치 분석 (백테스트 사후 분석용)
+        
+        거래당 딕셔너리/일지를 만들지 않고 변동성, 거래량, 리스크 관리 지표와
+        실패 플래그를 배열 연산으로 한 번에 계산한다. 상세 결과가 필요한 거래만
+        analyze_trade_failure로 다시 분석하면 된다.
+        
+        Args:
+            trades_df: 거래 데이터프레임 (pnl, entry_price, exit_price, fill_price,
+                stop_loss, position_size, account_equity, entry_atr, exit_atr,
+                entry_volume, exit_volume, entry_volume_ma, exit_volume_ma 열)
+            histories: 거래 인덱스 → 시장 이력 (트렌드 분석용, 선택)
+            
+        Returns:
+            손실 거래별 지표/플래그 데이터프레임 (trades_df 인덱스 유지)
+        """
+        losing = trades_df[trades_df["pnl"] < 0]
+        
+        entry_price = _batch_column(losing, "entry_price", 0.0)
+        entry_volume = _batch_column(losing, "entry_volume", 0.0)
+        exit_volume = _batch_column(losing, "exit_volume", 0.0)
+        
+        flags, values = _numeric_failure_batch(
+            entry_price,
+            _batch_column(losing, "exit_price", entry_price),
+            _batch_column(losing, "exit_price", 0.0),
+            _batch_column(losing, "fill_price", entry_price),
+            _batch_column(losing, "entry_atr", 0.0),
+            _batch_column(losing, "exit_atr", 0.0),
+            entry_volume,
+            exit_volume,
+            _batch_column(losing, "entry_volume_ma", entry_volume),
+            _batch_column(losing, "exit_volume_ma", exit_volume),
+            _batch_column(losing, "stop_loss", entry_price),
+            _batch_column(losing, "position_size", 0.0),
+            _batch_column(losing, "account_equity", 100000),
+            _batch_column(losing, "pnl", 0.0),
+        )
+        
+        result = pd.DataFrame(values, index=losing.index, columns=list(_VALUE_COLUMNS))
+        for name, bit in _FLAG_COLUMNS:
+            result[name] = (flags & bit) != 0
+        
+        # 트렌드 분석 (이력이 주어진 거래만)
+        if histories is not None:
+            trends = []
+            for trade_idx in losing.index:
+                history = histories.get(trade_idx)
+                trend = "unknown"
+                if history is not None and "close" in history.columns and len(history) >= 20:
+                    closes = history["close"].to_numpy()
+                    first = closes[-20]
+                    trend = _classify_trend(((closes[-1] - first) / first) * 100)
+                trends.append(trend)
+            result["trend_direction"] = trends
+        
+        return result
+    
     def _analyze_market_conditions(
         self,
-        entry_data: Dict[str, Any],
-        exit_data: Dict[str, Any],
+        ctx: _TradeContext,
         market_history: pd.DataFrame,
+        closes: Optional[np.ndarray],
+        values: np.ndarray,
     ) -> Dict[str, Any]:
         """시장 상황 분석"""
-        conditions = {
-            "entry_volatility": 0.0,
-            "exit_volatility": 0.0,
-            "volatility_change": 0.0,
-            "entry_volume": 0.0,
-            "exit_volume": 0.0,
-            "volume_change": 0.0,
-            "trend_direction": "unknown",
-            "trend_reversal": False,
-        }
-        
-        if market_history.empty:
-            return conditions
+        conditions = dict(_EMPTY_MARKET_CONDITIONS)
         
         # 변동성 계산
         if "atr" in market_history.columns:
-            entry_atr = entry_data.get("atr", 0.0)
-            exit_atr = exit_data.get("atr", 0.0)
-            entry_price = entry_data.get("price", 0.0)
-            exit_price = exit_data.get("price", 0.0)
-            
-            if entry_price > 0:
-                conditions["entry_volatility"] = (entry_atr / entry_price) * 100
-            if exit_price > 0:
-                conditions["exit_volatility"] = (exit_atr / exit_price) * 100
-            conditions["volatility_change"] = conditions["exit_volatility"] - conditions["entry_volatility"]
+            conditions["entry_volatility"] = float(values[_V_ENTRY_VOLATILITY])
+            conditions["exit_volatility"] = float(values[_V_EXIT_VOLATILITY])
+            conditions["volatility_change"] = float(values[_V_VOLATILITY_CHANGE])
         
         # 거래량 분석
-        conditions["entry_volume"] = entry_data.get("volume", 0.0)
-        conditions["exit_volume"] = exit_data.get("volume", 0.0)
-        if conditions["entry_volume"] > 0:
-            conditions["volume_change"] = (
-                (conditions["exit_volume"] - conditions["entry_volume"]) / conditions["entry_volume"]
-            ) * 100
+        conditions["entry_volume"] = ctx.entry_volume
+        conditions["exit_volume"] = ctx.exit_volume
+        conditions["volume_change"] = float(values[_V_VOLUME_CHANGE])
         
         # 트렌드 분석
-        if len(market_history) >= 20:
-            recent_prices = market_history["close"].tail(20).values
-            price_change = ((recent_prices[-1] - recent_prices[0]) / recent_prices[0]) * 100
-            
-            if price_change > 2:
-                conditions["trend_direction"] = "strong_up"
-            elif price_change > 0.5:
-                conditions["trend_direction"] = "up"
-            elif price_change < -2:
-                conditions["trend_direction"] = "strong_down"
-            elif price_change < -0.5:
-                conditions["trend_direction"] = "down"
-            else:
-                conditions["trend_direction"] = "sideways"
+        if closes is not None and len(closes) >= 20:
+            first = closes[-20]
+            price_change = ((closes[-1] - first) / first) * 100
+            conditions["trend_direction"] = _classify_trend(price_change)
         
         return conditions
     
-    def _analyze_volume_pattern(
-        self,
-        entry_data: Dict[str, Any],
-        exit_data: Dict[str, Any],
-        market_history: pd.DataFrame,
-    ) -> Dict[str, Any]:
+    def _analyze_volume_pattern(self, flags: int, values: np.ndarray) -> Dict[str, Any]:
         """거래량 패턴 분석"""
         issues = []
         mistakes = []
         
-        entry_volume = entry_data.get("volume", 0.0)
-        entry_volume_ma = entry_data.get("volume_ma", entry_volume)
-        exit_volume = exit_data.get("volume", 0.0)
-        exit_volume_ma = exit_data.get("volume_ma", exit_volume)
+        entry_volume_ratio = values[_V_ENTRY_VOLUME_RATIO]
         
         # 진입 시 거래량 부족
-        if entry_volume_ma > 0:
-            entry_volume_ratio = entry_volume / entry_volume_ma
-            if entry_volume_ratio < 0.5:
-                issues.append(f"진입 시 거래량 부족: 평균의 {entry_volume_ratio:.1%}")
-                mistakes.append("거래량이 평균의 50% 미만인데 진입함 - 유동성 부족으로 불리한 가격 체결 가능")
-            elif entry_volume_ratio < 0.7:
-                issues.append(f"진입 시 거래량 낮음: 평균의 {entry_volume_ratio:.1%}")
+        if flags & _F_ENTRY_VOLUME_LOW:
+            issues.append(_TPL_ENTRY_VOLUME_LOW.format(ratio=entry_volume_ratio))
+            mistakes.append(_MSG_ENTRY_VOLUME_LOW)
+        elif flags & _F_ENTRY_VOLUME_LIGHT:
+            issues.append(_TPL_ENTRY_VOLUME_LIGHT.format(ratio=entry_volume_ratio))
         
         # 청산 시 거래량 급증 (반대 신호)
-        if exit_volume_ma > 0 and entry_volume_ma > 0:
-            exit_volume_ratio = exit_volume / exit_volume_ma
-            entry_volume_ratio = entry_volume / entry_volume_ma
-            
-            if exit_volume_ratio > 1.5 and entry_volume_ratio < 1.0:
-                issues.append(f"청산 시 거래량 급증: {exit_volume_ratio:.1%} (진입 시: {entry_volume_ratio:.1%})")
-                mistakes.append("청산 시점에 거래량이 급증했는데 이미 손실 포지션 - 반대 방향으로 강한 움직임 신호를 놓침")
+        if flags & _F_EXIT_VOLUME_SPIKE:
+            issues.append(_TPL_EXIT_VOLUME_SPIKE.format(
+                exit_ratio=values[_V_EXIT_VOLUME_RATIO], entry_ratio=entry_volume_ratio
+            ))
+            mistakes.append(_MSG_EXIT_VOLUME_SPIKE)
         
         # 거래량 급등 후 손실
-        if exit_volume > 0 and entry_volume > 0:
-            volume_surge = (exit_volume - entry_volume) / entry_volume
-            if volume_surge > 2.0:  # 거래량 2배 이상 증가
-                issues.append(f"거래량 급등: {volume_surge:.1%} 증가")
-                mistakes.append("거래량이 급등했는데 손실 포지션 유지 - 시장이 반대 방향으로 강하게 움직임을 놓침")
+        if flags & _F_VOLUME_SURGE:
+            issues.append(_TPL_VOLUME_SURGE.format(surge=values[_V_VOLUME_SURGE]))
+            mistakes.append(_MSG_VOLUME_SURGE)
         
         return {
             "issues": issues,
@@ -227,155 +642,132 @@ class FailureAnalyzer:
     
     def _analyze_averaging_down(
         self,
-        trade_result: Dict[str, Any],
-        entry_data: Dict[str, Any],
-        market_history: pd.DataFrame,
+        ctx: _TradeContext,
+        flags: int,
+        values: np.ndarray,
     ) -> Dict[str, Any]:
         """물타기 분석"""
         # 실제로는 거래 이력에서 물타기 여부 확인 필요
-        # 여기서는 간단히 포지션 크기와 손실 정도로 추정
-        
-        pnl = trade_result.get("pnl", 0.0)
-        position_size = trade_result.get("position_size", 0.0)
-        entry_price = entry_data.get("price", 0.0)
-        exit_price = trade_result.get("exit_price", entry_price)
-        
-        # 큰 손실 + 큰 포지션 = 물타기 가능성
-        if pnl < -100 and position_size > 1.0:
-            # 손실률 계산
-            if entry_price > 0:
-                loss_pct = abs((exit_price - entry_price) / entry_price) * 100
-                
-                if loss_pct > 5.0:  # 5% 이상 손실
-                    return {
-                        "detected": True,
-                        "reason": f"물타기로 인한 대규모 손실: {pnl:.2f} (손실률 {loss_pct:.1f}%)",
-                        "mistakes": [
-                            "손실 포지션에 물타기를 해서 손실 확대",
-                            f"손실률 {loss_pct:.1f}%까지 방치 - 조기 손절 필요했음",
-                            "리스크 관리 원칙 위반",
-                        ],
-                    }
+        # 여기서는 간단히 포지션 크기와 손실 정도로 추정 (큰 손실 + 큰 포지션 = 물타기 가능성)
+        if flags & _F_AVERAGING_DOWN:
+            loss_pct = values[_V_LOSS_PCT]
+            return {
+                "detected": True,
+                "reason": _TPL_AVERAGING_DOWN.format(pnl=ctx.pnl, loss_pct=loss_pct),
+                "mistakes": [
+                    _MSG_AVERAGING_DOWN,
+                    _TPL_AVERAGING_LOSS.format(loss_pct=loss_pct),
+                    _MSG_RISK_RULE_VIOLATION,
+                ],
+            }
         
         return {"detected": False}
     
     def _analyze_timing(
         self,
-        entry_data: Dict[str, Any],
-        exit_data: Dict[str, Any],
+        ctx: _TradeContext,
         market_history: pd.DataFrame,
+        closes: Optional[np.ndarray],
     ) -> Dict[str, Any]:
         """타이밍 분석"""
         issues = []
         mistakes = []
         
-        entry_time = pd.Timestamp(entry_data.get("timestamp"))
-        exit_time = pd.Timestamp(exit_data.get("timestamp"))
-        duration = (exit_time - entry_time).total_seconds() / 3600  # 시간
+        entry_time = ctx.entry_ts
+        duration = (ctx.exit_ts - entry_time).total_seconds() / 3600  # 시간
         
         # 너무 오래 보유
         if duration > 24:
-            issues.append(f"장기 보유: {duration:.1f}시간")
-            mistakes.append(f"{duration:.1f}시간 동안 손실 포지션 보유 - 조기 청산 필요했음")
+            issues.append(_TPL_LONG_HOLD.format(hours=duration))
+            mistakes.append(_TPL_LONG_HOLD_MISTAKE.format(hours=duration))
         
         # 너무 빨리 청산 (익절 기회 놓침)
-        if duration < 1 and exit_data.get("pnl", 0.0) < 0:
+        if duration < 1 and ctx.exit_pnl < 0:
             # 진입 후 1시간 이내 손실 청산
-            issues.append(f"조기 청산: {duration:.1f}시간")
-            mistakes.append("너무 빨리 청산 - 노이즈에 반응했을 가능성")
+            issues.append(_TPL_EARLY_EXIT.format(hours=duration))
+            mistakes.append(_MSG_EARLY_EXIT)
         
         # 진입 타이밍 (진입 후 가격 움직임 확인)
         if not market_history.empty and len(market_history) >= 10:
-            entry_idx = None
-            for idx, row in market_history.iterrows():
-                if pd.Timestamp(row.get("timestamp", idx)) >= entry_time:
-                    entry_idx = idx
-                    break
+            if "timestamp" in market_history.columns:
+                timestamps = pd.DatetimeIndex(market_history["timestamp"])
+            else:
+                timestamps = pd.DatetimeIndex(market_history.index)
+            
+            # 진입 시각 이후 첫 바 위치 (정렬된 경우 이진 탐색)
+            if timestamps.is_monotonic_increasing:
+                pos = timestamps.searchsorted(entry_time, side="left")
+            else:
+                candidates = np.flatnonzero(timestamps >= entry_time)
+                pos = candidates[0] if len(candidates) else len(timestamps)
             
-            if entry_idx is not None:
-                # 진입 후 5바 데이터
-                post_entry = market_history.loc[market_history.index >= entry_idx].head(5)
-                if len(post_entry) >= 3:
-                    entry_price = entry_data.get("price", 0.0)
-                    post_prices = post_entry["close"].values
-                    
-                    # 진입 직후 가격이 더 불리하게 움직임
-                    if len(post_prices) >= 2:
-                        immediate_move = ((post_prices[1] - entry_price) / entry_price) * 100
-                        if immediate_move < -1.0:  # 1% 이상 즉시 하락
-                            issues.append(f"나쁜 진입 타이밍: 진입 직후 {immediate_move:.1f}% 하락")
-                            mistakes.append("진입 직후 가격이 불리하게 움직임 - 진입 신호가 약했거나 노이즈에 반응")
+            # 진입 후 5바 종가 (위치 기반 슬라이스)
+            post_prices = closes[pos:pos + 5] if closes is not None else ()
+            if len(post_prices) >= 3:
+                entry_price = ctx.entry_price
+                
+                # 진입 직후 가격이 더 불리하게 움직임
+                immediate_move = ((post_prices[1] - entry_price) / entry_price) * 100
+                if immediate_move < -1.0:  # 1% 이상 즉시 하락
+                    issues.append(_TPL_BAD_ENTRY_TIMING.format(move=immediate_move))
+                    mistakes.append(_MSG_BAD_ENTRY_TIMING)
         
         return {
             "issues": issues,
             "mistakes": mistakes,
         }
     
-    def _analyze_risk_management(
-        self,
-        trade_result: Dict[str, Any],
-        entry_data: Dict[str, Any],
-        exit_data: Dict[str, Any],
-    ) -> Dict[str, Any]:
+    def _analyze_risk_management(self, flags: int, values: np.ndarray) -> Dict[str, Any]:
         """리스크 관리 분석"""
         issues = []
         mistakes = []
         
-        pnl = trade_result.get("pnl", 0.0)
-        entry_price = entry_data.get("price", 0.0)
-        stop_loss = entry_data.get("stop_loss", entry_price)
-        exit_price = exit_data.get("price", entry_price)
-        
-        # 스탑로스 설정 문제
-        if entry_price > 0 and stop_loss != entry_price:
-            stop_distance = abs(entry_price - stop_loss) / entry_price * 100
-            
-            # 스탑로스가 너무 멀리
-            if stop_distance > 5.0:
-                issues.append(f"스탑로스 너무 멀리: {stop_distance:.1f}%")
-                mistakes.append(f"스탑로스가 {stop_distance:.1f}%나 멀어서 손실 확대")
-            
-            # 실제 청산이 스탑로스보다 더 큰 손실
-            actual_loss = abs(entry_price - exit_price) / entry_price * 100
-            if actual_loss > stop_distance * 1.2:
-                issues.append(f"스탑로스 미준수: 설정 {stop_distance:.1f}%, 실제 {actual_loss:.1f}%")
-                mistakes.append("스탑로스를 설정했지만 더 큰 손실로 청산 - 슬리피지나 갭 발생")
-        
-        # 포지션 사이즈 문제
-        position_size = trade_result.get("position_size", 0.0)
-        account_equity = trade_result.get("account_equity", 100000)
-        
-        if account_equity > 0:
-            position_value = position_size * entry_price
-            position_ratio = position_value / account_equity
-            
-            if position_ratio > 0.3:  # 자산의 30% 이상
-                issues.append(f"과도한 포지션: 자산의 {position_ratio:.1%}")
-                mistakes.append(f"포지션이 자산의 {position_ratio:.1%}로 너무 큼 - 리스크 과다")
+        # 스탑로스가 너무 멀리
+        stop_distance = values[_V_STOP_DISTANCE]
+        if flags & _F_STOP_TOO_FAR:
+            issues.append(_TPL_STOP_TOO_FAR.format(distance=stop_distance))
+            mistakes.append(_TPL_STOP_TOO_FAR_MISTAKE.format(distance=stop_distance))
+        
+        # 실제 청산이 스탑로스보다 더 큰 손실
+        if flags & _F_STOP_VIOLATED:
+            issues.append(_TPL_STOP_VIOLATED.format(
+                distance=stop_distance, actual=values[_V_ACTUAL_LOSS]
+            ))
+            mistakes.append(_MSG_STOP_VIOLATED)
+        
+        # 포지션 사이즈 문제 (자산의 30% 이상)
+        if flags & _F_POSITION_OVERSIZED:
+            position_ratio = values[_V_POSITION_RATIO]
+            issues.append(_TPL_POSITION_OVERSIZED.format(ratio=position_ratio))
+            mistakes.append(_TPL_POSITION_OVERSIZED_MISTAKE.format(ratio=position_ratio))
         
         return {
             "issues": issues,
             "mistakes": mistakes,
         }
     
-    def _analyze_regime_change(
-        self,
-        entry_data: Dict[str, Any],
-        exit_data: Dict[str, Any],
-        market_history: pd.DataFrame,
-    ) -> Dict[str, Any]:
+    def _analyze_regime_change(self, ctx: _TradeContext) -> Dict[str, Any]:
         """레짐 전환 분석"""
-        entry_regime = entry_data.get("regime", "unknown")
-        exit_regime = exit_data.get("regime", "unknown")
+        entry_regime = ctx.entry_regime
+        exit_regime = ctx.exit_regime
         
         if entry_regime != exit_regime and entry_regime != "unknown" and exit_regime != "unknown":
+            key = (entry_regime, exit_regime)
+            messages = self._regime_msg_cache.get(key)
+            if messages is None:
+                messages = (
+                    _TPL_REGIME_CHANGE.format(entry=entry_regime, exit=exit_regime),
+                    _TPL_REGIME_CHANGE_MISTAKE.format(entry=entry_regime, exit=exit_regime),
+                )
+                self._regime_msg_cache[key] = messages
+            
             return {
                 "detected": True,
-                "reason": f"레짐 전환: {entry_regime} → {exit_regime}",
+                "reason": messages[0],
                 "mistakes": [
-                    f"진입 시 {entry_regime} 레짐이었지만 {exit_regime}로 전환됨",
-                    "레짐 전환 신호를 놓치고 포지션 유지",
-                    "레짐 전환 시 즉시 청산해야 함",
+                    messages[1],
+                    _MSG_REGIME_MISSED,
+                    _MSG_REGIME_EXIT,
                 ],
             }
         
@@ -383,64 +775,77 @@ class FailureAnalyzer:
     
     def _generate_detailed_journal(self, analysis: Dict[str, Any]) -> str:
         """상세 일지 생성"""
-        journal_parts = []
+        buf = io.StringIO()
+        w = buf.write
         
-        journal_parts.append("=" * 60)
-        journal_parts.append("📝 거래 실패 분석 일지")
-        journal_parts.append("=" * 60)
+        w(_BAR + "\n")
+        w("📝 거래 실패 분석 일지\n")
+        w(_BAR + "\n")
         
         # 기본 정보
-        journal_parts.append(f"\n【거래 정보】")
-        journal_parts.append(f"  손익: {analysis['pnl']:.2f}")
-        journal_parts.append(f"  진입: {analysis['entry_time']}")
-        journal_parts.append(f"  청산: {analysis['exit_time']}")
+        w("\n【거래 정보】\n")
+        w(f"  손익: {analysis['pnl']:.2f}\n")
+        w(f"  진입: {analysis['entry_time']}\n")
+        w(f"  청산: {analysis['exit_time']}\n")
         
         # 실패 원인
         if analysis["failure_reasons"]:
-            journal_parts.append(f"\n【실패 원인】")
+            w("\n【실패 원인】\n")
             for i, reason in enumerate(analysis["failure_reasons"], 1):
-                journal_parts.append(f"  {i}. {reason}")
+                w(f"  {i}. {reason}\n")
         
         # 시장 상황
         market = analysis.get("market_conditions", {})
         if market:
-            journal_parts.append(f"\n【시장 상황】")
-            journal_parts.append(f"  진입 시 변동성: {market.get('entry_volatility', 0):.2f}%")
-            journal_parts.append(f"  청산 시 변동성: {market.get('exit_volatility', 0):.2f}%")
-            journal_parts.append(f"  변동성 변화: {market.get('volatility_change', 0):+.2f}%")
-            journal_parts.append(f"  거래량 변화: {market.get('volume_change', 0):+.1f}%")
-            journal_parts.append(f"  트렌드: {market.get('trend_direction', 'unknown')}")
+            w("\n【시장 상황】\n")
+            w(f"  진입 시 변동성: {market.get('entry_volatility', 0):.2f}%\n")
+            w(f"  청산 시 변동성: {market.get('exit_volatility', 0):.2f}%\n")
+            w(f"  변동성 변화: {market.get('volatility_change', 0):+.2f}%\n")
+            w(f"  거래량 변화: {market.get('volume_change', 0):+.1f}%\n")
+            w(f"  트렌드: {market.get('trend_direction', 'unknown')}\n")
         
         # 결정 실수
         if analysis["decision_mistakes"]:
-            journal_parts.append(f"\n【결정 실수】")
+            w("\n【결정 실수】\n")
             for i, mistake in enumerate(analysis["decision_mistakes"], 1):
-                journal_parts.append(f"  {i}. {mistake}")
+                w(f"  {i}. {mistake}\n")
         
         # 리스크 실수
         if analysis["risk_mistakes"]:
-            journal_parts.append(f"\n【리스크 관리 실수】")
+            w("\n【리스크 관리 실수】\n")
             for i, mistake in enumerate(analysis["risk_mistakes"], 1):
-                journal_parts.append(f"  {i}. {mistake}")
+                w(f"  {i}. {mistake}\n")
         
         # 타이밍 실수
         if analysis["timing_mistakes"]:
-            journal_parts.append(f"\n【타이밍 실수】")
+            w("\n【타이밍 실수】\n")
             for i, mistake in enumerate(analysis["timing_mistakes"], 1):
-                journal_parts.append(f"  {i}. {mistake}")
+                w(f"  {i}. {mistake}\n")
         
         # 교훈
-        journal_parts.append(f"\n【교훈】")
+        w("\n【교훈】\n")
         if analysis["failure_reasons"]:
-            journal_parts.append("  다음 거래에서는:")
+            w("  다음 거래에서는:\n")
             for reason in analysis["failure_reasons"][:3]:  # 상위 3개만
-                journal_parts.append(f"    - {reason}을(를) 피해야 함")
+                w(f"    - {reason}을(를) 피해야 함\n")
         else:
-            journal_parts.append("  특별한 실수는 없었지만 손실 발생 - 시장 노이즈 가능성")
+            w("  특별한 실수는 없었지만 손실 발생 - 시장 노이즈 가능성\n")
+        
+        w(_BAR)
         
-        journal_parts.append("=" * 60)
+        return buf.getvalue()
+    
+    def get_journal(self, idx: int = -1) -> str:
+        """
+        저장된 실패 패턴의 상세 일지 생성
         
-        return "\n".join(journal_parts)
+        Args:
+            idx: failure_patterns 인덱스 (기본값: 가장 최근)
+            
+        Returns:
+            상세 일지 문자열
+        """
+        return self._generate_detailed_journal(self.failure_patterns[idx])
     
     def get_failure_statistics(self) -> Dict[str, Any]:
         """실패 통계 반환"""
@@ -448,17 +853,16 @@ class FailureAnalyzer:
             return {}
         
         # 실패 원인별 빈도
-        reason_counts = {}
+        reason_counts = Counter()
         for pattern in self.failure_patterns:
-            for reason in pattern.get("failure_reasons", []):
-                reason_counts[reason] = reason_counts.get(reason, 0) + 1
+            reason_counts.update(pattern.get("failure_reasons", ()))
         
         # 가장 흔한 실수
-        top_mistakes = sorted(reason_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_mistakes = reason_counts.most_common(5)
         
         return {
             "total_failures": len(self.failure_patterns),
             "top_failure_reasons": top_mistakes,
-            "recent_failures": self.failure_patterns[-10:] if len(self.failure_patterns) >= 10 else self.failure_patterns,
+            "recent_failures": list(self.failure_patterns)[-10:],
         }
 
@@ -1,10 +1,15 @@
 """실시간 거래 모듈 - 봉 마감 기반 자동 학습 및 거래"""
 
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Tuple, NamedTuple
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
+import multiprocessing
+import os
+import numpy as np
 import pandas as pd
-import time
-from threading import Thread, Event
+from queue import Queue, Full, Empty
+from threading import Thread, Condition, current_thread
 from data.realtime_feed import RealtimeFeed
 from strategy.strategy_registry import StrategyRegistry
 from backtest.engine import BacktestEngine
@@ -22,10 +27,161 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_DEFAULT_EMA_PERIODS = (20, 40, 80)
+
+
+def _path(d: Any, keys: Tuple[str, ...], default: Any) -> Any:
+    """
+    중첩 설정에서 키 경로 값 조회 (중간 기본 딕셔너리를 만들지 않음)
+    
+    Args:
+        d: 설정 딕셔너리
+        keys: 키 경로
+        default: 경로가 없을 때 반환할 값
+        
+    Returns:
+        경로의 값 또는 기본값
+    """
+    for k in keys:
+        if not isinstance(d, dict) or k not in d:
+            return default
+        d = d[k]
+    return d
+
+
+class Bar(NamedTuple):
+    """마감된 봉 (수신 시 한 번 정규화해 하위 처리에서는 속성으로 접근)"""
+    timestamp: pd.Timestamp
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    
+    @classmethod
+    def from_dict(cls, bar: Dict[str, Any]) -> "Bar":
+        """RealtimeFeed/웹훅 봉 딕셔너리에서 생성"""
+        return cls(
+            pd.Timestamp(bar.get("timestamp")),
+            float(bar.get("open", 0.0)),
+            float(bar.get("high", 0.0)),
+            float(bar.get("low", 0.0)),
+            float(bar.get("close", 0.0)),
+            float(bar.get("volume", 0.0)),
+        )
+
+
+# 공유 메모리 레코드에서 DatetimeIndex를 담는 필드 이름
+_INDEX_FIELD = "__index__"
+
+# 최적화 워커 프로세스 시작 방식
+# (시그널/최적화/웹 스레드가 도는 프로세스에서 fork하면 잠긴 락이 자식에 복제될 수 있음)
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _share_frame(df: pd.DataFrame) -> Tuple[SharedMemory, Dict[str, Any]]:
+    """
+    OHLCV 데이터프레임을 공유 메모리 레코드 배열로 복사
+    
+    숫자/날짜 열만 옮기며, 워커 프로세스는 spec으로 같은 메모리를 연다.
+    
+    Args:
+        df: OHLCV 데이터프레임
+        
+    Returns:
+        (공유 메모리, 워커용 spec) - 호출자가 close/unlink 해야 함
+    """
+    fields = [
+        (str(col), df[col].dtype.str)
+        for col in df.columns
+        if isinstance(df[col].dtype, np.dtype) and df[col].dtype.kind in "biufM"
+    ]
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is None:
+        fields.append((_INDEX_FIELD, df.index.dtype.str))
+    
+    dtype = np.dtype(fields)
+    shm = SharedMemory(create=True, size=max(dtype.itemsize * len(df), 1))
+    records = np.ndarray((len(df),), dtype=dtype, buffer=shm.buf)
+    for name, _ in fields:
+        records[name] = df.index.values if name == _INDEX_FIELD else df[name].to_numpy()
+    del records  # 버퍼 참조 해제 (close 가능하도록)
+    
+    spec = {
+        "name": shm.name,
+        "length": len(df),
+        "fields": fields,
+        "index_name": df.index.name,
+        "attrs": dict(df.attrs),
+    }
+    return shm, spec
+
+
+def _attach_frame(spec: Dict[str, Any]) -> pd.DataFrame:
+    """공유 메모리 레코드 배열에서 데이터프레임 복원 (워커 프로세스용)"""
+    shm = SharedMemory(name=spec["name"])
+    try:
+        records = np.ndarray((spec["length"],), dtype=np.dtype(spec["fields"]), buffer=shm.buf)
+        columns = {
+            name: records[name].copy()
+            for name, _ in spec["fields"]
+            if name != _INDEX_FIELD
+        }
+        index = None
+        if _INDEX_FIELD in records.dtype.names:
+            index = pd.DatetimeIndex(records[_INDEX_FIELD].copy(), name=spec["index_name"])
+        del records
+    finally:
+        shm.close()
+    
+    df = pd.DataFrame(columns, index=index)
+    df.attrs.update(spec["attrs"])
+    return df
+
+
+def _backtest_params(
+    spec: Dict[str, Any],
+    strategy_cls: type,
+    config: Dict[str, Any],
+    params: Dict[str, Any],
+) -> Optional[float]:
+    """
+    파라미터 조합 하나를 백테스트 (워커 프로세스용)
+    
+    Args:
+        spec: _share_frame이 반환한 공유 메모리 spec
+        strategy_cls: 전략 클래스
+        config: 기본 설정
+        params: 적용할 파라미터 조합
+        
+    Returns:
+        Sharpe 점수 (거래가 없으면 None)
+    """
+    df = _attach_frame(spec)
+    strategy = strategy_cls(ContinuousOptimizer.apply_params_to_config(config, params))
+    backtest_config = config.get("backtest", {})
+    engine = BacktestEngine(strategy, backtest_config)
+    result = engine.run(df)
+    
+    if result["trades"].empty:
+        return None
+    
+    metrics = calculate_metrics(
+        result["trades"],
+        result["equity_curve"],
+        engine.initial_capital,
+    )
+    
+    # 점수 계산 (Sharpe 비율 우선)
+    return metrics.sharpe_ratio if metrics.sharpe_ratio else -999.0
+
 
 class LiveTrader:
     """실시간 거래 클래스 - 봉 마감 기반 자동 학습 및 거래"""
     
+    # 설정 경로 (중첩 딕셔너리 키)
+    _EMA_PATH = ("indicators", "ema", "periods")
+    _ATR_MULT_PATH = ("strategy", "exit", "stop_loss", "atr_multiplier")
+    
     def __init__(
         self,
         config: Dict[str, Any],
@@ -50,6 +206,7 @@ class LiveTrader:
         # 실시간 데이터 피드
         data_config = config.get("data", {})
         self.realtime_feed = RealtimeFeed(config=data_config)
+        self._feed_started = False  # 웹훅 모드에서는 시작하지 않음
         
         # 리스크 관리자
         self.risk_guardian = RiskGuardian(config)
@@ -76,10 +233,25 @@ class LiveTrader:
         # 최적화 이력
         self.optimization_history: List[Dict[str, Any]] = []
         self.last_optimization_time: Optional[datetime] = None
+        self._next_reopt_at: datetime = datetime.min  # 최적화 전에는 즉시 재최적화
         
         # 거래 상태
         self.is_trading = False
-        self.stop_event = Event()
+        self._stopping = False
+        self._shutdown_cond = Condition()
+        
+        # 작업 큐 (빠른 경로: 진입/청산 판단, 느린 경로: 재최적화)
+        self._signal_queue: Queue = Queue(maxsize=4)
+        self._dropped_bars = 0  # 처리 지연으로 버린 오래된 봉 수
+        self._opt_queue: Queue = Queue(maxsize=2)
+        self._workers: List[Thread] = []
+        self._reopt_check_interval = 60.0  # 재최적화 시점 체크 주기 (초)
+        self._worker_join_timeout = 5.0  # 중지 시 워커 종료 대기 (초)
+        
+        # 최적화 데이터 로더 및 윈도우 캐시 (재최적화 시 증분 조회)
+        self._data_loader: Optional[Any] = None
+        self._df_cache: Optional[pd.DataFrame] = None
+        self._df_cache_end: Optional[datetime] = None
         
         # 백테스트 엔진 (실시간 거래용)
         self.backtest_engine: Optional[BacktestEngine] = None
@@ -94,14 +266,8 @@ class LiveTrader:
     
     def _get_current_params(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """현재 파라미터 추출"""
-        indicators_config = config.get("indicators", {})
-        ema_config = indicators_config.get("ema", {})
-        periods = ema_config.get("periods", [20, 40, 80])
-        
-        strategy_config = config.get("strategy", {})
-        exit_config = strategy_config.get("exit", {})
-        stop_loss_config = exit_config.get("stop_loss", {})
-        atr_multiplier = stop_loss_config.get("atr_multiplier", 2.0)
+        periods = _path(config, self._EMA_PATH, _DEFAULT_EMA_PERIODS)
+        atr_multiplier = _path(config, self._ATR_MULT_PATH, 2.0)
         
         return {
             "ema_fast": periods[0],
@@ -131,6 +297,15 @@ class LiveTrader:
         self.is_trading = True
         self.paper_trading = paper_trading
         
+        # 이전 stop()의 상태 초기화 (재시작 지원)
+        with self._shutdown_cond:
+            self._stopping = False
+        for work_queue in (self._signal_queue, self._opt_queue):
+            self._drain_queue(work_queue)
+        
+        # 시그널/최적화 워커 시작
+        self._start_workers()
+        
         # 초기 최적화 (과거 데이터로)
         if auto_optimize:
             self._run_optimization()
@@ -140,9 +315,10 @@ class LiveTrader:
         use_realtime_feed = not hasattr(self, '_webhook_mode') or not getattr(self, '_webhook_mode', False)
         
         if use_realtime_feed:
-            self.realtime_feed.start()
             # 봉 마감 이벤트 핸들러 등록
             self.realtime_feed.on_bar_close = self._on_bar_close
+            self.realtime_feed.start()
+            self._feed_started = True
             
             # 메인 루프 시작
             try:
@@ -156,44 +332,89 @@ class LiveTrader:
             logger.info("웹훅 모드 - RealtimeFeed 없이 웹훅으로만 데이터 수신")
             logger.info("웹훅이 들어오면 자동으로 거래 로직이 실행됩니다")
             
-            # 초기 최적화만 실행
-            if auto_optimize:
-                self._run_optimization()
-            
             # 웹훅 모드에서는 메인 루프를 실행하지 않고 대기
             # 웹훅이 들어오면 _on_bar_close가 호출됨
             try:
-                while not self.stop_event.is_set():
-                    time.sleep(1)
+                self._wait_for_stop()
             except KeyboardInterrupt:
                 logger.info("거래 중지 요청됨")
             finally:
                 self.stop()
     
     def _trading_loop(self):
-        """거래 메인 루프"""
+        """거래 메인 루프 (재최적화 스케줄 관리)"""
         logger.info("거래 루프 시작...")
         
-        while not self.stop_event.is_set():
+        while not self._wait_for_stop(timeout=self._reopt_check_interval):
+            # 재최적화 체크
+            if self._should_reoptimize():
+                logger.info("재최적화 시점 도달 - 최적화 요청...")
+                self._request_optimization()
+    
+    def _start_workers(self):
+        """시그널 처리 / 최적화 워커 스레드 시작 (살아 있는 워커는 재사용)"""
+        targets = (
+            (self._signal_worker, "LiveTraderSignal"),
+            (self._opt_worker, "LiveTraderOptimizer"),
+        )
+        workers = []
+        for i, (target, name) in enumerate(targets):
+            worker = self._workers[i] if i < len(self._workers) else None
+            if worker is None or not worker.is_alive():
+                worker = Thread(target=target, name=name, daemon=True)
+                worker.start()
+            workers.append(worker)
+        self._workers = workers
+    
+    @staticmethod
+    def _drain_queue(work_queue: Queue):
+        """큐에 남은 항목(이전 실행의 센티널/오래된 봉) 비우기"""
+        while True:
             try:
-                # 실시간 데이터 확인
-                latest_bar = self.realtime_feed.get_latest_bar()
-                
-                if latest_bar is not None:
-                    # 현재 파라미터로 전략 실행
-                    self._process_realtime_bar(latest_bar)
-                
-                # 재최적화 체크
-                if self._should_reoptimize():
-                    logger.info("재최적화 시점 도달 - 최적화 실행 중...")
-                    self._run_optimization()
-                
-                # 짧은 대기
-                time.sleep(1)
-                
+                work_queue.get_nowait()
+            except Empty:
+                return
+    
+    def _signal_worker(self):
+        """봉 마감 시그널 처리 워커 (빠른 경로)"""
+        while True:
+            bar = self._signal_queue.get()
+            if bar is None or self._stopping:
+                break
+            
+            try:
+                self._process_realtime_bar(bar)
             except Exception as e:
-                logger.error(f"거래 루프 에러: {e}")
-                time.sleep(5)
+                logger.error(f"시그널 처리 에러: {e}")
+    
+    def _opt_worker(self):
+        """재최적화 워커 (느린 경로)"""
+        while True:
+            request = self._opt_queue.get()
+            if request is None or self._stopping:
+                break
+            
+            self._run_optimization()
+    
+    def _request_optimization(self):
+        """재최적화 요청 (대기 중인 요청이 있으면 생략)"""
+        try:
+            self._opt_queue.put_nowait(True)
+        except Full:
+            pass
+    
+    def _wait_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        중지 요청까지 대기
+        
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무기한)
+            
+        Returns:
+            중지 요청 여부
+        """
+        with self._shutdown_cond:
+            return self._shutdown_cond.wait_for(lambda: self._stopping, timeout=timeout)
     
     def _on_bar_close(self, bar: Dict[str, Any]):
         """
@@ -202,33 +423,110 @@ class LiveTrader:
         Args:
             bar: 마감된 봉 데이터
         """
-        logger.info(f"봉 마감: {bar.get('timestamp')} - Close: {bar.get('close')}")
+        bar = Bar.from_dict(bar)
+        logger.info("봉 마감: {} - Close: {}", bar.timestamp, bar.close)
         
-        # 봉 마감 시마다 재최적화 (설정된 경우)
+        # 봉 마감 시마다 재최적화 (설정된 경우, 최적화 워커에서 실행)
         if self.reoptimize_frequency == "on_bar_close":
-            logger.info("봉 마감 기반 재최적화 실행...")
-            self._run_optimization()
+            logger.info("봉 마감 기반 재최적화 요청...")
+            self._request_optimization()
         
-        # 현재 파라미터로 거래 시그널 확인
-        self._process_realtime_bar(bar)
+        # 현재 파라미터로 거래 시그널 확인 (시그널 워커에서 실행)
+        try:
+            self._signal_queue.put_nowait(bar)
+        except Full:
+            # 가장 오래된 봉을 버리고 최신 봉 처리 보장
+            try:
+                stale = self._signal_queue.get_nowait()
+                logger.warning("시그널 큐 가득 참 - 오래된 봉 버림: {}", getattr(stale, "timestamp", None))
+            except Empty:
+                pass
+            self._dropped_bars += 1
+            try:
+                self._signal_queue.put_nowait(bar)
+            except Full:
+                logger.warning("시그널 큐 가득 참 - 봉 무시: {}", bar.timestamp)
     
     def _should_reoptimize(self) -> bool:
         """재최적화가 필요한지 확인"""
-        if not self.last_optimization_time:
-            return True
-        
-        now = datetime.now()
+        return datetime.now() >= self._next_reopt_at
+    
+    def _schedule_next_reoptimization(self, now: datetime):
+        """다음 재최적화 시각 계산 (최적화 직후 1회)"""
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
         if self.reoptimize_frequency == "daily":
             # 매일 자정에 재최적화
-            if now.date() > self.last_optimization_time.date():
-                return True
+            self._next_reopt_at = midnight + timedelta(days=1)
         elif self.reoptimize_frequency == "weekly":
             # 매주 월요일 자정에 재최적화
-            if now.isoweekday() == 1 and now.date() > self.last_optimization_time.date():
-                return True
+            self._next_reopt_at = midnight + timedelta(days=(8 - now.isoweekday()) % 7 or 7)
+        else:
+            # on_bar_close: 봉 마감 핸들러에서만 재최적화
+            self._next_reopt_at = datetime.max
+    
+    def _load_optimization_data(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        최적화 윈도우 데이터 로드
+        
+        직전 최적화에서 받은 데이터가 윈도우 안에 있으면 마지막 시점 이후
+        구간만 조회해 이어 붙이고, 윈도우를 벗어난 오래된 행은 잘라낸다.
         
-        return False
+        Args:
+            start_date: 윈도우 시작 시각
+            end_date: 윈도우 종료 시각
+            
+        Returns:
+            윈도우 데이터프레임
+        """
+        if self._data_loader is None:
+            from data.loader import DataLoader
+            self._data_loader = DataLoader(self.config.get("data", {}))
+        
+        cache = self._df_cache
+        cache_end = self._df_cache_end
+        window = timedelta(days=self.optimization_window_days)
+        
+        if cache is not None and cache_end is not None and end_date - cache_end < window:
+            tail = self._data_loader.load(
+                start_date=cache_end.strftime("%Y-%m-%d"),
+                end_date=end_date.strftime("%Y-%m-%d"),
+            )
+            df = pd.concat([cache, tail]) if not tail.empty else cache
+        else:
+            df = self._data_loader.load(
+                start_date=start_date.strftime("%Y-%m-%d"),
+                end_date=end_date.strftime("%Y-%m-%d"),
+            )
+        
+        if df.empty:
+            return df
+        
+        # 중복 봉 제거 및 윈도우 밖 행 정리 (timestamp 컬럼/인덱스 모두 지원)
+        if "timestamp" in df.columns:
+            ts = pd.to_datetime(df["timestamp"])
+            keep = ~ts.duplicated(keep="last") & (ts >= pd.Timestamp(start_date.date()))
+            df = df[keep.to_numpy()].reset_index(drop=True)
+            last = pd.to_datetime(df["timestamp"]).max() if not df.empty else None
+        elif isinstance(df.index, pd.DatetimeIndex):
+            df = df[~df.index.duplicated(keep="last")]
+            df = df[df.index >= pd.Timestamp(start_date.date())]
+            last = df.index.max() if not df.empty else None
+        else:
+            last = None
+        
+        # 시각 정보가 없으면 캐시하지 않음 (다음 주기에 전체 재조회)
+        if last is None or pd.isna(last):
+            self._df_cache = None
+            self._df_cache_end = None
+        else:
+            last = pd.Timestamp(last)
+            if last.tzinfo is not None:
+                last = last.tz_convert(None)
+            self._df_cache = df
+            self._df_cache_end = last.to_pydatetime()
+        
+        return df
     
     def _run_optimization(self):
         """과거 데이터로 최적화 실행"""
@@ -241,14 +539,8 @@ class LiveTrader:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=self.optimization_window_days)
             
-            # 데이터 로드
-            from data.loader import DataLoader
-            data_config = self.config.get("data", {})
-            data_loader = DataLoader(data_config)
-            df = data_loader.load(
-                start_date=start_date.strftime("%Y-%m-%d"),
-                end_date=end_date.strftime("%Y-%m-%d"),
-            )
+            # 데이터 로드 (이전 윈도우를 재사용하고 새 구간만 조회)
+            df = self._load_optimization_data(start_date, end_date)
             
             if df.empty:
                 logger.warning("최적화할 데이터가 없습니다.")
@@ -271,6 +563,11 @@ class LiveTrader:
             best_params = None
             best_score = -999.0
             
+            strategy_config = self.config.get("strategy", {})
+            strategy_name = strategy_config.get("name", "EMA_BB_TurtleTrailing")
+            strategy_cls = StrategyRegistry.get_class(strategy_name)
+            
+            combos: List[Dict[str, Any]] = []
             for i in range(min(20, len(continuous_optimizer.param_combinations))):
                 opt_result = continuous_optimizer.optimize_continuously(
                     start_date.strftime("%Y-%m-%d %H:%M"),
@@ -282,70 +579,80 @@ class LiveTrader:
                 if opt_result["best_params"] is None:
                     break
                 
-                params = opt_result["best_params"]
-                
-                # 백테스트 실행
-                optimized_config = continuous_optimizer.apply_params_to_config(
-                    self.config, params
-                )
-                
-                strategy_config = self.config.get("strategy", {})
-                strategy_name = strategy_config.get("name", "EMA_BB_TurtleTrailing")
-                strategy = StrategyRegistry.get_strategy(strategy_name, optimized_config)
-                
-                backtest_config = self.config.get("backtest", {})
-                engine = BacktestEngine(strategy, backtest_config)
-                result = engine.run(df)
-                
-                if result["trades"].empty:
-                    continue
-                
-                metrics = calculate_metrics(
-                    result["trades"],
-                    result["equity_curve"],
-                    engine.initial_capital,
-                )
-                
-                # 점수 계산 (Sharpe 비율 우선)
-                score = metrics.sharpe_ratio if metrics.sharpe_ratio else -999.0
-                
-                if score > best_score:
+                combos.append(opt_result["best_params"].copy())
+            
+            # 조합별 백테스트 병렬 실행 (데이터는 공유 메모리로 한 번만 전달)
+            scores: List[Optional[float]] = [None] * len(combos)
+            if combos:
+                # 파라미터와 무관한 지표는 스윕 전에 한 번만 계산
+                prepared = BacktestEngine(
+                    strategy_cls(self.config), self.config.get("backtest", {})
+                ).prepare_buffers(df)
+                shm, spec = _share_frame(prepared)
+                try:
+                    max_workers = min(len(combos), os.cpu_count() or 1)
+                    with ProcessPoolExecutor(
+                        max_workers=max_workers, mp_context=_POOL_CONTEXT
+                    ) as executor:
+                        futures = {
+                            executor.submit(
+                                _backtest_params,
+                                spec,
+                                strategy_cls,
+                                self.config,
+                                params,
+                            ): idx
+                            for idx, params in enumerate(combos)
+                        }
+                        for future in as_completed(futures):
+                            scores[futures[future]] = future.result()
+                finally:
+                    shm.close()
+                    shm.unlink()
+            
+            # 조합 순서대로 최고 점수 선택
+            for params, score in zip(combos, scores):
+                if score is not None and score > best_score:
                     best_score = score
                     best_params = params
                     logger.info(f"새로운 최적 파라미터 발견: {params}, Sharpe={score:.2f}")
             
             # 최적 파라미터 적용
             if best_params:
-                logger.info("=" * 60)
-                logger.info("최적 파라미터 업데이트:")
-                logger.info(f"  Fast EMA: {self.current_params['ema_fast']} → {best_params['ema_fast']}")
-                logger.info(f"  Mid EMA: {self.current_params['ema_mid']} → {best_params['ema_mid']}")
-                logger.info(f"  Slow EMA: {self.current_params['ema_slow']} → {best_params['ema_slow']}")
-                logger.info(f"  ATR Multiplier: {self.current_params['atr_multiplier']:.2f} → {best_params['atr_multiplier']:.2f}")
-                logger.info("=" * 60)
+                changed = best_params != self.current_params
                 
-                self.current_params = best_params
-                self.last_optimization_time = datetime.now()
+                if changed:
+                    logger.info("=" * 60)
+                    logger.info("최적 파라미터 업데이트:")
+                    logger.info(f"  Fast EMA: {self.current_params['ema_fast']} → {best_params['ema_fast']}")
+                    logger.info(f"  Mid EMA: {self.current_params['ema_mid']} → {best_params['ema_mid']}")
+                    logger.info(f"  Slow EMA: {self.current_params['ema_slow']} → {best_params['ema_slow']}")
+                    logger.info(f"  ATR Multiplier: {self.current_params['atr_multiplier']:.2f} → {best_params['atr_multiplier']:.2f}")
+                    logger.info("=" * 60)
+                    
+                    self.current_params = best_params
+                    
+                    # 전략 재생성 (파라미터가 바뀐 경우만)
+                    strategy = strategy_cls(self._apply_params_to_config(best_params))
+                    self.backtest_engine = BacktestEngine(strategy, self.config.get("backtest", {}))
+                else:
+                    logger.info(f"최적 파라미터 변경 없음: {best_params}")
                 
-                # 전략 재생성
-                optimized_config = continuous_optimizer.apply_params_to_config(
-                    self.config, best_params
-                )
-                strategy = StrategyRegistry.get_strategy(strategy_name, optimized_config)
-                backtest_config = self.config.get("backtest", {})
-                self.backtest_engine = BacktestEngine(strategy, backtest_config)
+                self.last_optimization_time = datetime.now()
+                self._schedule_next_reoptimization(self.last_optimization_time)
                 
                 # 최적화 이력 저장
                 self.optimization_history.append({
                     "timestamp": datetime.now().isoformat(),
                     "params": best_params.copy(),
                     "score": best_score,
+                    "changed": changed,
                 })
                 
         except Exception as e:
             logger.error(f"최적화 실행 실패: {e}")
     
-    def _process_realtime_bar(self, bar: Dict[str, Any]):
+    def _process_realtime_bar(self, bar: Bar):
         """
         실시간 봉 처리 및 거래 시그널 확인 (정교한 로직)
         
@@ -368,33 +675,34 @@ class LiveTrader:
             # 진입 시그널 확인
             self._check_entry_conditions(bar)
     
-    def _check_entry_conditions(self, bar: Dict[str, Any]):
+    def _check_entry_conditions(self, bar: Bar):
         """진입 조건 확인 (스마트 진입 사용)"""
         # 리스크 가디언 확인
         risk_status = self.risk_guardian.get_risk_status()
         if not risk_status["can_trade"]:
-            logger.info(f"⚠️ 리스크 가디언: 거래 불가 - {risk_status.get('reason', '알 수 없음')}")
+            logger.info("⚠️ 리스크 가디언: 거래 불가 - {}", risk_status.get("reason", "알 수 없음"))
             return
         
         # 봉 데이터를 DataFrame으로 변환 (히스토리 필요)
         # 현재는 단일 봉만 있으므로 실제 전략 실행은 제한적
         # 하지만 진입 조건 체크는 가능
         
-        logger.info(f"🔍 진입 조건 확인 중: {bar.get('timestamp')}, Close: {bar.get('close')}")
-        logger.info(f"   현재 포지션: {'있음' if self.current_position else '없음'}")
-        logger.info(f"   리스크 상태: {risk_status}")
+        # 로그 레벨에서 걸러지면 포맷팅하지 않도록 지연 인자 사용
+        logger.info("🔍 진입 조건 확인 중: {}, Close: {}", bar.timestamp, bar.close)
+        logger.info("   현재 포지션: {}", "있음" if self.current_position else "없음")
+        logger.info("   리스크 상태: {}", risk_status)
         
         # TODO: 실제 전략 시그널 생성 및 진입 로직 구현 필요
         # 현재는 봉 데이터만 받고 있어서 지표 계산이 어려움
         # 웹훅으로 받은 봉 데이터를 누적해서 DataFrame을 만들어야 함
     
-    def _check_exit_conditions(self, bar: Dict[str, Any]):
+    def _check_exit_conditions(self, bar: Bar):
         """청산 조건 확인 (스마트 청산 사용)"""
         if not self.current_position:
             return
         
-        current_price = bar.get("close")
-        current_time = pd.Timestamp(bar.get("timestamp"))
+        current_price = bar.close
+        current_time = bar.timestamp
         
         # 스마트 청산 확인
         # 1. 트레일링 스탑 업데이트
@@ -403,7 +711,7 @@ class LiveTrader:
         # 4. 조기 손절 확인
         
         # 리스크 가디언 확인
-        should_close, reason = self.risk_guardian.should_close_position(
+        should_close, reason, detail = self.risk_guardian.should_close_position(
             self.current_position,
             current_price,
             current_time,
@@ -411,37 +719,36 @@ class LiveTrader:
         )
         
         if should_close:
-            logger.info(f"청산 신호: {reason}")
+            logger.opt(lazy=True).info("청산 신호: {}", lambda: self.risk_guardian.describe(reason, detail))
             # 실제 청산 로직 실행
     
     def _apply_params_to_config(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """파라미터를 설정에 적용"""
-        import copy
-        new_config = copy.deepcopy(self.config)
-        
-        # EMA 기간 적용
-        indicators_config = new_config.setdefault("indicators", {})
-        ema_config = indicators_config.setdefault("ema", {})
-        ema_config["periods"] = [
-            params.get("ema_fast", 20),
-            params.get("ema_mid", 40),
-            params.get("ema_slow", 80),
-        ]
-        
-        # ATR multiplier 적용
-        strategy_config = new_config.setdefault("strategy", {})
-        exit_config = strategy_config.setdefault("exit", {})
-        stop_loss_config = exit_config.setdefault("stop_loss", {})
-        stop_loss_config["atr_multiplier"] = params.get("atr_multiplier", 2.0)
-        
-        return new_config
+        return ContinuousOptimizer.apply_params_to_config(self.config, params)
     
     def stop(self):
         """거래 중지"""
         logger.info("거래 중지 중...")
         self.is_trading = False
-        self.stop_event.set()
-        self.realtime_feed.stop()
+        with self._shutdown_cond:
+            self._stopping = True
+            self._shutdown_cond.notify_all()
+        
+        # 대기 중인 워커 깨우기 (종료 센티널)
+        for work_queue in (self._signal_queue, self._opt_queue):
+            try:
+                work_queue.put_nowait(None)
+            except Full:
+                pass
+        
+        # 워커 종료 대기 (최적화 중인 워커는 시간 제한 후 남겨 둠 - 재시작 시 재사용)
+        for worker in self._workers:
+            if worker is not current_thread():
+                worker.join(timeout=self._worker_join_timeout)
+        
+        if self._feed_started:
+            self.realtime_feed.stop()
+            self._feed_started = False
         logger.info("거래 중지 완료")
     
     def get_status(self) -> Dict[str, Any]:
@@ -451,5 +758,6 @@ class LiveTrader:
             "current_params": self.current_params,
             "last_optimization": self.last_optimization_time.isoformat() if self.last_optimization_time else None,
             "optimization_count": len(self.optimization_history),
+            "dropped_bars": self._dropped_bars,
         }
 
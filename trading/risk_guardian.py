@@ -1,7 +1,10 @@
 """리스크 가디언 모듈 - 실전 거래를 위한 정교한 리스크 관리"""
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, NamedTuple
+from datetime import date, datetime, time as dt_time, timedelta
+from collections import deque
+from enum import IntEnum
+import time
 from analytics.metrics import PerformanceMetrics
 from utils.logger import get_logger
 import pandas as pd
@@ -9,6 +12,48 @@ import pandas as pd
 logger = get_logger(__name__)
 
 
+class RiskStatus(IntEnum):
+    """리스크 확인 결과 코드 (사유 문자열은 describe(결과 코드, 값)로 필요할 때만 생성)"""
+    OK = 0
+    DAILY_LOSS = 1
+    TRADE_LIMIT = 2
+    CONSEC_LOSS = 3
+    DRAWDOWN = 4
+    VOLATILITY = 5
+    VOLUME_LOW = 6
+    STOP_LOSS = 7
+    MAX_DURATION = 8
+
+
+# 결과 코드별 사유 템플릿 (값은 확인 결과와 함께 반환되는 detail 튜플)
+_STATUS_FMT = {
+    RiskStatus.OK: "OK",
+    RiskStatus.DAILY_LOSS: "일일 손실 한도 도달: {:.2f}",
+    RiskStatus.TRADE_LIMIT: "일일 거래 수 제한 도달: {}회",
+    RiskStatus.CONSEC_LOSS: "연속 손실 한도 도달: {}회",
+    RiskStatus.DRAWDOWN: "최대 드로다운 도달: {:.1%}",
+    RiskStatus.VOLATILITY: "변동성 과다: {:.2f}x 평균",
+    RiskStatus.VOLUME_LOW: "거래량 부족: {:.2f}x 평균",
+    RiskStatus.STOP_LOSS: "스탑로스 도달: {:.2f} {} {:.2f}",
+    RiskStatus.MAX_DURATION: "최대 보유 시간 초과: {}",
+}
+
+
+class _DailyStats(NamedTuple):
+    """일일 통계 스냅샷 (통째로 교체해 조회 스레드가 항상 일관된 값을 읽음)"""
+    date: date
+    end: float  # 다음 현지 자정 (유닉스 초) - 이 시각 이후 조회는 새 날(0)로 봄
+    pnl: float
+    trades: int
+
+
+def _day_stats(now: float) -> _DailyStats:
+    """now가 속한 현지 날짜의 빈 일일 통계"""
+    today = datetime.fromtimestamp(now).date()
+    end = datetime.combine(today + timedelta(days=1), dt_time.min).timestamp()
+    return _DailyStats(today, end, 0.0, 0)
+
+
 class RiskGuardian:
     """리스크 가디언 클래스 - 실전 거래 보호"""
     
@@ -35,21 +80,24 @@ class RiskGuardian:
         self.initial_capital = risk_config.get("initial_capital", 100000)
         self.peak_equity = self.initial_capital
         
+        # 일일 손실 한도 (절대 금액, 음수)
+        self._daily_loss_threshold = -self.daily_loss_limit * self.initial_capital
+        
         # 거래 시간 제한
         self.max_position_duration_hours = risk_config.get("max_position_duration_hours", 24)
         
         # 변동성 필터
         self.volatility_filter = risk_config.get("volatility_filter", {})
         self.max_volatility_multiplier = self.volatility_filter.get("max_multiplier", 3.0)
+        self._ewma_vol = 0.0  # ATR/가격 지수이동평균 (기록 전에는 0 → 필터 비활성)
+        self._ewma_alpha = 2.0 / (self.volatility_filter.get("ewma_period", 20) + 1)
         
-        # 일일 통계
-        self.daily_pnl = 0.0
-        self.daily_trades = 0
-        self.current_date = datetime.now().date()
+        # 일일 통계 (현지 자정 기준, 다음 자정 시각을 캐시해 조회는 시각 비교 한 번)
+        self._daily = _day_stats(time.time())
         
         # 거래 이력
-        self.recent_trades: List[Dict[str, Any]] = []
         self.max_recent_trades = 100
+        self.recent_trades: deque = deque(maxlen=self.max_recent_trades)
         
         logger.info("리스크 가디언 초기화 완료")
         logger.info(f"일일 손실 한도: {self.daily_loss_limit:.1%}")
@@ -63,7 +111,7 @@ class RiskGuardian:
         atr_value: float,
         volume: float,
         volume_ma: float,
-    ) -> tuple[bool, str]:
+    ) -> tuple[bool, RiskStatus, tuple]:
         """
         포지션 오픈 가능 여부 확인
         
@@ -75,24 +123,27 @@ class RiskGuardian:
             volume_ma: 거래량 이동평균
             
         Returns:
-            (가능 여부, 이유)
+            (가능 여부, 결과 코드, 사유 값) - 사유 문자열은 describe(결과 코드, 사유 값)
         """
-        # 일일 손실 한도 확인
-        if self.daily_pnl <= -self.daily_loss_limit * self.initial_capital:
-            return False, f"일일 손실 한도 도달: {self.daily_pnl:.2f}"
+        daily_pnl, daily_trades = self._today_stats()
         
+        # 정수 카운터 확인 먼저 (가장 저렴)
         # 일일 거래 수 제한
-        if self.daily_trades >= self.daily_trade_limit:
-            return False, f"일일 거래 수 제한 도달: {self.daily_trades}회"
+        if daily_trades >= self.daily_trade_limit:
+            return False, RiskStatus.TRADE_LIMIT, (daily_trades,)
         
         # 연속 손실 확인
         if self.consecutive_losses >= self.max_consecutive_losses:
-            return False, f"연속 손실 한도 도달: {self.consecutive_losses}회"
+            return False, RiskStatus.CONSEC_LOSS, (self.consecutive_losses,)
+        
+        # 일일 손실 한도 확인
+        if daily_pnl <= self._daily_loss_threshold:
+            return False, RiskStatus.DAILY_LOSS, (daily_pnl,)
         
         # 드로다운 확인
         drawdown = (self.peak_equity - current_equity) / self.peak_equity
         if drawdown >= self.max_drawdown_limit:
-            return False, f"최대 드로다운 도달: {drawdown:.1%}"
+            return False, RiskStatus.DRAWDOWN, (drawdown,)
         
         # 변동성 필터 (ATR 기반)
         if atr_value > 0:
@@ -101,15 +152,29 @@ class RiskGuardian:
             if avg_volatility > 0:
                 volatility_ratio = price_volatility / avg_volatility
                 if volatility_ratio > self.max_volatility_multiplier:
-                    return False, f"변동성 과다: {volatility_ratio:.2f}x 평균"
+                    return False, RiskStatus.VOLATILITY, (volatility_ratio,)
         
         # 거래량 필터
         if volume_ma > 0:
             volume_ratio = volume / volume_ma
             if volume_ratio < 0.5:  # 거래량이 평균의 50% 미만
-                return False, f"거래량 부족: {volume_ratio:.2f}x 평균"
+                return False, RiskStatus.VOLUME_LOW, (volume_ratio,)
         
-        return True, "OK"
+        return True, RiskStatus.OK, ()
+    
+    @staticmethod
+    def describe(status: RiskStatus, detail: tuple = ()) -> str:
+        """
+        결과 코드의 사유 문자열 생성 (로깅 시에만 호출)
+        
+        Args:
+            status: can_open_position / should_close_position 결과 코드
+            detail: 같은 확인 결과와 함께 반환된 사유 값
+            
+        Returns:
+            사유 문자열
+        """
+        return _STATUS_FMT[status].format(*detail)
     
     def calculate_safe_position_size(
         self,
@@ -180,7 +245,7 @@ class RiskGuardian:
         current_price: float,
         current_time: Any,  # datetime
         current_equity: float,
-    ) -> tuple[bool, str]:
+    ) -> tuple[bool, RiskStatus, tuple]:
         """
         포지션 청산 필요 여부 확인
         
@@ -191,31 +256,34 @@ class RiskGuardian:
             current_equity: 현재 자산
             
         Returns:
-            (청산 필요 여부, 이유)
+            (청산 필요 여부, 결과 코드, 사유 값) - 사유 문자열은 describe(결과 코드, 사유 값)
         """
         # 스탑로스 확인
         if position.direction == "long":
             if current_price <= position.stop_loss:
-                return True, f"스탑로스 도달: {current_price:.2f} <= {position.stop_loss:.2f}"
+                return True, RiskStatus.STOP_LOSS, (current_price, "<=", position.stop_loss)
         else:
             if current_price >= position.stop_loss:
-                return True, f"스탑로스 도달: {current_price:.2f} >= {position.stop_loss:.2f}"
+                return True, RiskStatus.STOP_LOSS, (current_price, ">=", position.stop_loss)
         
         # 최대 보유 시간 확인
         position_duration = current_time - position.entry_time
         if position_duration.total_seconds() / 3600 > self.max_position_duration_hours:
-            return True, f"최대 보유 시간 초과: {position_duration}"
+            return True, RiskStatus.MAX_DURATION, (position_duration,)
         
         # 일일 손실 한도 확인 (포지션 포함)
-        if self.daily_pnl <= -self.daily_loss_limit * self.initial_capital:
-            return True, "일일 손실 한도 도달"
+        daily_pnl = self.daily_pnl
+        if daily_pnl <= self._daily_loss_threshold:
+            return True, RiskStatus.DAILY_LOSS, (daily_pnl,)
         
-        return False, "OK"
+        return False, RiskStatus.OK, ()
     
     def update_after_trade(
         self,
         trade_result: Dict[str, Any],
         current_equity: float,
+        atr_value: float = 0.0,
+        price: float = 0.0,
     ):
         """
         거래 후 상태 업데이트
@@ -223,18 +291,19 @@ class RiskGuardian:
         Args:
             trade_result: 거래 결과
             current_equity: 현재 자산
+            atr_value: 거래 시점 ATR (변동성 평균 갱신용, 선택)
+            price: 거래 시점 가격 (변동성 평균 갱신용, 선택)
         """
-        # 일일 통계 업데이트
-        today = datetime.now().date()
-        if today != self.current_date:
-            # 새 날 시작
-            self.daily_pnl = 0.0
-            self.daily_trades = 0
-            self.current_date = today
+        self.record_volatility(atr_value, price)
+        
+        # 일일 통계 업데이트 (자정을 지났으면 새 날 통계로 시작)
+        now = time.time()
+        daily = self._daily
+        if now >= daily.end:
+            daily = _day_stats(now)
         
         pnl = trade_result.get("pnl", 0.0)
-        self.daily_pnl += pnl
-        self.daily_trades += 1
+        self._daily = daily._replace(pnl=daily.pnl + pnl, trades=daily.trades + 1)
         
         # 연속 손실 업데이트
         if pnl < 0:
@@ -243,37 +312,70 @@ class RiskGuardian:
             self.consecutive_losses = 0
         
         # 피크 자산 업데이트
-        if current_equity > self.peak_equity:
-            self.peak_equity = current_equity
+        self.peak_equity = max(self.peak_equity, current_equity)
         
-        # 거래 이력 추가
+        # 거래 이력 추가 (최근 거래만 유지)
         self.recent_trades.append({
-            "timestamp": datetime.now(),
+            "timestamp": int(now),  # 유닉스 초 (datetime 변환은 조회 시)
             "pnl": pnl,
             "direction": trade_result.get("direction"),
         })
+    
+    def _today_stats(self) -> tuple:
+        """오늘(현지 날짜) 일일 통계 (손익, 거래 수) - 캐시된 자정 시각과 비교만 함"""
+        daily = self._daily
+        if time.time() >= daily.end:
+            return 0.0, 0
+        return daily.pnl, daily.trades
+    
+    @property
+    def daily_pnl(self) -> float:
+        """오늘(현지 날짜) 누적 손익"""
+        return self._today_stats()[0]
+    
+    @property
+    def daily_trades(self) -> int:
+        """오늘(현지 날짜) 거래 수"""
+        return self._today_stats()[1]
+    
+    @property
+    def current_date(self) -> date:
+        """현재 일일 통계 기준 날짜 (현지 날짜, 마지막 거래일)"""
+        return self._daily.date
+    
+    def record_volatility(self, atr_value: float, price: float):
+        """
+        변동성(ATR/가격) 지수이동평균 갱신 - O(1)
+        
+        Args:
+            atr_value: ATR 값
+            price: 가격
+        """
+        if not (atr_value > 0 and price > 0):  # 0, 음수, NaN(지표 워밍업 구간) 제외
+            return
         
-        # 최근 거래만 유지
-        if len(self.recent_trades) > self.max_recent_trades:
-            self.recent_trades.pop(0)
+        volatility = atr_value / price
+        if self._ewma_vol == 0.0:
+            self._ewma_vol = volatility
+        else:
+            self._ewma_vol += self._ewma_alpha * (volatility - self._ewma_vol)
     
     def _get_average_volatility(self) -> float:
-        """평균 변동성 계산 (최근 거래 기반)"""
-        if not self.recent_trades:
-            return 0.0
-        
-        # 최근 20개 거래의 변동성 평균
-        # 실제로는 ATR의 이동평균을 사용해야 함
-        return 0.02  # 기본값 2%
+        """평균 변동성 (ATR/가격 지수이동평균, 기록이 없으면 0)"""
+        return self._ewma_vol
     
     def get_risk_status(self) -> Dict[str, Any]:
         """현재 리스크 상태 반환"""
+        # 거래 스레드가 갱신 중일 수 있으므로 필드를 한 번씩만 읽어 일관된 값으로 구성
+        daily_pnl, daily_trades = self._today_stats()
+        consecutive_losses = self.consecutive_losses
+        peak_equity = self.peak_equity
         return {
-            "daily_pnl": self.daily_pnl,
-            "daily_trades": self.daily_trades,
-            "consecutive_losses": self.consecutive_losses,
-            "peak_equity": self.peak_equity,
-            "current_drawdown": (self.peak_equity - self.initial_capital) / self.initial_capital if self.peak_equity > 0 else 0.0,
-            "can_trade": self.consecutive_losses < self.max_consecutive_losses and self.daily_trades < self.daily_trade_limit,
+            "daily_pnl": daily_pnl,
+            "daily_trades": daily_trades,
+            "consecutive_losses": consecutive_losses,
+            "peak_equity": peak_equity,
+            "current_drawdown": (peak_equity - self.initial_capital) / self.initial_capital if peak_equity > 0 else 0.0,
+            "can_trade": consecutive_losses < self.max_consecutive_losses and daily_trades < self.daily_trade_limit,
         }
 
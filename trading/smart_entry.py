@@ -3,11 +3,241 @@
 from typing import Dict, Any, Optional
 import pandas as pd
 import numpy as np
-from strategy.base_strategy import Regime, Signal
+from strategy.base_strategy import Regime, Signal, SignalType
+from utils.jit import njit, prange, HAS_NUMBA
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 평가 항목 가중치 (레짐, 트렌드, 거래량, 모멘텀, 지지/저항)
+_WEIGHTS = np.array([0.3, 0.25, 0.2, 0.15, 0.1])
+
+# _score_bar 결과 코드
+_SCORE_OK = 0
+_SCORE_REGIME = 1
+_SCORE_TREND = 2
+_SCORE_VOLUME = 3
+_SCORE_LOW_CONFIDENCE = 4
+
+_REJECT_REASONS = {
+    _SCORE_REGIME: "레짐 불확실",
+    _SCORE_TREND: "트렌드 불일치",
+    _SCORE_VOLUME: "거래량 부족",
+}
+
+# 진입 이유 비트 (평가 순서대로)
+_REASON_BITS = (
+    (1, "강한 레짐 확인"),
+    (2, "트렌드 정렬 우수"),
+    (4, "거래량 증가"),
+    (8, "강한 모멘텀"),
+    (16, "지지/저항 확인"),
+)
+
+_EMPTY_F8 = np.empty(0)
+
+
+def _as_f8(series: pd.Series) -> np.ndarray:
+    """커널 입력용 쓰기 가능한 연속 float64 배열"""
+    return np.array(series.to_numpy(dtype=np.float64), dtype=np.float64, copy=True)
+
+
+def _signal_directions(signals: Any) -> np.ndarray:
+    """봉별 시그널을 방향 배열로 변환 (Signal은 한 번만 문자열 검사)"""
+    direction = np.asarray(signals)
+    if direction.dtype != object:
+        return direction
+    return np.array(
+        [
+            0 if s is None or s.type == SignalType.NO_ACTION
+            else (1 if s.type.value.startswith("long") else -1)
+            for s in direction
+        ],
+        dtype=np.int8,
+    )
+
+
+@njit(
+    "Tuple((int64, float64, int64))(int64, boolean, " + ", ".join(["float64[::1]"] * 9)
+    + ", float64[::1], float64[::1], float64, boolean, boolean, boolean)",
+    cache=True,
+    error_model="numpy",
+)
+def _score_bar(
+    idx,
+    is_long,
+    close,
+    rolling_high,
+    rolling_low,
+    inv_rolling_high,
+    inv_rolling_low,
+    volume,
+    volume_ma,
+    ema_fast,
+    ema_slow,
+    regime_consistency,
+    weights,
+    min_confidence,
+    require_regime,
+    require_trend,
+    require_volume,
+):
+    """
+    봉 하나의 진입 품질 점수 커널 - (결과 코드, 신뢰도, 이유 비트) 반환
+    
+    빈 배열은 해당 컬럼이 없음을 뜻한다 (해당 항목은 중립 점수 0.5).
+    """
+    confidence = 0.0
+    reason_bits = 0
+    
+    # 1. 레짐 확인 - 최근 5바 중 목표 레짐 비율
+    if require_regime:
+        score = 0.5 if idx < 5 else regime_consistency[idx]
+        confidence += score * weights[0]
+        if score > 0.8:
+            reason_bits |= 1
+        elif score < 0.5:
+            return _SCORE_REGIME, 0.0, 0
+    
+    # 2. 트렌드 정렬 확인 - EMA 정렬과 기울기
+    if require_trend:
+        if idx < 2 or ema_fast.shape[0] == 0 or ema_slow.shape[0] == 0:
+            score = 0.5
+        else:
+            fast = ema_fast[idx]
+            slow = ema_slow[idx]
+            prev_fast = ema_fast[idx - 1]
+            prev_slow = ema_slow[idx - 1]
+            if is_long:
+                alignment = 1.0 if fast > slow else 0.0
+                momentum = 1.0 if fast > prev_fast and slow > prev_slow else 0.5
+            else:
+                alignment = 1.0 if fast < slow else 0.0
+                momentum = 1.0 if fast < prev_fast and slow < prev_slow else 0.5
+            score = (alignment + momentum) / 2.0
+        confidence += score * weights[1]
+        if score > 0.8:
+            reason_bits |= 2
+        elif score < 0.5:
+            return _SCORE_TREND, 0.0, 0
+    
+    # 3. 거래량 확인 - 평균 대비 비율 구간
+    if require_volume:
+        if idx < 20 or volume.shape[0] == 0 or volume_ma.shape[0] == 0 or volume_ma[idx] == 0:
+            score = 0.5
+        else:
+            ratio = volume[idx] / volume_ma[idx]
+            if ratio >= 1.2:
+                score = 1.0
+            elif ratio >= 0.8:
+                score = 0.7
+            elif ratio >= 0.5:
+                score = 0.5
+            else:
+                score = 0.3
+        confidence += score * weights[2]
+        if score > 0.8:
+            reason_bits |= 4
+        elif score < 0.5:
+            return _SCORE_VOLUME, 0.0, 0
+    
+    # 4. 모멘텀 확인 - 5바 가격 변화율 (max(0, min(1, x))와 동일, NaN은 1.0)
+    if idx < 5:
+        score = 0.5
+    else:
+        change = (close[idx] - close[idx - 5]) / close[idx - 5] * 100
+        if not is_long:
+            change = -change
+        score = change if change < 1.0 else 1.0
+        score = score if score > 0.0 else 0.0
+    confidence += score * weights[3]
+    if score > 0.8:
+        reason_bits |= 8
+    
+    # 5. 지지/저항 확인 - 최근 21바 저점(롱)/고점(숏)과의 거리
+    if idx < 20:
+        score = 0.5
+    else:
+        if is_long:
+            distance = abs(close[idx] - rolling_low[idx]) * inv_rolling_low[idx]
+        else:
+            distance = abs(close[idx] - rolling_high[idx]) * inv_rolling_high[idx]
+        if distance < 0.01:
+            score = 1.0
+        elif distance < 0.02:
+            score = 0.7
+        else:
+            score = 0.5
+    confidence += score * weights[4]
+    if score > 0.8:
+        reason_bits |= 16
+    
+    if confidence < min_confidence:
+        return _SCORE_LOW_CONFIDENCE, confidence, reason_bits
+    return _SCORE_OK, confidence, reason_bits
+
+
+@njit(
+    "void(int8[::1], int64, " + ", ".join(["float64[::1]"] * 11)
+    + ", float64[::1], float64, boolean, boolean, boolean, boolean[::1], float64[::1])",
+    cache=True,
+    parallel=True,
+)
+def _score_bars(
+    direction,
+    confirmation_bars,
+    close,
+    rolling_high,
+    rolling_low,
+    inv_rolling_high,
+    inv_rolling_low,
+    volume,
+    volume_ma,
+    ema_fast,
+    ema_slow,
+    regime_bull_consistency,
+    regime_bear_consistency,
+    weights,
+    min_confidence,
+    require_regime,
+    require_trend,
+    require_volume,
+    allowed,
+    confidence,
+):
+    """
+    전체 봉 점수 커널 - 봉마다 독립적인 _score_bar를 코어별로 병렬 실행
+    
+    결과는 미리 할당된 allowed / confidence 배열에 기록한다.
+    """
+    for i in prange(direction.shape[0]):
+        if i < confirmation_bars or direction[i] == 0:
+            allowed[i] = False
+            confidence[i] = 0.0
+            continue
+        is_long = direction[i] > 0
+        status, conf, _ = _score_bar(
+            i,
+            is_long,
+            close,
+            rolling_high,
+            rolling_low,
+            inv_rolling_high,
+            inv_rolling_low,
+            volume,
+            volume_ma,
+            ema_fast,
+            ema_slow,
+            regime_bull_consistency if is_long else regime_bear_consistency,
+            weights,
+            min_confidence,
+            require_regime,
+            require_trend,
+            require_volume,
+        )
+        allowed[i] = status == _SCORE_OK
+        confidence[i] = conf if status == _SCORE_OK or status == _SCORE_LOW_CONFIDENCE else 0.0
+
 
 class SmartEntry:
     """스마트 진입 클래스 - 승률 최대화"""
@@ -32,6 +262,26 @@ class SmartEntry:
         # 다중 확인 (여러 바에 걸쳐 확인)
         self.confirmation_bars = self.filters.get("confirmation_bars", 2)  # 2바 확인
         
+        # EMA/거래량 MA 컬럼 이름 (첫 평가 시 한 번만 탐색)
+        self._cols_resolved = False
+        self._ema_fast_col: Optional[str] = None
+        self._ema_slow_col: Optional[str] = None
+        self._volume_ma_col: Optional[str] = None
+        
+        # 평가 중인 데이터프레임의 컬럼 배열 (prepare() 또는 다른 데이터프레임이 들어오면 다시 바인딩)
+        self._bound_df: Optional[pd.DataFrame] = None
+        self._close: Optional[np.ndarray] = None
+        self._volume: Optional[np.ndarray] = None
+        self._volume_ma: Optional[np.ndarray] = None
+        self._ema_fast: Optional[np.ndarray] = None
+        self._ema_slow: Optional[np.ndarray] = None
+        self._regime_bull_consistency: Optional[np.ndarray] = None  # 최근 5바 중 BULL 비율
+        self._regime_bear_consistency: Optional[np.ndarray] = None  # 최근 5바 중 BEAR 비율
+        self._rolling_high: Optional[np.ndarray] = None  # 최근 21바 고점
+        self._rolling_low: Optional[np.ndarray] = None  # 최근 21바 저점
+        self._inv_rolling_high: Optional[np.ndarray] = None  # 1 / 최근 21바 고점
+        self._inv_rolling_low: Optional[np.ndarray] = None  # 1 / 최근 21바 저점
+        
         logger.info("스마트 진입 초기화 완료")
         logger.info(f"최소 신뢰도: {self.min_confidence:.1%}")
         logger.info(f"확인 바 수: {self.confirmation_bars}")
@@ -58,210 +308,236 @@ class SmartEntry:
         if idx < self.confirmation_bars:
             return False, 0.0, "확인 바 수 부족"
         
-        confidence = 0.0
-        reasons = []
-        
-        # 1. 레짐 확인 (30%)
-        if self.require_regime_confirmation:
-            regime_score = self._check_regime_quality(df, idx, signal, regime)
-            confidence += regime_score * 0.3
-            if regime_score > 0.8:
-                reasons.append("강한 레짐 확인")
-            elif regime_score < 0.5:
-                return False, 0.0, "레짐 불확실"
-        
-        # 2. 트렌드 정렬 확인 (25%)
-        if self.require_trend_alignment:
-            trend_score = self._check_trend_alignment(df, idx, signal)
-            confidence += trend_score * 0.25
-            if trend_score > 0.8:
-                reasons.append("트렌드 정렬 우수")
-            elif trend_score < 0.5:
-                return False, 0.0, "트렌드 불일치"
-        
-        # 3. 거래량 확인 (20%)
-        if self.require_volume_confirmation:
-            volume_score = self._check_volume_quality(df, idx)
-            confidence += volume_score * 0.2
-            if volume_score > 0.8:
-                reasons.append("거래량 증가")
-            elif volume_score < 0.5:
-                return False, 0.0, "거래량 부족"
-        
-        # 4. 모멘텀 확인 (15%)
-        momentum_score = self._check_momentum(df, idx, signal)
-        confidence += momentum_score * 0.15
-        if momentum_score > 0.8:
-            reasons.append("강한 모멘텀")
-        
-        # 5. 지지/저항 확인 (10%)
-        support_resistance_score = self._check_support_resistance(df, idx, signal)
-        confidence += support_resistance_score * 0.1
-        if support_resistance_score > 0.8:
-            reasons.append("지지/저항 확인")
-        
-        # 최소 신뢰도 확인
-        if confidence < self.min_confidence:
+        # 다른 데이터프레임이거나 같은 객체에 행이 추가/삭제되었으면 다시 바인딩
+        # (커널은 경계 검사를 하지 않으므로 길이가 다르면 반드시 갱신)
+        if df is not self._bound_df or len(df) != len(self._close):
+            self._bind_arrays(df)
+        
+        is_long = signal.type.value.startswith("long")
+        status, confidence, reason_bits = _score_bar(
+            idx,
+            is_long,
+            self._close,
+            self._rolling_high,
+            self._rolling_low,
+            self._inv_rolling_high,
+            self._inv_rolling_low,
+            self._volume,
+            self._volume_ma,
+            self._ema_fast,
+            self._ema_slow,
+            self._regime_bull_consistency if is_long else self._regime_bear_consistency,
+            _WEIGHTS,
+            self.min_confidence,
+            self.require_regime_confirmation,
+            self.require_trend_alignment,
+            self.require_volume_confirmation,
+        )
+        
+        if status == _SCORE_LOW_CONFIDENCE:
             return False, confidence, f"신뢰도 부족: {confidence:.1%} < {self.min_confidence:.1%}"
+        if status != _SCORE_OK:
+            return False, 0.0, _REJECT_REASONS[status]
         
+        reasons = [text for bit, text in _REASON_BITS if reason_bits & bit]
         reason_str = ", ".join(reasons) if reasons else "기본 조건 만족"
         return True, confidence, reason_str
     
-    def _check_regime_quality(
+    def evaluate_entry_quality_batch(
         self,
         df: pd.DataFrame,
-        idx: int,
-        signal: Signal,
-        regime: Regime,
-    ) -> float:
-        """레짐 품질 확인"""
-        if idx < 5:
-            return 0.5
-        
-        # 최근 5바의 레짐 일관성 확인
-        recent_regimes = []
-        for i in range(max(0, idx - 4), idx + 1):
-            if "regime" in df.columns:
-                recent_regimes.append(df.iloc[i].get("regime"))
+        signals: Any,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        전체 봉에 대한 진입 품질 일괄 평가 (evaluate_entry_quality와 동일한 결과)
         
-        # 레짐 일관성 계산
-        if signal.type.value.startswith("long"):
-            target_regime = Regime.BULL
-        else:
-            target_regime = Regime.BEAR
+        Args:
+            df: 데이터프레임
+            signals: 봉별 시그널 방향 (1: 롱, -1: 숏, 0: 시그널 없음) 또는 봉별 Signal/None
+            
+        Returns:
+            (진입 가능 여부 배열, 신뢰도 배열)
+        """
+        n = len(df)
+        direction = _signal_directions(signals)
+        is_long = direction > 0
+        idx = np.arange(n)
+        self._bind_arrays(df)  # 일괄 평가는 항상 현재 데이터로 다시 바인딩
+        
+        if HAS_NUMBA:
+            # 봉 단위 커널을 전체 봉에 병렬 적용
+            allowed = np.empty(n, dtype=np.bool_)
+            confidence = np.empty(n)
+            _score_bars(
+                np.sign(direction).astype(np.int8),
+                self.confirmation_bars,
+                self._close,
+                self._rolling_high,
+                self._rolling_low,
+                self._inv_rolling_high,
+                self._inv_rolling_low,
+                self._volume,
+                self._volume_ma,
+                self._ema_fast,
+                self._ema_slow,
+                self._regime_bull_consistency,
+                self._regime_bear_consistency,
+                _WEIGHTS,
+                self.min_confidence,
+                self.require_regime_confirmation,
+                self.require_trend_alignment,
+                self.require_volume_confirmation,
+                allowed,
+                confidence,
+            )
+            return allowed, confidence
+        
+        # numba가 없으면 NumPy 벡터 연산으로 계산
+        close = self._close
+        # 항목별 점수 행렬 (비활성 항목은 0으로 두어 가중합에서 빠짐)
+        scores = np.zeros((n, len(_WEIGHTS)))
+        rejected = (idx < self.confirmation_bars) | (direction == 0)
+        
+        # 1. 레짐 확인 (30%) - 최근 5바 중 목표 레짐 비율
+        if self.require_regime_confirmation:
+            regime_score = np.where(is_long, self._regime_bull_consistency, self._regime_bear_consistency)
+            regime_score = np.where(idx < 5, 0.5, regime_score)
+            scores[:, 0] = regime_score
+            rejected |= regime_score < 0.5
         
-        consistent_count = sum(1 for r in recent_regimes if r == target_regime)
-        consistency = consistent_count / len(recent_regimes) if recent_regimes else 0.0
+        # 2. 트렌드 정렬 확인 (25%)
+        if self.require_trend_alignment:
+            if len(self._ema_fast) == 0 or len(self._ema_slow) == 0:
+                trend_score = np.full(n, 0.5)
+            else:
+                fast = self._ema_fast
+                slow = self._ema_slow
+                prev_fast = np.concatenate(([np.nan], fast[:-1]))
+                prev_slow = np.concatenate(([np.nan], slow[:-1]))
+                alignment = np.where(
+                    is_long, np.where(fast > slow, 1.0, 0.0), np.where(fast < slow, 1.0, 0.0),
+                )
+                momentum = np.where(
+                    is_long,
+                    np.where((fast > prev_fast) & (slow > prev_slow), 1.0, 0.5),
+                    np.where((fast < prev_fast) & (slow < prev_slow), 1.0, 0.5),
+                )
+                trend_score = (alignment + momentum) / 2.0
+            trend_score = np.where(idx < 2, 0.5, trend_score)
+            scores[:, 1] = trend_score
+            rejected |= trend_score < 0.5
         
-        return consistency
+        # 3. 거래량 확인 (20%)
+        if self.require_volume_confirmation:
+            if len(self._volume) == 0 or len(self._volume_ma) == 0:
+                volume_score = np.full(n, 0.5)
+            else:
+                volume = self._volume
+                volume_ma = self._volume_ma
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ratio = volume / volume_ma
+                volume_score = np.select([ratio >= 1.2, ratio >= 0.8, ratio >= 0.5], [1.0, 0.7, 0.5], default=0.3)
+                volume_score = np.where(volume_ma == 0, 0.5, volume_score)
+            volume_score = np.where(idx < 20, 0.5, volume_score)
+            scores[:, 2] = volume_score
+            rejected |= volume_score < 0.5
+        
+        # 4. 모멘텀 확인 (15%) - 5바 가격 변화율
+        base = np.concatenate((np.full(min(5, n), np.nan), close[:-5]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = (close - base) / base * 100
+        change = np.where(is_long, change, -change)
+        # max(0, min(1, x))와 동일 (NaN은 1.0)
+        momentum_score = np.where(change < 1.0, change, 1.0)
+        momentum_score = np.where(momentum_score > 0.0, momentum_score, 0.0)
+        momentum_score = np.where(idx < 5, 0.5, momentum_score)
+        scores[:, 3] = momentum_score
+        
+        # 5. 지지/저항 확인 (10%) - 최근 21바 고점/저점과의 거리
+        level = np.where(is_long, self._rolling_low, self._rolling_high)
+        inv_level = np.where(is_long, self._inv_rolling_low, self._inv_rolling_high)
+        with np.errstate(invalid="ignore"):
+            distance = np.abs(close - level) * inv_level
+        sr_score = np.select([distance < 0.01, distance < 0.02], [1.0, 0.7], default=0.5)
+        sr_score = np.where(idx < 20, 0.5, sr_score)
+        scores[:, 4] = sr_score
+        
+        # 조기 거절된 행은 제외하고 가중합 (항목 순서대로 누적해 봉 단위 평가와 동일한 값)
+        confidence = np.zeros(n)
+        keep = ~rejected
+        confidence[keep] = (scores[keep] * _WEIGHTS).sum(axis=1)
+        allowed = ~rejected & (confidence >= self.min_confidence)
+        return allowed, confidence
     
-    def _check_trend_alignment(
-        self,
-        df: pd.DataFrame,
-        idx: int,
-        signal: Signal,
-    ) -> float:
-        """트렌드 정렬 확인"""
-        if idx < 2:
-            return 0.5
+    def _resolve_columns(self, df: pd.DataFrame) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        EMA(빠름/느림) 및 거래량 MA 컬럼 이름 탐색
         
-        # EMA 정렬 확인
+        Args:
+            df: 데이터프레임
+            
+        Returns:
+            (빠른 EMA 컬럼, 느린 EMA 컬럼, 거래량 MA 컬럼) - 없으면 None
+        """
         ema_fast_col = None
         ema_slow_col = None
+        volume_ma_col = None
         
         for col in df.columns:
-            if "EMA" in col and "20" in col or "fast" in col.lower():
+            if ("EMA" in col and "20" in col) or "fast" in col.lower():
                 ema_fast_col = col
             if "EMA" in col and ("80" in col or "slow" in col.lower()):
                 ema_slow_col = col
-        
-        if ema_fast_col is None or ema_slow_col is None:
-            return 0.5
-        
-        current_fast = df.iloc[idx][ema_fast_col]
-        current_slow = df.iloc[idx][ema_slow_col]
-        prev_fast = df.iloc[idx - 1][ema_fast_col]
-        prev_slow = df.iloc[idx - 1][ema_slow_col]
-        
-        if signal.type.value.startswith("long"):
-            # Long: fast > slow 이고 상승 중
-            alignment = 1.0 if current_fast > current_slow else 0.0
-            momentum = 1.0 if current_fast > prev_fast and current_slow > prev_slow else 0.5
-        else:
-            # Short: fast < slow 이고 하락 중
-            alignment = 1.0 if current_fast < current_slow else 0.0
-            momentum = 1.0 if current_fast < prev_fast and current_slow < prev_slow else 0.5
-        
-        return (alignment + momentum) / 2.0
-    
-    def _check_volume_quality(self, df: pd.DataFrame, idx: int) -> float:
-        """거래량 품질 확인"""
-        if "volume" not in df.columns or idx < 20:
-            return 0.5
-        
-        current_volume = df.iloc[idx]["volume"]
-        
-        # Volume MA 찾기
-        volume_ma_col = None
-        for col in df.columns:
-            if "volume" in col.lower() and "ma" in col.lower():
+            if volume_ma_col is None and "volume" in col.lower() and "ma" in col.lower():
                 volume_ma_col = col
-                break
-        
-        if volume_ma_col is None:
-            return 0.5
-        
-        volume_ma = df.iloc[idx][volume_ma_col]
-        if volume_ma == 0:
-            return 0.5
-        
-        volume_ratio = current_volume / volume_ma
         
-        # 거래량이 평균의 1.2배 이상이면 좋음
-        if volume_ratio >= 1.2:
-            return 1.0
-        elif volume_ratio >= 0.8:
-            return 0.7
-        elif volume_ratio >= 0.5:
-            return 0.5
-        else:
-            return 0.3
+        return ema_fast_col, ema_slow_col, volume_ma_col
     
-    def _check_momentum(self, df: pd.DataFrame, idx: int, signal: Signal) -> float:
-        """모멘텀 확인"""
-        if idx < 5:
-            return 0.5
-        
-        current_price = df.iloc[idx]["close"]
-        prices = df.iloc[max(0, idx - 5):idx + 1]["close"].values
+    def _bind_arrays(self, df: pd.DataFrame):
+        """
+        데이터프레임 컬럼을 NumPy 배열로 복사해 보관
         
-        # 가격 모멘텀 계산
-        if len(prices) >= 3:
-            price_change = (prices[-1] - prices[0]) / prices[0]
-            
-            if signal.type.value.startswith("long"):
-                # Long: 상승 모멘텀
-                momentum = max(0.0, min(1.0, price_change * 100))  # 정규화
-            else:
-                # Short: 하락 모멘텀
-                momentum = max(0.0, min(1.0, -price_change * 100))
+        Args:
+            df: 데이터프레임
+        """
+        if not self._cols_resolved:
+            self._ema_fast_col, self._ema_slow_col, self._volume_ma_col = self._resolve_columns(df)
+            self._cols_resolved = True
+        
+        # 커널 입력용 쓰기 가능한 float64 배열 (컬럼이 없으면 길이 0 배열)
+        columns = df.columns
+        self._close = _as_f8(df["close"])
+        self._volume = _as_f8(df["volume"]) if "volume" in columns else _EMPTY_F8
+        self._volume_ma = _as_f8(df[self._volume_ma_col]) if self._volume_ma_col in columns else _EMPTY_F8
+        self._ema_fast = _as_f8(df[self._ema_fast_col]) if self._ema_fast_col in columns else _EMPTY_F8
+        self._ema_slow = _as_f8(df[self._ema_slow_col]) if self._ema_slow_col in columns else _EMPTY_F8
+        self._rolling_high = _as_f8(df["high"].rolling(21, min_periods=1).max())
+        self._rolling_low = _as_f8(df["low"].rolling(21, min_periods=1).min())
+        # 거리 계산용 역수 (0 가격은 inf가 되어 거리도 inf → 중립 점수, 나눗셈과 동일)
+        with np.errstate(divide="ignore"):
+            self._inv_rolling_high = 1.0 / self._rolling_high
+            self._inv_rolling_low = 1.0 / self._rolling_low
+        
+        # 레짐 일관성 (최근 5바 중 목표 레짐 비율, 레짐 컬럼이 없으면 0)
+        if "regime" in columns:
+            regime = df["regime"].to_numpy()
+            window = np.ones(5)
+            n = len(regime)
+            self._regime_bull_consistency = np.convolve((regime == Regime.BULL).astype(np.float64), window)[:n] / 5.0
+            self._regime_bear_consistency = np.convolve((regime == Regime.BEAR).astype(np.float64), window)[:n] / 5.0
         else:
-            momentum = 0.5
-        
-        return momentum
+            self._regime_bull_consistency = self._regime_bear_consistency = np.zeros(len(df))
+        # 식별은 id()가 아닌 객체 참조로 (참조를 쥐고 있으므로 id 재사용 문제 없음)
+        self._bound_df = df
     
-    def _check_support_resistance(
-        self,
-        df: pd.DataFrame,
-        idx: int,
-        signal: Signal,
-    ) -> float:
-        """지지/저항 확인"""
-        if idx < 20:
-            return 0.5
-        
-        current_price = df.iloc[idx]["close"]
+    def prepare(self, df: pd.DataFrame):
+        """
+        평가 전에 데이터프레임 배열과 롤링 고점/저점을 미리 계산
         
-        # 최근 20바의 고점/저점 확인
-        recent_high = df.iloc[max(0, idx - 20):idx + 1]["high"].max()
-        recent_low = df.iloc[max(0, idx - 20):idx + 1]["low"].min()
+        evaluate_entry_quality는 같은 데이터프레임 객체면 바인딩된 배열을 재사용하므로,
+        데이터프레임 값을 제자리에서 바꾼 뒤에는 다시 호출해야 함.
         
-        if signal.type.value.startswith("long"):
-            # Long: 저점 근처에서 진입 (지지선)
-            distance_to_low = abs(current_price - recent_low) / recent_low
-            if distance_to_low < 0.01:  # 1% 이내
-                return 1.0
-            elif distance_to_low < 0.02:  # 2% 이내
-                return 0.7
-            else:
-                return 0.5
-        else:
-            # Short: 고점 근처에서 진입 (저항선)
-            distance_to_high = abs(current_price - recent_high) / recent_high
-            if distance_to_high < 0.01:  # 1% 이내
-                return 1.0
-            elif distance_to_high < 0.02:  # 2% 이내
-                return 0.7
-            else:
-                return 0.5
-
+        Args:
+            df: 데이터프레임 (지표 계산 완료)
+        """
+        self._bind_arrays(df)
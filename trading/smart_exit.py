@@ -1,13 +1,17 @@
 """스마트 청산 모듈 - 수익 극대화 및 손실 최소화"""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from strategy.base_strategy import Position
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 시간 단위 환산 (나노초 -> 시간)
+_NS_PER_HOUR = 3_600_000_000_000
+
 
 class SmartExit:
     """스마트 청산 클래스 - 수익 극대화"""
@@ -36,6 +40,11 @@ class SmartExit:
             {"profit_pct": 0.05, "exit_pct": 0.3},  # 5% 수익 시 30% 청산
         ])
         
+        # 부분 청산 임계값 (수익률 오름차순) 및 레벨별 청산 비율
+        sorted_levels = sorted(self.partial_exit_levels, key=lambda level: level["profit_pct"])
+        self._pe_profits = np.array([level["profit_pct"] for level in sorted_levels], dtype=np.float64)
+        self._pe_exits = [level["exit_pct"] for level in sorted_levels]
+        
         # 시간 기반 청산
         time_exit_config = exit_config.get("time_exit", {})
         self.max_hold_hours = time_exit_config.get("max_hours", 24)
@@ -44,6 +53,123 @@ class SmartExit:
         logger.info(f"트레일링 스탑: {self.use_trailing_stop}")
         logger.info(f"부분 청산: {self.use_partial_exit}")
     
+    @staticmethod
+    def _profit_pct(position: Position, current_price: float) -> float:
+        """포지션 수익률 (진입가 대비, 숏은 부호 반전)"""
+        sign = 1.0 if position.direction == "long" else -1.0
+        return sign * (current_price - position.entry_price) / position.entry_price
+    
+    @staticmethod
+    def profit_pct_vec(
+        entry_price: np.ndarray,
+        direction_sign: np.ndarray,
+        prices: np.ndarray,
+    ) -> np.ndarray:
+        """
+        여러 포지션의 수익률 일괄 계산 (포지션별 병렬 배열)
+        
+        Args:
+            entry_price: 포지션별 진입가
+            direction_sign: 포지션별 방향 부호 (롱 1.0, 숏 -1.0)
+            prices: 포지션별 현재 가격
+            
+        Returns:
+            포지션별 수익률 배열
+        """
+        return direction_sign * (prices - entry_price) / entry_price
+    
+    @staticmethod
+    def positions_soa(positions: List[Position]) -> Dict[str, np.ndarray]:
+        """
+        포지션 목록을 필드별 병렬 배열(SoA)로 변환
+        
+        Args:
+            positions: 열린 포지션 목록
+            
+        Returns:
+            entry_price, direction_sign, stop_loss, pe_mask, entry_time_ns 배열 딕셔너리
+        """
+        return {
+            "entry_price": np.array([p.entry_price for p in positions], dtype=np.float64),
+            "direction_sign": np.array([1.0 if p.direction == "long" else -1.0 for p in positions]),
+            "stop_loss": np.array([p.stop_loss for p in positions], dtype=np.float64),
+            "pe_mask": np.array([p.metadata.get("pe_mask", 0) for p in positions], dtype=np.int64),
+            "entry_time_ns": np.array([pd.Timestamp(p.entry_time).value for p in positions], dtype=np.int64),
+        }
+    
+    def apply_tick_vectorized(
+        self,
+        prices: np.ndarray,
+        atrs: np.ndarray,
+        positions_soa: Dict[str, np.ndarray],
+        current_time_ns: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        열린 포지션 전체에 대한 틱 처리 (트레일링 스탑, 부분 청산, 익절, 조기 손절) 일괄 계산
+        
+        포지션별로 calculate_trailing_stop / check_partial_exit / should_take_profit /
+        should_cut_loss_early를 호출한 것과 같은 판단을 배열 연산으로 수행한다.
+        
+        Args:
+            prices: 포지션별 현재 가격
+            atrs: 포지션별 ATR 값
+            positions_soa: positions_soa()가 만든 포지션 배열
+            current_time_ns: 현재 시각 (Unix 나노초, 주어지면 조기 손절도 계산)
+            
+        Returns:
+            profit_pct, stop_loss, partial_exit, partial_exit_pct, pe_mask, take_profit
+            (current_time_ns가 있으면 hold_hours, cut_loss 추가) 배열 딕셔너리
+        """
+        entry_price = positions_soa["entry_price"]
+        sign = positions_soa["direction_sign"]
+        old_stop = positions_soa["stop_loss"]
+        mask = positions_soa["pe_mask"]
+        is_long = sign > 0
+        
+        profit = self.profit_pct_vec(entry_price, sign, prices)
+        
+        # 트레일링 스탑 (활성화된 포지션만, 기존 스탑보다 불리하게 이동하지 않음)
+        if self.use_trailing_stop:
+            new_stop = np.where(is_long, prices * (1 - self.trailing_distance), prices * (1 + self.trailing_distance))
+            trailed = np.where(is_long, np.maximum(new_stop, old_stop), np.minimum(new_stop, old_stop))
+            stop_loss = np.where(profit >= self.trailing_activation, trailed, old_stop)
+        else:
+            stop_loss = old_stop.copy()
+        
+        # 부분 청산 (도달한 레벨 중 아직 청산하지 않은 가장 낮은 레벨)
+        partial_exit_pct = np.zeros(len(profit))
+        new_mask = mask.copy()
+        if self.use_partial_exit and len(self._pe_profits):
+            reached = np.searchsorted(self._pe_profits, profit, side="right")
+            reached[np.isnan(profit)] = 0
+            pending = ~mask & ((np.int64(1) << reached) - 1)
+            bit = pending & -pending
+            has_pending = pending != 0
+            level = np.argmax((bit[:, None] >> np.arange(len(self._pe_profits))) & 1, axis=1)
+            partial_exit_pct = np.where(has_pending, np.asarray(self._pe_exits, dtype=np.float64)[level], 0.0)
+            new_mask = mask | bit
+        partial_exit = partial_exit_pct > 0
+        
+        # 익절 (3 ATR 또는 고정 5%)
+        take_profit = (profit >= (atrs * 3.0) / entry_price) | (profit >= 0.05)
+        
+        result = {
+            "profit_pct": profit,
+            "stop_loss": stop_loss,
+            "partial_exit": partial_exit,
+            "partial_exit_pct": partial_exit_pct,
+            "pe_mask": new_mask,
+            "take_profit": take_profit,
+        }
+        
+        # 조기 손절 (보유 시간은 나노초 정수 차이로 계산)
+        if current_time_ns is not None:
+            hold_hours = (current_time_ns - positions_soa["entry_time_ns"]) / _NS_PER_HOUR
+            result["hold_hours"] = hold_hours
+            result["cut_loss"] = ((hold_hours > 12) & (profit < 0.01)) | (hold_hours > self.max_hold_hours)
+        
+        return result
+    
     def calculate_trailing_stop(
         self,
         position: Position,
@@ -65,10 +191,7 @@ class SmartExit:
             return position.stop_loss
         
         # 수익률 계산
-        if position.direction == "long":
-            profit_pct = (current_price - position.entry_price) / position.entry_price
-        else:
-            profit_pct = (position.entry_price - current_price) / position.entry_price
+        profit_pct = self._profit_pct(position, current_price)
         
         # 트레일링 스탑 활성화 확인
         if profit_pct < self.trailing_activation:
@@ -105,24 +228,24 @@ class SmartExit:
             return False, 0.0
         
         # 수익률 계산
-        if position.direction == "long":
-            profit_pct = (current_price - position.entry_price) / position.entry_price
-        else:
-            profit_pct = (position.entry_price - current_price) / position.entry_price
-        
-        # 부분 청산 레벨 확인
-        for level in self.partial_exit_levels:
-            if profit_pct >= level["profit_pct"]:
-                # 이미 부분 청산했는지 확인 (메타데이터에 기록)
-                if not hasattr(position, 'metadata'):
-                    position.metadata = {}
-                
-                level_key = f"partial_exit_{level['profit_pct']}"
-                if not position.metadata.get(level_key, False):
-                    position.metadata[level_key] = True
-                    return True, level["exit_pct"]
-        
-        return False, 0.0
+        profit_pct = self._profit_pct(position, current_price)
+        
+        # 도달한 레벨 수 (임계값 이분 탐색, NaN 수익률은 미도달)
+        reached = int(np.searchsorted(self._pe_profits, profit_pct, side="right"))
+        if reached == 0 or profit_pct != profit_pct:
+            return False, 0.0
+        
+        # 이미 부분 청산한 레벨은 메타데이터 비트마스크로 확인
+        mask = position.metadata.get("pe_mask", 0)
+        
+        # 도달한 레벨 중 아직 청산하지 않은 가장 낮은 레벨
+        pending = ~mask & ((1 << reached) - 1)
+        if pending == 0:
+            return False, 0.0
+        
+        bit = pending & -pending
+        position.metadata["pe_mask"] = mask | bit
+        return True, self._pe_exits[bit.bit_length() - 1]
     
     def should_take_profit(
         self,
@@ -142,10 +265,7 @@ class SmartExit:
             (익절 필요 여부, 이유)
         """
         # 수익률 계산
-        if position.direction == "long":
-            profit_pct = (current_price - position.entry_price) / position.entry_price
-        else:
-            profit_pct = (position.entry_price - current_price) / position.entry_price
+        profit_pct = self._profit_pct(position, current_price)
         
         # 익절 레벨 확인 (ATR 기반)
         take_profit_atr_multiplier = 3.0  # 3 ATR = 익절
@@ -183,10 +303,7 @@ class SmartExit:
         hold_duration = (current_time - entry_time).total_seconds() / 3600  # 시간
         
         # 수익률 계산
-        if position.direction == "long":
-            profit_pct = (current_price - position.entry_price) / position.entry_price
-        else:
-            profit_pct = (position.entry_price - current_price) / position.entry_price
+        profit_pct = self._profit_pct(position, current_price)
         
         # 오래 보유했는데 수익이 없으면 청산
         if hold_duration > 12 and profit_pct < 0.01:  # 12시간 이상, 1% 미만 수익
@@ -4,11 +4,147 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from utils.logger import get_logger
 import json
+import re
+import weakref
+from collections import deque
+from itertools import islice
 from pathlib import Path
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 선택 의존성
+    orjson = None
+
 logger = get_logger(__name__)
 
+# 서술 구분선
+_RULE = "=" * 70
+
+# 실패 원인 키워드 -> 교훈 그룹
+_LESSON_GROUPS = {
+    "거래량": "volume",
+    "물타기": "averaging",
+    "타이밍": "timing",
+    "보유": "timing",
+    "리스크": "risk",
+    "스탑로스": "risk",
+}
+_LESSON_RE = re.compile("|".join(_LESSON_GROUPS))
+
+# 교훈 그룹별 교훈 (출력 순서)
+_LESSONS = (
+    ("volume", ("거래량 패턴을 더 주의 깊게 관찰해야 함",)),
+    ("averaging", ("손실 포지션에 물타기하지 말 것", "조기 손절 원칙 준수")),
+    ("timing", ("진입 타이밍을 더 신중하게 선택해야 함", "손실 포지션은 오래 보유하지 말 것")),
+    ("risk", ("리스크 관리 원칙을 더 엄격하게 준수해야 함", "스탑로스를 적절히 설정하고 반드시 준수")),
+)
+
+# 일지 파일 쓰기 버퍼 크기 (바이트)
+_JOURNAL_BUFFER_SIZE = 1 << 16
+
+
+if orjson is not None:
+    # 날짜/시간은 표준 json(default=str)과 같은 문자열 형식을 유지
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_APPEND_NEWLINE
+    )
+
+
+def _dumps_line(journal: Dict[str, Any]) -> str:
+    """일지 항목을 JSONL 한 줄로 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(journal, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(journal, ensure_ascii=False, default=str) + "\n"
+
+
+def _close_journal_file(files: Dict[str, Any]):
+    """열린 일지 파일 핸들 닫기"""
+    fh = files["fh"]
+    if fh is not None:
+        files["fh"] = None
+        files["date"] = None
+        try:
+            fh.close()
+        except Exception as e:
+            logger.error(f"일지 파일 닫기 실패: {e}")
+
+
+def _narrative_entry_reason(journal: Dict[str, Any]) -> str:
+    """서술 - 진입 이유 (없으면 빈 문자열)"""
+    entry = journal["entry"]
+    if not entry.get("decision_reason"):
+        return ""
+    lines = "".join(f"\n    {line}" for line in entry["decision_reason"].split("\n") if line.strip())
+    return f"\n\n  진입 이유:{lines}"
+
+
+def _narrative_volume_change(journal: Dict[str, Any]) -> str:
+    """서술 - 진입/청산 간 거래량 변화"""
+    volume_change = journal["exit"]["volume_ratio"] - journal["entry"]["volume_ratio"]
+    if abs(volume_change) <= 0.5:
+        return ""
+    if volume_change < 0:
+        return f"\n\n  📉 거래량 감소: {volume_change:+.1%} 감소"
+    text = f"\n\n  ⚠️ 거래량 급증: {volume_change:+.1%} 증가"
+    if journal["result"] == "loss":
+        text += "\n     → 거래량이 급증했는데 손실 포지션 유지 - 반대 방향 신호를 놓침"
+    return text
+
+
+def _narrative_regime_change(journal: Dict[str, Any]) -> str:
+    """서술 - 레짐 전환"""
+    entry_regime = journal["entry"]["regime"]
+    exit_regime = journal["exit"]["regime"]
+    if entry_regime == exit_regime:
+        return ""
+    text = f"\n\n  🔄 레짐 전환: {entry_regime} → {exit_regime}"
+    if journal["result"] == "loss":
+        text += "\n     → 레짐이 전환되었는데 포지션 유지 - 조기 청산 필요했음"
+    return text
+
+
+def _narrative_failure(journal: Dict[str, Any]) -> str:
+    """서술 - 실패 분석 (손실 거래인 경우)"""
+    failure = journal.get("failure_analysis")
+    if not failure:
+        return ""
+    text = "\n\n【실패 분석】"
+    if failure.get("failure_reasons"):
+        text += "\n  실패 원인:" + "".join(f"\n    • {reason}" for reason in failure["failure_reasons"])
+    if failure.get("decision_mistakes"):
+        text += "\n\n  결정 실수:" + "".join(f"\n    - {mistake}" for mistake in failure["decision_mistakes"])
+    if failure.get("risk_mistakes"):
+        text += "\n\n  리스크 관리 실수:" + "".join(f"\n    - {mistake}" for mistake in failure["risk_mistakes"])
+    return text
+
+
+def _narrative_lessons(journal: Dict[str, Any]) -> str:
+    """서술 - 교훈"""
+    lessons = journal.get("lessons_learned")
+    if not lessons:
+        return ""
+    return "\n\n【교훈】" + "".join(f"\n  💡 {lesson}" for lesson in lessons)
+
+
+def _no_section(journal: Dict[str, Any]) -> str:
+    """서술 - 비활성화된 구간"""
+    return ""
+
+
+# 선택 서술 구간 (설정 journal.narrative_sections로 사용할 구간 지정, 기본은 전체)
+_NARRATIVE_SECTIONS = {
+    "entry_reason": _narrative_entry_reason,
+    "volume_change": _narrative_volume_change,
+    "regime_change": _narrative_regime_change,
+    "failure": _narrative_failure,
+    "lessons": _narrative_lessons,
+}
+_NARRATIVE_TAIL_SECTIONS = ("volume_change", "regime_change", "failure", "lessons")
+
 
 class TradeJournal:
     """거래 일지 생성기 - 상세한 거래 기록"""
@@ -25,9 +161,21 @@ class TradeJournal:
         self.output_path = Path(output_path)
         self.output_path.mkdir(parents=True, exist_ok=True)
         
-        # 일지 데이터
-        self.journals: List[Dict[str, Any]] = []
+        # 일지 데이터 (최대 개수 초과 시 오래된 항목부터 자동 제거)
         self.max_journals = 1000
+        self.journals: deque = deque(maxlen=self.max_journals)
+        
+        # 서술 구간 렌더러 (설정에 따라 한 번만 구성, 꺼진 구간은 호출하지 않음)
+        enabled = set(config.get("journal", {}).get("narrative_sections", _NARRATIVE_SECTIONS))
+        self._entry_reason_section = _NARRATIVE_SECTIONS["entry_reason"] if "entry_reason" in enabled else _no_section
+        self._tail_sections = tuple(
+            _NARRATIVE_SECTIONS[name] for name in _NARRATIVE_TAIL_SECTIONS if name in enabled
+        )
+        
+        # 일지 파일 핸들 (날짜별로 열어 둔 채 재사용, 날짜가 바뀌면 교체)
+        self._journal_files: Dict[str, Any] = {"fh": None, "date": None}
+        # 객체 소멸 또는 인터프리터 종료 시 버퍼를 기록하고 닫음
+        self._finalizer = weakref.finalize(self, _close_journal_file, self._journal_files)
         
         logger.info(f"거래 일지 생성기 초기화: {self.output_path}")
     
@@ -103,8 +251,6 @@ class TradeJournal:
         
         # 일지 저장
         self.journals.append(journal)
-        if len(self.journals) > self.max_journals:
-            self.journals.pop(0)
         
         # 파일에 저장
         self._save_to_file(journal)
@@ -117,135 +263,86 @@ class TradeJournal:
     
     def _generate_narrative(self, journal: Dict[str, Any]) -> str:
         """상세 서술 생성"""
-        narrative_parts = []
-        
-        narrative_parts.append("=" * 70)
-        narrative_parts.append("📔 거래 일지")
-        narrative_parts.append("=" * 70)
-        
-        # 거래 결과
-        result_emoji = "✅" if journal["result"] == "win" else "❌"
-        narrative_parts.append(f"\n{result_emoji} 거래 결과: {journal['result'].upper()}")
-        narrative_parts.append(f"   손익: {journal['pnl']:+.2f} ({journal['pnl_pct']:+.2f}%)")
-        narrative_parts.append(f"   보유 시간: {journal['duration_hours']:.1f}시간")
-        
-        # 진입 상황
-        narrative_parts.append(f"\n【진입 상황】")
         entry = journal["entry"]
-        narrative_parts.append(f"  시간: {entry['timestamp']}")
-        narrative_parts.append(f"  가격: {entry['price']:.2f}")
-        narrative_parts.append(f"  거래량: {entry['volume']:.2f} (평균 대비 {entry['volume_ratio']:.1%})")
-        narrative_parts.append(f"  변동성: {entry['volatility_pct']:.2f}%")
-        narrative_parts.append(f"  레짐: {entry['regime']}")
-        narrative_parts.append(f"  예상 승률: {entry['predicted_win_rate']:.1%}")
-        narrative_parts.append(f"  신뢰도: {entry['confidence']:.1%}")
-        
-        # 진입 이유
-        if entry.get("decision_reason"):
-            narrative_parts.append(f"\n  진입 이유:")
-            for line in entry["decision_reason"].split("\n"):
-                if line.strip():
-                    narrative_parts.append(f"    {line}")
-        
-        # 청산 상황
-        narrative_parts.append(f"\n【청산 상황】")
         exit_data = journal["exit"]
-        narrative_parts.append(f"  시간: {exit_data['timestamp']}")
-        narrative_parts.append(f"  가격: {exit_data['price']:.2f}")
-        narrative_parts.append(f"  거래량: {exit_data['volume']:.2f} (평균 대비 {exit_data['volume_ratio']:.1%})")
-        narrative_parts.append(f"  변동성: {exit_data['volatility_pct']:.2f}%")
-        narrative_parts.append(f"  레짐: {exit_data['regime']}")
-        narrative_parts.append(f"  청산 이유: {exit_data['reason']}")
-        
-        # 거래량 변화 분석
-        volume_change = exit_data['volume_ratio'] - entry['volume_ratio']
-        if abs(volume_change) > 0.5:
-            if volume_change > 0:
-                narrative_parts.append(f"\n  ⚠️ 거래량 급증: {volume_change:+.1%} 증가")
-                if journal["result"] == "loss":
-                    narrative_parts.append(f"     → 거래량이 급증했는데 손실 포지션 유지 - 반대 방향 신호를 놓침")
-            else:
-                narrative_parts.append(f"\n  📉 거래량 감소: {volume_change:+.1%} 감소")
-        
-        # 레짐 변화
-        if entry['regime'] != exit_data['regime']:
-            narrative_parts.append(f"\n  🔄 레짐 전환: {entry['regime']} → {exit_data['regime']}")
-            if journal["result"] == "loss":
-                narrative_parts.append(f"     → 레짐이 전환되었는데 포지션 유지 - 조기 청산 필요했음")
-        
-        # 실패 분석 (손실 거래인 경우)
-        if journal.get("failure_analysis"):
-            narrative_parts.append(f"\n【실패 분석】")
-            failure = journal["failure_analysis"]
-            
-            if failure.get("failure_reasons"):
-                narrative_parts.append(f"  실패 원인:")
-                for reason in failure["failure_reasons"]:
-                    narrative_parts.append(f"    • {reason}")
-            
-            # 구체적인 실수들
-            if failure.get("decision_mistakes"):
-                narrative_parts.append(f"\n  결정 실수:")
-                for mistake in failure["decision_mistakes"]:
-                    narrative_parts.append(f"    - {mistake}")
-            
-            if failure.get("risk_mistakes"):
-                narrative_parts.append(f"\n  리스크 관리 실수:")
-                for mistake in failure["risk_mistakes"]:
-                    narrative_parts.append(f"    - {mistake}")
-        
-        # 교훈
-        if journal.get("lessons_learned"):
-            narrative_parts.append(f"\n【교훈】")
-            for lesson in journal["lessons_learned"]:
-                narrative_parts.append(f"  💡 {lesson}")
-        
-        narrative_parts.append("=" * 70)
+        result_emoji = "✅" if journal["result"] == "win" else "❌"
         
-        return "\n".join(narrative_parts)
+        return f"""{_RULE}
+📔 거래 일지
+{_RULE}
+
+{result_emoji} 거래 결과: {journal['result'].upper()}
+   손익: {journal['pnl']:+.2f} ({journal['pnl_pct']:+.2f}%)
+   보유 시간: {journal['duration_hours']:.1f}시간
+
+【진입 상황】
+  시간: {entry['timestamp']}
+  가격: {entry['price']:.2f}
+  거래량: {entry['volume']:.2f} (평균 대비 {entry['volume_ratio']:.1%})
+  변동성: {entry['volatility_pct']:.2f}%
+  레짐: {entry['regime']}
+  예상 승률: {entry['predicted_win_rate']:.1%}
+  신뢰도: {entry['confidence']:.1%}{self._entry_reason_section(journal)}
+
+【청산 상황】
+  시간: {exit_data['timestamp']}
+  가격: {exit_data['price']:.2f}
+  거래량: {exit_data['volume']:.2f} (평균 대비 {exit_data['volume_ratio']:.1%})
+  변동성: {exit_data['volatility_pct']:.2f}%
+  레짐: {exit_data['regime']}
+  청산 이유: {exit_data['reason']}{"".join(section(journal) for section in self._tail_sections)}
+{_RULE}"""
     
     def _extract_lessons(self, failure_analysis: Dict[str, Any]) -> List[str]:
         """교훈 추출"""
-        lessons = []
+        # 실패 원인을 한 번만 훑어 등장한 교훈 그룹 수집
+        groups = set()
+        volume_surge = False
+        for reason in failure_analysis.get("failure_reasons", []):
+            matched = {_LESSON_GROUPS[m.group(0)] for m in _LESSON_RE.finditer(reason)}
+            if "volume" in matched and not volume_surge:
+                volume_surge = "급증" in reason
+            groups |= matched
         
-        # 거래량 관련 교훈
-        volume_issues = [r for r in failure_analysis.get("failure_reasons", []) if "거래량" in r]
-        if volume_issues:
-            lessons.append("거래량 패턴을 더 주의 깊게 관찰해야 함")
-            if any("급증" in r for r in volume_issues):
-                lessons.append("거래량 급증 시 반대 방향 움직임 가능성 고려")
-        
-        # 물타기 관련 교훈
-        if any("물타기" in r for r in failure_analysis.get("failure_reasons", [])):
-            lessons.append("손실 포지션에 물타기하지 말 것")
-            lessons.append("조기 손절 원칙 준수")
-        
-        # 타이밍 관련 교훈
-        timing_issues = [r for r in failure_analysis.get("failure_reasons", []) if "타이밍" in r or "보유" in r]
-        if timing_issues:
-            lessons.append("진입 타이밍을 더 신중하게 선택해야 함")
-            lessons.append("손실 포지션은 오래 보유하지 말 것")
-        
-        # 리스크 관리 교훈
-        risk_issues = [r for r in failure_analysis.get("failure_reasons", []) if "리스크" in r or "스탑로스" in r]
-        if risk_issues:
-            lessons.append("리스크 관리 원칙을 더 엄격하게 준수해야 함")
-            lessons.append("스탑로스를 적절히 설정하고 반드시 준수")
+        lessons = []
+        for group, group_lessons in _LESSONS:
+            if group in groups:
+                lessons.extend(group_lessons)
+                if group == "volume" and volume_surge:
+                    lessons.append("거래량 급증 시 반대 방향 움직임 가능성 고려")
         
         return lessons if lessons else ["이 거래에서 배울 점을 찾아야 함"]
     
     def _save_to_file(self, journal: Dict[str, Any]):
         """파일에 저장"""
         date_str = datetime.now().strftime("%Y%m%d")
-        filename = self.output_path / f"journal_{date_str}.jsonl"
+        files = self._journal_files
         
         try:
-            with open(filename, "a", encoding="utf-8") as f:
-                f.write(json.dumps(journal, ensure_ascii=False, default=str) + "\n")
+            if files["date"] != date_str:
+                # 날짜 변경 시 새 파일로 교체
+                _close_journal_file(files)
+                filename = self.output_path / f"journal_{date_str}.jsonl"
+                files["fh"] = open(filename, "a", buffering=_JOURNAL_BUFFER_SIZE, encoding="utf-8")
+                files["date"] = date_str
+            files["fh"].write(_dumps_line(journal))
         except Exception as e:
             logger.error(f"일지 저장 실패: {e}")
     
+    def flush(self):
+        """버퍼에 쌓인 일지를 파일에 기록"""
+        fh = self._journal_files["fh"]
+        if fh is not None:
+            try:
+                fh.flush()
+            except Exception as e:
+                logger.error(f"일지 저장 실패: {e}")
+    
+    def close(self):
+        """일지 파일 닫기 (이후 저장 시 다시 열림)"""
+        _close_journal_file(self._journal_files)
+    
     def get_recent_journals(self, limit: int = 20) -> List[Dict[str, Any]]:
         """최근 일지 반환"""
-        return self.journals[-limit:] if self.journals else []
+        return list(islice(self.journals, max(0, len(self.journals) - limit), None))
 
@@ -2,11 +2,148 @@
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from collections import deque
+from itertools import islice
+import time
 from utils.logger import get_logger
-import json
+from utils.helpers import safe_divide
+from utils.jit import njit
 
 logger = get_logger(__name__)
 
+_THOUGHT_RULE = "=" * 60
+
+def _format_ts(timestamp_ns: int) -> str:
+    """time.time_ns() 값을 로컬 시각 ISO 문자열로 변환"""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+
+# 시장 상황 요약 라벨 (변동성/거래량은 [낮음, 보통, 높음] 버킷 인덱스)
+_REGIME_LABELS = {"bull": "강세장", "bear": "약세장"}  # 그 외 횡보장
+_VOLATILITY_LABELS = ("저변동성", "", "고변동성")
+_VOLUME_LABELS = ("거래량 부족", "", "거래량 급증")
+
+# 진입 판단 커널 입력 코드
+_REGIME_CODES = {"bull": 1, "bear": 2}  # 그 외 0 (횡보)
+_STAGE_CODES = {"seedling": 1, "prosperous": 2}  # 그 외 0
+
+# 진입 판단 커널 결과 코드
+_DECISIONS = ("enter", "wait", "skip")
+_MOODS = ("confident", "cautious", "fearful")
+
+# 상세 이유 텍스트의 결정 문구와 결정별 설명
+_DECISION_TEXT = {"enter": "진입 결정", "wait": "대기 결정", "skip": "진입 포기"}
+_DECISION_TAIL = {
+    "enter": (
+        "\n\n이 거래는 다음 이유로 진입합니다:"
+        "\n  1. 시장 조건이 진입에 유리함"
+        "\n  2. 예상 승률이 임계값을 초과함"
+        "\n  3. 리스크가 허용 범위 내임"
+    ),
+    "wait": "\n\n더 나은 기회를 기다립니다.",
+    "skip": "\n\n리스크가 너무 크거나 조건이 불충분합니다.",
+}
+
+# 진입 판단 커널이 켠 판단 근거 비트
+_F_REGIME_BULL = 1 << 0
+_F_REGIME_BEAR = 1 << 1
+_F_REGIME_SIDEWAYS = 1 << 2
+_F_CONF_HIGH = 1 << 3
+_F_CONF_LOW = 1 << 4
+_F_WIN_RATE_HIGH = 1 << 5
+_F_WIN_RATE_GOOD = 1 << 6
+_F_WIN_RATE_MID = 1 << 7
+_F_WIN_RATE_LOW = 1 << 8
+_F_STAGE_SEEDLING = 1 << 9
+_F_STAGE_PROSPEROUS = 1 << 10
+_F_DAILY_RISK_HIGH = 1 << 11
+_F_DAILY_RISK_LOW = 1 << 12
+_F_CONSEC_LOSSES = 1 << 13
+
+
+@njit("Tuple((float64, int64, int64, int64))(float64, float64, int64, int64, int64, float64)", cache=True)
+def _score_entry(
+    win_rate: float,
+    daily_risk_ratio: float,
+    consecutive_losses: int,
+    stage_code: int,
+    regime_code: int,
+    entry_confidence: float,
+):
+    """
+    진입 판단 수치 커널 - (신뢰도, 결정 코드, 기분 코드, 판단 근거 비트) 반환
+    
+    결정/기분 코드는 _DECISIONS / _MOODS의 인덱스.
+    """
+    flags = 0
+    concerns = 0
+    
+    # 진입 조건 (레짐, 조건 신뢰도)
+    if regime_code == 1:
+        flags |= _F_REGIME_BULL
+    elif regime_code == 2:
+        flags |= _F_REGIME_BEAR
+    else:
+        flags |= _F_REGIME_SIDEWAYS
+        concerns += 1
+    
+    if entry_confidence >= 0.8:
+        flags |= _F_CONF_HIGH
+    elif entry_confidence < 0.6:
+        flags |= _F_CONF_LOW
+        concerns += 1
+    
+    # 승률 평가
+    confidence = 0.0
+    if win_rate >= 0.70:
+        flags |= _F_WIN_RATE_HIGH
+        confidence += 0.3
+    elif win_rate >= 0.60:
+        flags |= _F_WIN_RATE_GOOD
+        confidence += 0.2
+    elif win_rate >= 0.50:
+        flags |= _F_WIN_RATE_MID
+        confidence += 0.1
+    else:
+        flags |= _F_WIN_RATE_LOW
+        confidence -= 0.2
+        concerns += 1
+    
+    # 리스크 평가
+    adjustment = 0.0
+    if stage_code == 1:
+        flags |= _F_STAGE_SEEDLING
+        concerns += 1
+    elif stage_code == 2:
+        flags |= _F_STAGE_PROSPEROUS
+        adjustment += 0.1
+    
+    if daily_risk_ratio > 0.8:
+        flags |= _F_DAILY_RISK_HIGH
+        adjustment -= 0.2
+        concerns += 1
+    elif daily_risk_ratio < 0.3:
+        flags |= _F_DAILY_RISK_LOW
+        adjustment += 0.1
+    
+    if consecutive_losses >= 2:
+        flags |= _F_CONSEC_LOSSES
+        adjustment -= 0.15
+        concerns += 1
+    
+    confidence += adjustment
+    
+    # 최종 결정
+    confidence = max(0.0, min(1.0, confidence))
+    if confidence >= 0.7 and concerns == 0:
+        return confidence, 0, 0, flags
+    if confidence >= 0.6 and concerns <= 1:
+        return confidence, 0, 1, flags
+    if confidence >= 0.5:
+        return confidence, 1, 1, flags
+    return confidence, 2, 2, flags
+
 
 class TradingMind:
     """트레이딩 마인드 - 거래 결정을 내리는 "마음" 시스템"""
@@ -21,8 +158,8 @@ class TradingMind:
         self.config = config
         
         # 생각 로그
-        self.thought_log: List[Dict[str, Any]] = []
         self.max_thoughts = 500
+        self.thought_log: deque = deque(maxlen=self.max_thoughts)
         
         # 현재 상태
         self.current_mood = "neutral"  # neutral, cautious, confident, greedy, fearful
@@ -48,10 +185,11 @@ class TradingMind:
         Returns:
             생각과 결정
         """
+        market_analysis = self._analyze_market_situation(market_data)
         thought = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),  # ISO 문자열은 get_recent_thoughts에서 필요할 때 생성
             "type": "entry_decision",
-            "market_situation": self._analyze_market_situation(market_data),
+            "market_situation": market_analysis,
             "entry_conditions": entry_conditions,
             "predicted_win_rate": predicted_win_rate,
             "risk_assessment": risk_assessment,
@@ -62,50 +200,73 @@ class TradingMind:
             "detailed_reason": "",
         }
         
-        # 1. 시장 상황 분석
-        market_analysis = self._analyze_market_situation(market_data)
-        thought["reasoning"].append(f"시장 상황: {market_analysis['summary']}")
+        # 수치 판단 (승률/리스크/조건 신뢰도 -> 신뢰도, 결정, 기분)
+        daily_risk_ratio = risk_assessment.get("daily_risk_ratio", 0.0)
+        consecutive_losses = risk_assessment.get("consecutive_losses", 0)
+        condition_confidence = entry_conditions.get("confidence", 0.0)
+        confidence, decision_code, mood_code, flags = _score_entry(
+            float(predicted_win_rate),
+            float(daily_risk_ratio),
+            int(consecutive_losses),
+            _STAGE_CODES.get(risk_assessment.get("stage", "unknown"), 0),
+            _REGIME_CODES.get(entry_conditions.get("regime"), 0),
+            float(condition_confidence),
+        )
+        
+        # 판단 근거 문장 (판단 순서: 시장 상황, 진입 조건, 승률, 리스크)
+        reasoning = thought["reasoning"]
+        concerns = thought["concerns"]
+        reasoning.append(f"시장 상황: {market_analysis['summary']}")  # 항상 reasoning[0]
+        
+        if flags & _F_REGIME_BULL:
+            reasoning.append("강세장 레짐 확인 - Long 진입에 유리")
+        elif flags & _F_REGIME_BEAR:
+            reasoning.append("약세장 레짐 확인 - Short 진입에 유리")
+        else:
+            concerns.append("횡보장 - 진입 신중 필요")
         
-        # 2. 진입 조건 평가
-        condition_eval = self._evaluate_entry_conditions(entry_conditions)
-        thought["reasoning"].extend(condition_eval["reasons"])
-        thought["concerns"].extend(condition_eval["concerns"])
+        bb_position = entry_conditions.get("bb_position")
+        if bb_position == "lower_touch":
+            reasoning.append("가격이 볼린저 밴드 하단 터치 - 반등 가능성")
+        elif bb_position == "upper_touch":
+            reasoning.append("가격이 볼린저 밴드 상단 터치 - 조정 가능성")
         
-        # 3. 승률 평가
-        if predicted_win_rate >= 0.70:
-            thought["reasoning"].append(f"높은 예상 승률: {predicted_win_rate:.1%} - 강한 진입 신호")
-            thought["confidence"] += 0.3
-        elif predicted_win_rate >= 0.60:
-            thought["reasoning"].append(f"양호한 예상 승률: {predicted_win_rate:.1%} - 진입 고려")
-            thought["confidence"] += 0.2
-        elif predicted_win_rate >= 0.50:
-            thought["reasoning"].append(f"보통 예상 승률: {predicted_win_rate:.1%} - 신중한 접근 필요")
-            thought["confidence"] += 0.1
+        ema_alignment = entry_conditions.get("ema_alignment")
+        if ema_alignment:
+            reasoning.append(f"EMA 정렬 확인: {ema_alignment}")
+        
+        if flags & _F_CONF_HIGH:
+            reasoning.append(f"높은 신뢰도: {condition_confidence:.1%}")
+        elif flags & _F_CONF_LOW:
+            concerns.append(f"낮은 신뢰도: {condition_confidence:.1%}")
+        
+        if flags & _F_WIN_RATE_HIGH:
+            reasoning.append(f"높은 예상 승률: {predicted_win_rate:.1%} - 강한 진입 신호")
+        elif flags & _F_WIN_RATE_GOOD:
+            reasoning.append(f"양호한 예상 승률: {predicted_win_rate:.1%} - 진입 고려")
+        elif flags & _F_WIN_RATE_MID:
+            reasoning.append(f"보통 예상 승률: {predicted_win_rate:.1%} - 신중한 접근 필요")
         else:
-            thought["concerns"].append(f"낮은 예상 승률: {predicted_win_rate:.1%} - 진입 위험")
-            thought["confidence"] -= 0.2
+            concerns.append(f"낮은 예상 승률: {predicted_win_rate:.1%} - 진입 위험")
         
-        # 4. 리스크 평가
-        risk_eval = self._evaluate_risk(risk_assessment)
-        thought["reasoning"].extend(risk_eval["reasons"])
-        thought["concerns"].extend(risk_eval["concerns"])
-        thought["confidence"] += risk_eval["confidence_adjustment"]
+        if flags & _F_STAGE_SEEDLING:
+            reasoning.append("초기 시드 단계 - 보수적 접근")
+            concerns.append("시드가 작아 리스크 관리 중요")
+        elif flags & _F_STAGE_PROSPEROUS:
+            reasoning.append("번영 단계 - 여유 있는 리스크 관리 가능")
         
-        # 5. 최종 결정
-        thought["confidence"] = max(0.0, min(1.0, thought["confidence"]))
+        if flags & _F_DAILY_RISK_HIGH:
+            concerns.append(f"일일 리스크 거의 소진: {daily_risk_ratio:.1%}")
+        elif flags & _F_DAILY_RISK_LOW:
+            reasoning.append(f"일일 리스크 여유: {daily_risk_ratio:.1%}")
         
-        if thought["confidence"] >= 0.7 and len(thought["concerns"]) == 0:
-            thought["decision"] = "enter"
-            thought["mood"] = "confident"
-        elif thought["confidence"] >= 0.6 and len(thought["concerns"]) <= 1:
-            thought["decision"] = "enter"
-            thought["mood"] = "cautious"
-        elif thought["confidence"] >= 0.5:
-            thought["decision"] = "wait"
-            thought["mood"] = "cautious"
-        else:
-            thought["decision"] = "skip"
-            thought["mood"] = "fearful"
+        if flags & _F_CONSEC_LOSSES:
+            concerns.append(f"연속 손실 {consecutive_losses}회 - 신중 필요")
+        
+        # 최종 결정
+        thought["confidence"] = confidence
+        thought["decision"] = _DECISIONS[decision_code]
+        thought["mood"] = _MOODS[mood_code]
         
         # 6. 상세한 진입 이유 생성
         thought["detailed_reason"] = self._generate_detailed_reason(thought)
@@ -128,30 +289,15 @@ class TradingMind:
         atr = market_data.get("atr", 0.0)
         price_change = market_data.get("price_change_pct", 0.0)
         
-        summary_parts = []
+        volatility_pct = safe_divide(atr, price) * 100
+        volume_ratio = safe_divide(volume, volume_ma, 1.0)  # 평균 거래량 없으면 보통으로 취급
         
-        # 레짐 분석
-        if regime == "bull":
-            summary_parts.append("강세장")
-        elif regime == "bear":
-            summary_parts.append("약세장")
-        else:
-            summary_parts.append("횡보장")
-        
-        # 변동성 분석
-        volatility_pct = (atr / price * 100) if price > 0 else 0.0
-        if volatility_pct > 3.0:
-            summary_parts.append("고변동성")
-        elif volatility_pct < 1.0:
-            summary_parts.append("저변동성")
-        
-        # 거래량 분석
-        if volume_ma > 0:
-            volume_ratio = volume / volume_ma
-            if volume_ratio > 1.5:
-                summary_parts.append("거래량 급증")
-            elif volume_ratio < 0.5:
-                summary_parts.append("거래량 부족")
+        # 레짐 / 변동성 / 거래량 라벨 (버킷 인덱스: 낮음 0, 보통 1, 높음 2)
+        summary_parts = [
+            _REGIME_LABELS.get(regime, "횡보장"),
+            _VOLATILITY_LABELS[1 + (volatility_pct > 3.0) - (volatility_pct < 1.0)],
+            _VOLUME_LABELS[1 + (volume_ratio > 1.5) - (volume_ratio < 0.5)],
+        ]
         
         # 가격 움직임
         if abs(price_change) > 2.0:
@@ -160,149 +306,44 @@ class TradingMind:
         return {
             "regime": regime,
             "volatility_pct": volatility_pct,
-            "volume_ratio": volume / volume_ma if volume_ma > 0 else 1.0,
+            "volume_ratio": volume_ratio,
             "price_change_pct": price_change,
-            "summary": ", ".join(summary_parts) if summary_parts else "정상",
-        }
-    
-    def _evaluate_entry_conditions(self, conditions: Dict[str, Any]) -> Dict[str, Any]:
-        """진입 조건 평가"""
-        reasons = []
-        concerns = []
-        
-        # 레짐 확인
-        regime = conditions.get("regime")
-        if regime == "bull":
-            reasons.append("강세장 레짐 확인 - Long 진입에 유리")
-        elif regime == "bear":
-            reasons.append("약세장 레짐 확인 - Short 진입에 유리")
-        else:
-            concerns.append("횡보장 - 진입 신중 필요")
-        
-        # 볼린저 밴드 위치
-        bb_position = conditions.get("bb_position")
-        if bb_position == "lower_touch":
-            reasons.append("가격이 볼린저 밴드 하단 터치 - 반등 가능성")
-        elif bb_position == "upper_touch":
-            reasons.append("가격이 볼린저 밴드 상단 터치 - 조정 가능성")
-        
-        # EMA 정렬
-        ema_alignment = conditions.get("ema_alignment")
-        if ema_alignment:
-            reasons.append(f"EMA 정렬 확인: {ema_alignment}")
-        
-        # 신뢰도
-        confidence = conditions.get("confidence", 0.0)
-        if confidence >= 0.8:
-            reasons.append(f"높은 신뢰도: {confidence:.1%}")
-        elif confidence < 0.6:
-            concerns.append(f"낮은 신뢰도: {confidence:.1%}")
-        
-        return {
-            "reasons": reasons,
-            "concerns": concerns,
-        }
-    
-    def _evaluate_risk(self, risk_assessment: Dict[str, Any]) -> Dict[str, Any]:
-        """리스크 평가"""
-        reasons = []
-        concerns = []
-        confidence_adjustment = 0.0
-        
-        # 시드 단계
-        stage = risk_assessment.get("stage", "unknown")
-        if stage == "seedling":
-            reasons.append("초기 시드 단계 - 보수적 접근")
-            concerns.append("시드가 작아 리스크 관리 중요")
-        elif stage == "prosperous":
-            reasons.append("번영 단계 - 여유 있는 리스크 관리 가능")
-            confidence_adjustment += 0.1
-        
-        # 일일 리스크
-        daily_risk_ratio = risk_assessment.get("daily_risk_ratio", 0.0)
-        if daily_risk_ratio > 0.8:
-            concerns.append(f"일일 리스크 거의 소진: {daily_risk_ratio:.1%}")
-            confidence_adjustment -= 0.2
-        elif daily_risk_ratio < 0.3:
-            reasons.append(f"일일 리스크 여유: {daily_risk_ratio:.1%}")
-            confidence_adjustment += 0.1
-        
-        # 연속 손실
-        consecutive_losses = risk_assessment.get("consecutive_losses", 0)
-        if consecutive_losses >= 2:
-            concerns.append(f"연속 손실 {consecutive_losses}회 - 신중 필요")
-            confidence_adjustment -= 0.15
-        
-        return {
-            "reasons": reasons,
-            "concerns": concerns,
-            "confidence_adjustment": confidence_adjustment,
+            "summary": ", ".join(filter(None, summary_parts)),
         }
     
     def _generate_detailed_reason(self, thought: Dict[str, Any]) -> str:
         """상세한 진입 이유 생성 (텍스트)"""
-        parts = []
-        
-        # 시장 상황
         market = thought.get("market_situation", {})
-        parts.append(f"【시장 상황】{market.get('summary', '분석 중')}")
         
-        # 진입 조건
-        parts.append("\n【진입 조건 분석】")
-        for reason in thought.get("reasoning", []):
-            if "시장 상황" not in reason:
-                parts.append(f"  ✓ {reason}")
+        # 진입 조건 (reasoning[0]은 시장 상황 요약이므로 제외)
+        reasons = "".join(f"\n  ✓ {reason}" for reason in thought.get("reasoning", [])[1:])
         
         # 우려사항
-        if thought.get("concerns"):
-            parts.append("\n【우려사항】")
-            for concern in thought["concerns"]:
-                parts.append(f"  ⚠ {concern}")
-        
-        # 승률
-        win_rate = thought.get("predicted_win_rate", 0.0)
-        parts.append(f"\n【예상 승률】{win_rate:.1%}")
-        
-        # 신뢰도
-        confidence = thought.get("confidence", 0.0)
-        parts.append(f"【신뢰도】{confidence:.1%}")
+        concerns = thought.get("concerns")
+        concerns_block = "\n\n【우려사항】" + "".join(f"\n  ⚠ {concern}" for concern in concerns) if concerns else ""
         
-        # 최종 결정
         decision = thought.get("decision", "pending")
-        decision_text = {
-            "enter": "진입 결정",
-            "wait": "대기 결정",
-            "skip": "진입 포기",
-        }.get(decision, "미결정")
-        parts.append(f"\n【최종 결정】{decision_text}")
-        
-        if decision == "enter":
-            parts.append("\n이 거래는 다음 이유로 진입합니다:")
-            parts.append("  1. 시장 조건이 진입에 유리함")
-            parts.append("  2. 예상 승률이 임계값을 초과함")
-            parts.append("  3. 리스크가 허용 범위 내임")
-        elif decision == "wait":
-            parts.append("\n더 나은 기회를 기다립니다.")
-        elif decision == "skip":
-            parts.append("\n리스크가 너무 크거나 조건이 불충분합니다.")
-        
-        return "\n".join(parts)
+        return (
+            f"【시장 상황】{market.get('summary', '분석 중')}\n"
+            f"\n【진입 조건 분석】{reasons}{concerns_block}\n"
+            f"\n【예상 승률】{thought.get('predicted_win_rate', 0.0):.1%}\n"
+            f"【신뢰도】{thought.get('confidence', 0.0):.1%}\n"
+            f"\n【최종 결정】{_DECISION_TEXT.get(decision, '미결정')}"
+            f"{_DECISION_TAIL.get(decision, '')}"
+        )
     
     def _log_thought(self, thought: Dict[str, Any]):
         """생각 로그에 추가"""
-        self.thought_log.append(thought)
-        
-        # 최근 생각만 유지
-        if len(self.thought_log) > self.max_thoughts:
-            self.thought_log.pop(0)
+        self.thought_log.append(thought)  # maxlen 초과 시 가장 오래된 생각 자동 제거
         
         # 로그 출력
-        logger.info("=" * 60)
-        logger.info("🧠 트레이딩 마인드 생각:")
-        logger.info(thought["detailed_reason"])
-        logger.info("=" * 60)
+        # 한 레코드로 출력 (레벨 미달이면 포맷팅 자체를 건너뜀)
+        logger.info("{0}\n🧠 트레이딩 마인드 생각:\n{1}\n{0}", _THOUGHT_RULE, thought["detailed_reason"])
     
     def get_recent_thoughts(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """최근 생각 반환"""
-        return self.thought_log[-limit:] if self.thought_log else []
+        """최근 생각 반환 (ISO 형식 timestamp 포함 사본)"""
+        return [
+            {**thought, "timestamp": _format_ts(thought["timestamp_ns"])}
+            for thought in islice(self.thought_log, max(0, len(self.thought_log) - limit), None)
+        ]
 
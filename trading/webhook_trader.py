@@ -1,15 +1,19 @@
 """웹훅 기반 거래자 - TradingView 웹훅으로 봉 마감 데이터 수신"""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from trading.live_trader import LiveTrader
 from strategy.strategy_registry import StrategyRegistry
 from backtest.engine import BacktestEngine
 from utils.logger import get_logger
+from utils.helpers import parse_iso_datetime
 
 logger = get_logger(__name__)
 
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
 
 class WebhookTrader:
     """웹훅 기반 거래자 - TradingView에서 봉 마감 데이터 수신"""
@@ -29,17 +33,28 @@ class WebhookTrader:
         self.config = config
         self.live_trader = live_trader
         
+        # 봉마다 다시 읽지 않도록 설정값을 미리 추출
+        self._strategy_name = config.get("strategy", {}).get("name", "EMA_BB_TurtleTrailing")
+        self._backtest_cfg = config.get("backtest", {})
+        self._min_history = int(config.get("webhook", {}).get("min_history", 100))
+        
         # 최근 수신된 봉 데이터
         self.last_bar: Optional[Dict[str, Any]] = None
         self.last_bar_timestamp: Optional[datetime] = None
         
+        # 마지막으로 파싱한 타임스탬프 문자열 (TradingView 재전송 시 재파싱 생략)
+        self._ts_cache: Tuple[str, Optional[datetime]] = ("", None)
+        
         # 웹훅만으로 거래 실행을 위한 백테스트 엔진 (LiveTrader가 없을 때)
         self.backtest_engine: Optional[BacktestEngine] = None
         self.position_manager = None
         
-        # 봉 데이터 히스토리 (지표 계산용)
-        self.bar_history: list = []
+        # 봉 데이터 히스토리 (지표 계산용, 고정 크기 링 버퍼)
         self.max_history = 200
+        self._ohlcv = np.empty((self.max_history, len(_OHLCV_COLUMNS)), dtype=np.float64)
+        self._ts = np.empty(self.max_history, dtype="datetime64[ns]")
+        self._head = 0  # 지금까지 기록한 봉 수 (다음 쓰기 위치 = _head % max_history)
+        self._count = 0  # 버퍼에 남아 있는 봉 수
         
         logger.info("웹훅 거래자 초기화 완료")
         if live_trader:
@@ -58,16 +73,13 @@ class WebhookTrader:
             # 타임스탬프 파싱
             timestamp_str = bar_data.get("timestamp")
             if isinstance(timestamp_str, str):
-                try:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                except:
-                    timestamp = datetime.now()
+                timestamp = self._parse_timestamp(timestamp_str)
             else:
                 timestamp = datetime.now()
             
             # 중복 봉 체크 (같은 타임스탬프면 무시)
             if self.last_bar_timestamp and timestamp <= self.last_bar_timestamp:
-                logger.debug(f"중복 봉 무시: {timestamp}")
+                logger.opt(lazy=True).debug("중복 봉 무시: {}", lambda: timestamp)
                 return
             
             # 봉 데이터 정규화
@@ -82,12 +94,7 @@ class WebhookTrader:
                 "timeframe": bar_data.get("timeframe", "1m"),
             }
             
-            logger.info(f"웹훅 봉 데이터 수신: {normalized_bar['symbol']} @ {timestamp}, Close: {normalized_bar['close']}")
-            
-            # 봉 히스토리에 추가
-            self.bar_history.append(normalized_bar)
-            if len(self.bar_history) > self.max_history:
-                self.bar_history.pop(0)
+            logger.info("웹훅 봉 데이터 수신: {} @ {}, Close: {}", normalized_bar["symbol"], timestamp, normalized_bar["close"])
             
             # 실시간 거래자에 전달 (우선)
             if self.live_trader:
@@ -97,6 +104,8 @@ class WebhookTrader:
             else:
                 # LiveTrader가 없으면 웹훅만으로 거래 시도
                 logger.info("🔄 LiveTrader 없음 - 웹훅만으로 거래 처리 시도")
+                # 봉 히스토리는 직접 처리 경로에서만 사용 (LiveTrader는 자체적으로 봉 처리)
+                self._append_history(normalized_bar)
                 self._process_webhook_bar_directly(normalized_bar)
             
             # 최근 봉 업데이트
@@ -118,22 +127,17 @@ class WebhookTrader:
             # 백테스트 엔진 초기화 (처음 한 번만)
             if self.backtest_engine is None:
                 logger.info("백테스트 엔진 초기화 중...")
-                strategy_config = self.config.get("strategy", {})
-                strategy_name = strategy_config.get("name", "EMA_BB_TurtleTrailing")
-                strategy = StrategyRegistry.get_strategy(strategy_name, self.config)
-                backtest_config = self.config.get("backtest", {})
-                self.backtest_engine = BacktestEngine(strategy, backtest_config)
+                strategy = StrategyRegistry.get_strategy(self._strategy_name, self.config)
+                self.backtest_engine = BacktestEngine(strategy, self._backtest_cfg)
                 logger.info("✅ 백테스트 엔진 초기화 완료")
             
             # 봉 데이터를 DataFrame으로 변환 (히스토리 포함)
-            if len(self.bar_history) < 100:
-                logger.debug(f"봉 히스토리 부족: {len(self.bar_history)}개 (최소 100개 필요)")
+            if self._count < self._min_history:
+                logger.debug("봉 히스토리 부족: {}개 (최소 {}개 필요)", self._count, self._min_history)
                 return
             
             # DataFrame 생성
-            df = pd.DataFrame(self.bar_history)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df.set_index('timestamp', inplace=True)
+            df = self._as_dataframe()
             
             # 마지막 봉 처리 (간단한 버전)
             # 실제로는 더 복잡한 로직이 필요하지만, 기본적인 거래는 가능
@@ -143,6 +147,58 @@ class WebhookTrader:
         except Exception as e:
             logger.error(f"웹훅 직접 처리 실패: {e}")
     
+    def _parse_timestamp(self, timestamp_str: str) -> datetime:
+        """
+        ISO 형식 타임스탬프 문자열 파싱 (직전 문자열과 같으면 캐시 재사용)
+        
+        Args:
+            timestamp_str: ISO 형식 타임스탬프 ('Z' 접미사 허용)
+            
+        Returns:
+            파싱된 시각 (파싱 실패 시 현재 시각)
+        """
+        cached_str, cached_ts = self._ts_cache
+        if timestamp_str == cached_str:
+            return cached_ts
+        
+        try:
+            timestamp = parse_iso_datetime(timestamp_str)
+        except (ValueError, TypeError):
+            return datetime.now()  # 실패값은 캐시하지 않음
+        
+        self._ts_cache = (timestamp_str, timestamp)
+        return timestamp
+    
+    def _append_history(self, bar: Dict[str, Any]):
+        """
+        링 버퍼에 봉 추가 - O(1), 할당 없음
+        
+        Args:
+            bar: 정규화된 봉 데이터
+        """
+        ts = pd.Timestamp(bar["timestamp"])
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert(None)  # UTC 기준 naive 시각으로 저장
+        
+        idx = self._head % self.max_history
+        self._ohlcv[idx] = (bar["open"], bar["high"], bar["low"], bar["close"], bar["volume"])
+        self._ts[idx] = ts.value
+        self._head += 1
+        self._count = min(self._count + 1, self.max_history)
+    
+    def _as_dataframe(self) -> pd.DataFrame:
+        """
+        링 버퍼를 시간순 DataFrame으로 변환 (필요할 때만 생성)
+        
+        Returns:
+            timestamp 인덱스의 OHLCV 데이터프레임
+        """
+        start = (self._head - self._count) % self.max_history
+        order = (start + np.arange(self._count)) % self.max_history
+        df = pd.DataFrame(self._ohlcv[order], columns=list(_OHLCV_COLUMNS))
+        df.index = pd.DatetimeIndex(self._ts[order], name="timestamp")
+        return df
+    
     def get_last_bar(self) -> Optional[Dict[str, Any]]:
         """최근 수신된 봉 데이터 반환"""
         return self.last_bar
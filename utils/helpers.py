@@ -1,13 +1,25 @@
 """공통 헬퍼 함수"""
 
 from typing import Any, Dict, Optional
+from datetime import datetime
 from pathlib import Path
 import yaml
 import pandas as pd
 from utils.logger import get_logger
 
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+except ImportError:  # pragma: no cover - ciso8601은 선택 의존성
+    _ciso_parse_datetime = None
+
 logger = get_logger(__name__)
 
+# libyaml이 있으면 C 구현 로더/덤퍼 사용 (없으면 순수 파이썬 구현)
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - libyaml 미포함 빌드
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 
 def load_yaml(file_path: str) -> Dict[str, Any]:
     """
@@ -24,7 +36,7 @@ def load_yaml(file_path: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
     
     with open(path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
     
     logger.debug(f"YAML 파일 로드 완료: {file_path}")
     return config
@@ -42,7 +54,7 @@ def save_yaml(data: Dict[str, Any], file_path: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
     
     logger.debug(f"YAML 파일 저장 완료: {file_path}")
 
@@ -84,6 +96,26 @@ def parse_timestamp(timestamp: Any, format: Optional[str] = None) -> pd.Timestam
         return pd.to_datetime(timestamp)
 
 
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    ISO 8601 문자열을 datetime으로 파싱 ('Z' 접미사 허용)
+    
+    Args:
+        value: ISO 8601 형식 문자열
+        
+    Returns:
+        datetime (오프셋이 있으면 timezone-aware)
+        
+    Raises:
+        ValueError: 형식이 올바르지 않을 때
+    """
+    if _ciso_parse_datetime is not None:
+        return _ciso_parse_datetime(value)
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
 def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
     """
     안전한 나눗셈 (0으로 나누기 방지)
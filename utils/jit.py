@@ -0,0 +1,23 @@
+"""Numba JIT 호환 유틸리티 (numba 미설치 시 순수 파이썬으로 동작)"""
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba는 선택 의존성
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba.njit 대체 - 함수를 그대로 반환"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    prange = range
+
+
+__all__ = ["njit", "prange", "HAS_NUMBA"]
@@ -1,6 +1,7 @@
 """로깅 유틸리티 모듈"""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from loguru import logger
@@ -61,9 +62,10 @@ def setup_logger(
         )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = __name__):
     """
-    로거 인스턴스 반환
+    로거 인스턴스 반환 (이름별로 한 번만 bind하여 재사용)
     
     Args:
         name: 로거 이름
@@ -1,8 +1,9 @@
 """설정 및 데이터 검증 유틸리티"""
 
 from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +28,11 @@ class StrategyConfig(BaseModel):
     exit: Dict[str, Any]
 
 
+# 검증기는 모듈 로드 시 한 번만 생성해 재사용
+_DATA_CONFIG_ADAPTER = TypeAdapter(DataConfig)
+_STRATEGY_CONFIG_ADAPTER = TypeAdapter(StrategyConfig)
+
+
 def validate_config(config: Dict[str, Any]) -> bool:
     """
     설정 파일 검증
@@ -49,11 +55,11 @@ def validate_config(config: Dict[str, Any]) -> bool:
         
         # 데이터 설정 검증
         if "data" in config:
-            DataConfig(**config["data"])
+            _DATA_CONFIG_ADAPTER.validate_python(config["data"])
         
         # 전략 설정 검증
         if "strategy" in config:
-            StrategyConfig(**config["strategy"])
+            _STRATEGY_CONFIG_ADAPTER.validate_python(config["strategy"])
         
         logger.info("설정 파일 검증 완료")
         return True
@@ -92,19 +98,24 @@ def validate_data(
     if required_columns is None:
         required_columns = ["open", "high", "low", "close", "volume"]
     
-    # 필수 컬럼 확인
-    missing_columns = set(required_columns) - set(df.columns)
-    if missing_columns:
+    # 필수 컬럼 확인 (위치 인덱스는 결측치 확인에서 재사용)
+    column_positions = df.columns.get_indexer_for(required_columns)
+    if (column_positions < 0).any():
+        missing_columns = {col for col in required_columns if col not in df.columns}
         raise ValueError(f"필수 컬럼이 없습니다: {missing_columns}")
     
     # 결측치 확인
     if check_missing:
-        missing_count = df[required_columns].isnull().sum().sum()
+        # 필수 컬럼 블록을 한 번만 훑어 결측 마스크를 만들고 개수/행 출력에 재사용
+        missing_mask = pd.isna(df.iloc[:, column_positions].to_numpy())
+        missing_count = int(missing_mask.sum())
         if missing_count > 0:
             logger.warning(f"결측치 발견: {missing_count}개")
-            # 결측치가 있는 행 출력
-            missing_rows = df[df[required_columns].isnull().any(axis=1)]
-            logger.debug(f"결측치가 있는 행:\n{missing_rows}")
+            # 결측치가 있는 행 출력 (DEBUG 레벨일 때만 필터링/문자열화)
+            logger.opt(lazy=True).debug(
+                "결측치가 있는 행:\n{}",
+                lambda: df.iloc[np.flatnonzero(missing_mask.any(axis=1))],
+            )
     
     # 중복 확인
     if check_duplicates:
@@ -117,6 +128,6 @@ def validate_data(
         if not df["timestamp"].is_monotonic_increasing:
             logger.warning("타임스탬프가 시간 순서대로 정렬되지 않았습니다.")
     
-    logger.info(f"데이터 검증 완료: {len(df)}행, {len(df.columns)}컬럼")
+    logger.info("데이터 검증 완료: {}행, {}컬럼", len(df), len(df.columns))
     return True
 
@@ -1,5 +1,6 @@
 """차트 생성 모듈"""
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
@@ -9,6 +10,93 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 차트 트레이스당 최대 포인트 수 (초과 시 구간 집계로 다운샘플링)
+DEFAULT_MAX_POINTS = 5000
+
+# 이 포인트 수를 넘는 Scatter 트레이스는 WebGL(Scattergl)로 렌더링
+WEBGL_THRESHOLD = 2000
+
+# OHLCV 컬럼의 구간 집계 방식 (그 외 수치 컬럼은 평균, 비수치 컬럼은 마지막 값)
+_OHLCV_AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+
+def scatter_class(n_points: int, threshold: int = WEBGL_THRESHOLD):
+    """
+    포인트 수에 맞는 Scatter 트레이스 클래스 선택
+    
+    Args:
+        n_points: 트레이스 포인트 수
+        threshold: WebGL 전환 기준 포인트 수
+        
+    Returns:
+        go.Scattergl (threshold 초과) 또는 go.Scatter
+    """
+    return go.Scattergl if n_points > threshold else go.Scatter
+
+
+def _ema_columns(df: pd.DataFrame) -> list:
+    """이름에 'ema'(대소문자 무관)가 들어간 컬럼 목록"""
+    return [col for col in df.columns if "ema" in col.lower()]
+
+
+def _downsample_ohlc(df: pd.DataFrame, max_points: int) -> pd.DataFrame:
+    """
+    연속한 봉을 최대 max_points개 구간으로 묶어 OHLCV 집계
+    
+    시간 간격이 불규칙한 인덱스에서도 동작하도록 봉 개수 기준으로 묶고,
+    각 구간의 인덱스는 첫 봉의 인덱스를 사용.
+    
+    Args:
+        df: OHLCV 데이터프레임 (지표 포함)
+        max_points: 최대 포인트 수
+        
+    Returns:
+        다운샘플링된 데이터프레임 (max_points 이하이면 원본 그대로)
+    """
+    n = len(df)
+    if n <= max_points:
+        return df
+    
+    bucket_size = -(-n // max_points)  # 올림 나눗셈
+    agg = {
+        col: _OHLCV_AGG.get(col, "mean" if pd.api.types.is_numeric_dtype(df[col]) else "last")
+        for col in df.columns
+    }
+    buckets = np.arange(n) // bucket_size
+    downsampled = df.groupby(buckets, sort=False).agg(agg)
+    downsampled.index = df.index[::bucket_size]
+    return downsampled
+
+
+def _downsample_line(x: pd.Index, y: np.ndarray, max_points: int):
+    """
+    선 차트용 min/max 구간 다운샘플링 (구간별 최저/최고점을 시간 순서대로 유지)
+    
+    Args:
+        x: x축 인덱스
+        y: y값 배열
+        max_points: 최대 포인트 수
+        
+    Returns:
+        (x, y) 다운샘플링 결과 (max_points 이하이면 원본 그대로)
+    """
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    
+    bucket_size = -(-n // max(max_points // 2, 1))  # 구간당 최저/최고 2점
+    n_buckets = -(-n // bucket_size)
+    padded = np.full(n_buckets * bucket_size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(n_buckets, bucket_size)
+    
+    # NaN은 극값 후보에서 제외 (구간 전체가 NaN이면 첫 봉 선택)
+    offsets = np.arange(n_buckets) * bucket_size
+    lows = offsets + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+    keep = np.union1d(lows, highs)
+    return x[keep], y[keep]
+
 
 def create_main_chart(
     df: pd.DataFrame,
@@ -47,6 +135,8 @@ def _create_plotly_main_chart(
     config: Dict[str, Any],
 ) -> go.Figure:
     """Plotly 메인 차트 생성"""
+    df = _downsample_ohlc(df, config.get("max_points", DEFAULT_MAX_POINTS))
+    
     fig = make_subplots(
         rows=2,
         cols=1,
@@ -56,105 +146,113 @@ def _create_plotly_main_chart(
         subplot_titles=("가격 차트", "거래량"),
     )
     
+    # 트레이스마다 Series 변환을 반복하지 않도록 배열을 한 번만 추출
+    ema_cols = _ema_columns(df)
+    x = df.index.to_numpy()
+    columns = {col: df[col].to_numpy() for col in df.columns}
+    scatter = scatter_class(len(df), config.get("webgl_threshold", WEBGL_THRESHOLD))
+    
+    # 트레이스를 모아 한 번에 추가 (add_trace마다 레이아웃 갱신 방지)
+    traces = []
+    rows = []
+    
     # 캔들스틱
-    fig.add_trace(
+    traces.append(
         go.Candlestick(
-            x=df.index,
-            open=df["open"],
-            high=df["high"],
-            low=df["low"],
-            close=df["close"],
+            x=x,
+            open=columns["open"],
+            high=columns["high"],
+            low=columns["low"],
+            close=columns["close"],
             name="Price",
-        ),
-        row=1,
-        col=1,
+        )
     )
+    rows.append(1)
     
     # EMA 라인
-    for col in df.columns:
-        if "EMA" in col or "ema" in col:
-            fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df[col],
-                    name=col,
-                    line=dict(width=1),
-                ),
-                row=1,
-                col=1,
+    for col in ema_cols:
+        traces.append(
+            scatter(
+                x=x,
+                y=columns[col],
+                name=col,
+                line=dict(width=1),
             )
+        )
+        rows.append(1)
     
     # Bollinger Bands
-    if "bb_upper" in df.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df["bb_upper"],
+    if "bb_upper" in columns:
+        traces.append(
+            scatter(
+                x=x,
+                y=columns["bb_upper"],
                 name="BB Upper",
                 line=dict(color="gray", width=1, dash="dash"),
                 showlegend=False,
-            ),
-            row=1,
-            col=1,
+            )
         )
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df["bb_lower"],
+        traces.append(
+            scatter(
+                x=x,
+                y=columns["bb_lower"],
                 name="BB Lower",
                 line=dict(color="gray", width=1, dash="dash"),
                 fill="tonexty",
                 fillcolor="rgba(128,128,128,0.1)",
                 showlegend=False,
-            ),
-            row=1,
-            col=1,
+            )
         )
+        rows += [1, 1]
     
-    # 진입/청산 마커
+    # 진입/청산 마커 (방향별로 한 번에 나누고 필요한 두 컬럼만 배열로 추출)
     if trades_df is not None and not trades_df.empty:
+        entries = {
+            direction: (group["entry_time"].to_numpy(), group["entry_price"].to_numpy())
+            for direction, group in trades_df.groupby("direction", sort=False)[["entry_time", "entry_price"]]
+        }
+        
         # Long 진입
-        long_entries = trades_df[trades_df["direction"] == "long"]
-        if not long_entries.empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=long_entries["entry_time"],
-                    y=long_entries["entry_price"],
+        if "long" in entries:
+            entry_time, entry_price = entries["long"]
+            traces.append(
+                scatter(
+                    x=entry_time,
+                    y=entry_price,
                     mode="markers",
                     name="Long Entry",
                     marker=dict(symbol="triangle-up", size=10, color="green"),
-                ),
-                row=1,
-                col=1,
+                )
             )
+            rows.append(1)
         
         # Short 진입
-        short_entries = trades_df[trades_df["direction"] == "short"]
-        if not short_entries.empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=short_entries["entry_time"],
-                    y=short_entries["entry_price"],
+        if "short" in entries:
+            entry_time, entry_price = entries["short"]
+            traces.append(
+                scatter(
+                    x=entry_time,
+                    y=entry_price,
                     mode="markers",
                     name="Short Entry",
                     marker=dict(symbol="triangle-down", size=10, color="red"),
-                ),
-                row=1,
-                col=1,
+                )
             )
+            rows.append(1)
     
     # 거래량
-    if "volume" in df.columns:
-        fig.add_trace(
+    if "volume" in columns:
+        traces.append(
             go.Bar(
-                x=df.index,
-                y=df["volume"],
+                x=x,
+                y=columns["volume"],
                 name="Volume",
                 marker_color="blue",
-            ),
-            row=2,
-            col=1,
+            )
         )
+        rows.append(2)
+    
+    fig.add_traces(traces, rows=rows, cols=[1] * len(rows))
     
     # 레짐 배경색
     if regime_series is not None:
@@ -182,9 +280,8 @@ def _create_matplotlib_main_chart(
     ax1.plot(df.index, df["close"], label="Close", linewidth=1)
     
     # EMA
-    for col in df.columns:
-        if "EMA" in col or "ema" in col:
-            ax1.plot(df.index, df[col], label=col, linewidth=1)
+    for col in _ema_columns(df):
+        ax1.plot(df.index, df[col], label=col, linewidth=1)
     
     ax1.set_ylabel("Price")
     ax1.legend()
@@ -213,53 +310,53 @@ def _add_regime_background(fig: go.Figure, index: pd.DatetimeIndex, regime_serie
     pass
 
 
-def create_equity_chart(equity_curve_df: pd.DataFrame) -> go.Figure:
-    """자산 곡선 차트 생성"""
-    fig = go.Figure()
-    
-    fig.add_trace(
-        go.Scatter(
-            x=equity_curve_df.index,
-            y=equity_curve_df["equity"],
-            name="Equity",
-            line=dict(color="blue", width=2),
-        )
+def create_equity_chart(equity_curve_df: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS) -> go.Figure:
+    """자산 곡선 차트 생성 (max_points 초과 시 구간별 최저/최고점만 표시)"""
+    x, equity = _downsample_line(
+        equity_curve_df.index, equity_curve_df["equity"].to_numpy(dtype=np.float64), max_points
     )
     
-    fig.update_layout(
-        title="자산 곡선",
-        xaxis_title="시간",
-        yaxis_title="자산",
-        height=400,
+    return go.Figure(
+        data=[
+            scatter_class(len(x))(
+                x=x,
+                y=equity,
+                name="Equity",
+                line=dict(color="blue", width=2),
+            )
+        ],
+        layout=dict(
+            title="자산 곡선",
+            xaxis_title="시간",
+            yaxis_title="자산",
+            height=400,
+        ),
     )
-    
-    return fig
 
 
-def create_drawdown_chart(equity_curve_df: pd.DataFrame) -> go.Figure:
-    """드로다운 차트 생성"""
+def create_drawdown_chart(equity_curve_df: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS) -> go.Figure:
+    """드로다운 차트 생성 (max_points 초과 시 구간별 최저/최고점만 표시)"""
     equity_series = equity_curve_df["equity"]
-    running_max = equity_series.expanding().max()
-    drawdown = (equity_series - running_max) / running_max
+    # fmax는 NaN을 건너뛰어 expanding().max()와 같은 결과
+    equity_values = equity_series.to_numpy(dtype=np.float64)
+    running_max = np.fmax.accumulate(equity_values)
+    x, drawdown = _downsample_line(equity_series.index, (equity_values - running_max) / running_max, max_points)
     
-    fig = go.Figure()
-    
-    fig.add_trace(
-        go.Scatter(
-            x=drawdown.index,
-            y=drawdown * 100,
-            name="Drawdown",
-            fill="tozeroy",
-            line=dict(color="red", width=1),
-        )
-    )
-    
-    fig.update_layout(
-        title="드로다운",
-        xaxis_title="시간",
-        yaxis_title="드로다운 (%)",
-        height=400,
+    return go.Figure(
+        data=[
+            scatter_class(len(x))(
+                x=x,
+                y=drawdown * 100,
+                name="Drawdown",
+                fill="tozeroy",
+                line=dict(color="red", width=1),
+            )
+        ],
+        layout=dict(
+            title="드로다운",
+            xaxis_title="시간",
+            yaxis_title="드로다운 (%)",
+            height=400,
+        ),
     )
-    
-    return fig
 
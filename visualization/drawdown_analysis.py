@@ -1,12 +1,65 @@
 """드로다운 분석 차트 모듈"""
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Optional
 from utils.logger import get_logger
+from visualization.charts import scatter_class
+from utils.jit import njit, HAS_NUMBA
 
 logger = get_logger(__name__)
 
+# 드로다운 구간으로 보는 최소 낙폭 (1%)
+_DD_THRESHOLD = -0.01
+
+
+@njit("Tuple((int64[:], int64[:], float64[:]))(float64[:], float64)", cache=True)
+def _dd_periods_kernel(dd_values, threshold):
+    """
+    드로다운 구간 탐색 커널 - 한 번의 순회로 (시작, 종료, 최저 낙폭) 배열 반환
+    
+    종료 인덱스는 드로다운이 끝난 첫 봉(배타적). 마지막까지 회복하지 못한 구간은 제외.
+    """
+    n = dd_values.shape[0]
+    starts = np.empty(n, np.int64)
+    ends = np.empty(n, np.int64)
+    mins = np.empty(n, np.float64)
+    k = 0
+    start = -1
+    low = 0.0
+    for i in range(n):
+        dd = dd_values[i]
+        if dd < threshold:
+            if start < 0:
+                start = i
+                low = dd
+            elif dd < low:
+                low = dd
+        elif start >= 0:
+            starts[k] = start
+            ends[k] = i
+            mins[k] = low
+            k += 1
+            start = -1
+    return starts[:k], ends[:k], mins[:k]
+
+
+def _dd_periods_numpy(dd_values: np.ndarray, threshold: float):
+    """드로다운 구간 탐색 (numba 미설치 시 NumPy run-length 인코딩)"""
+    edges = np.diff((dd_values < threshold).view(np.int8), prepend=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)  # 드로다운이 끝난 첫 봉
+    starts = starts[:len(ends)]  # 마지막까지 회복하지 못한 구간은 제외
+    if not len(ends):
+        return starts, ends, np.empty(0, np.float64)
+    # [start, end) 구간별 최솟값 (홀수 번째 결과는 구간 사이 값이므로 버림)
+    mins = np.minimum.reduceat(dd_values, np.column_stack((starts, ends)).ravel())[::2]
+    return starts, ends, mins
+
+
+_dd_periods = _dd_periods_kernel if HAS_NUMBA else _dd_periods_numpy
+
 
 def create_drawdown_analysis(equity_curve_df: pd.DataFrame) -> go.Figure:
     """
@@ -20,62 +73,59 @@ def create_drawdown_analysis(equity_curve_df: pd.DataFrame) -> go.Figure:
     """
     equity_series = equity_curve_df["equity"]
     
-    # 드로다운 계산
-    running_max = equity_series.expanding().max()
-    drawdown = (equity_series - running_max) / running_max
-    
-    # 드로다운 기간 계산
-    drawdown_periods = []
-    in_drawdown = False
-    dd_start = None
-    
-    for i, dd in enumerate(drawdown):
-        if dd < -0.01:  # 1% 이상 드로다운
-            if not in_drawdown:
-                in_drawdown = True
-                dd_start = i
-        else:
-            if in_drawdown:
-                in_drawdown = False
-                if dd_start is not None:
-                    drawdown_periods.append({
-                        "start": drawdown.index[dd_start],
-                        "end": drawdown.index[i - 1],
-                        "duration": i - dd_start,
-                        "max_dd": drawdown.iloc[dd_start:i].min(),
-                    })
-                dd_start = None
+    # 드로다운 계산 (fmax는 NaN을 건너뛰어 expanding().max()와 같은 결과)
+    equity_values = equity_series.to_numpy(dtype=np.float64)
+    running_max = np.fmax.accumulate(equity_values)
+    dd_values = (equity_values - running_max) / running_max
+    drawdown = pd.Series(dd_values, index=equity_series.index)
     
-    # 차트 생성
-    fig = go.Figure()
+    # 드로다운 기간 계산 (1% 이상 드로다운 구간)
+    starts, ends, max_dds = _dd_periods(dd_values, _DD_THRESHOLD)
+    index = drawdown.index
+    drawdown_periods = [
+        {
+            "start": index[start],
+            "end": index[end - 1],
+            "duration": end - start,
+            "max_dd": max_dd,
+        }
+        for start, end, max_dd in zip(starts.tolist(), ends.tolist(), max_dds)
+    ]
     
-    # 드로다운 곡선
-    fig.add_trace(
-        go.Scatter(
-            x=drawdown.index,
-            y=drawdown * 100,
-            name="Drawdown",
-            fill="tozeroy",
-            line=dict(color="red", width=1),
-        )
-    )
-    
-    # 드로다운 기간 표시
-    for period in drawdown_periods:
-        fig.add_vrect(
+    # 드로다운 기간 표시 (add_vrect와 같은 도형)
+    shapes = [
+        dict(
+            type="rect",
+            xref="x",
+            yref="y domain",
             x0=period["start"],
             x1=period["end"],
+            y0=0,
+            y1=1,
             fillcolor="rgba(255, 0, 0, 0.1)",
             layer="below",
             line_width=0,
         )
+        for period in drawdown_periods
+    ]
     
-    fig.update_layout(
-        title="드로다운 분석",
-        xaxis_title="시간",
-        yaxis_title="드로다운 (%)",
-        height=400,
+    # 차트 생성 (트레이스와 레이아웃을 생성자에서 한 번에 검증)
+    return go.Figure(
+        data=[
+            scatter_class(len(drawdown))(
+                x=drawdown.index,
+                y=drawdown * 100,
+                name="Drawdown",
+                fill="tozeroy",
+                line=dict(color="red", width=1),
+            )
+        ],
+        layout=dict(
+            shapes=shapes,
+            title="드로다운 분석",
+            xaxis_title="시간",
+            yaxis_title="드로다운 (%)",
+            height=400,
+        ),
     )
-    
-    return fig
 
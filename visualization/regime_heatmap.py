@@ -1,13 +1,19 @@
 """레짐 히트맵 모듈"""
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Optional
 from strategy.base_strategy import Regime
 from utils.logger import get_logger
+from visualization.charts import scatter_class
 
 logger = get_logger(__name__)
 
+# 레짐 카테고리 순서와 코드별 수치 (마지막 항목은 코드 -1, 즉 알 수 없는 레짐)
+_REGIME_CATEGORIES = [Regime.BEAR, Regime.SIDEWAYS, Regime.BULL]
+_REGIME_VALUES = np.array([-1, 0, 1, 0], dtype=np.int8)
+
 
 def create_regime_heatmap(
     regime_series: pd.Series,
@@ -23,27 +29,16 @@ def create_regime_heatmap(
     Returns:
         Plotly Figure
     """
-    # 레짐을 숫자로 변환
-    regime_map = {
-        Regime.BULL: 1,
-        Regime.BEAR: -1,
-        Regime.SIDEWAYS: 0,
-    }
-    
-    regime_numeric = regime_series.map(lambda x: regime_map.get(x, 0))
+    # 레짐을 숫자로 변환 (카테고리 코드로 룩업, 알 수 없는 값은 코드 -1 -> 0)
+    codes = pd.Categorical(regime_series, categories=_REGIME_CATEGORIES).codes
+    regime_numeric = pd.Series(_REGIME_VALUES[codes], index=regime_series.index)
     
     # 일별 집계
     if isinstance(regime_series.index, pd.DatetimeIndex):
         daily_regime = regime_numeric.resample("1D").mean()
         
-        # 월별 히트맵 데이터 준비
-        daily_regime.index = pd.to_datetime(daily_regime.index)
-        daily_regime["year"] = daily_regime.index.year
-        daily_regime["month"] = daily_regime.index.month
-        daily_regime["day"] = daily_regime.index.day
-        
         # 히트맵 생성 (간단한 구현)
-        fig = go.Figure(data=go.Scatter(
+        fig = go.Figure(data=scatter_class(len(daily_regime))(
             x=daily_regime.index,
             y=daily_regime.values,
             mode="markers",
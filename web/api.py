@@ -1,39 +1,174 @@
 """API 엔드포인트 모듈"""
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify, make_response, request
+from sqlalchemy import text
 from analytics.db_logger import DatabaseLogger
 from utils.helpers import load_yaml
 from utils.logger import get_logger
-from .status import get_backtest_status
-from datetime import datetime, timedelta
+from .status import get_backtest_status, wait_for_status_change
+from datetime import date, datetime, timedelta
+import hashlib
 import json
+import threading
+import time
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 선택 의존성
+    orjson = None
 
 logger = get_logger(__name__)
 
+# 요청마다 다시 만들지 않도록 SQL 문을 모듈 로드 시 한 번만 생성
+SQL_RESULTS_VERSION = text("SELECT MAX(run_date), COUNT(*) FROM myno_backtest_results")
+SQL_LATEST_RESULTS = text("SELECT * FROM myno_backtest_results ORDER BY run_date DESC LIMIT 20")
+SQL_RESULT_BY_SESSION = text("SELECT * FROM myno_backtest_results WHERE session_id = :session_id")
+SQL_LATEST_REFLECTION = text("SELECT * FROM myno_reflection_logs ORDER BY reflection_date DESC, created_at DESC LIMIT 1")
+SQL_REFLECTION_BY_SESSION = text("SELECT * FROM myno_reflection_logs WHERE session_id = :session_id ORDER BY created_at DESC LIMIT 1")
+SQL_TRADES_BY_SESSION = text("SELECT * FROM myno_trade_details WHERE session_id = :session_id ORDER BY entry_time")
+SQL_TRADES_VERSION = text("SELECT MAX(entry_time), COUNT(*) FROM myno_trade_details WHERE session_id = :session_id")
+
+# 상태 스트림 keep-alive 주기 (초) - 프록시가 유휴 연결을 끊지 않도록
+_STATUS_STREAM_KEEPALIVE = 15.0
+
+# 최신 결과/일지 응답 캐시 유지 시간 (초) - 여러 탭이 같은 응답을 공유
+_RESPONSE_CACHE_TTL = 10.0
+
+# 거래 기록 스트리밍 시 한 번에 가져오는 행 수
+_STREAM_YIELD_PER = 1000
+
 api_bp = Blueprint("api", __name__)
 
-# 전역 DB 로거 (초기화는 필요시)
+# 전역 DB 로거 (초기화는 필요시, 프로세스당 한 번만 시도)
 _db_logger = None
+_db_logger_ready = False
+_DB_LOCK = threading.Lock()
+
+# 응답 캐시: 키 -> (만료 시각, 상태 버전, 본문, ETag)
+_response_cache = {}
+_CACHE_LOCK = threading.Lock()
 
 
 def get_db_logger():
-    """데이터베이스 로거 인스턴스 반환"""
-    global _db_logger
-    if _db_logger is None:
-        try:
-            config = load_yaml("config/settings.yaml")
-            db_config = config.get("data", {}).get("database", {})
-            connection_string = db_config.get("connection_string")
-            if connection_string:
-                _db_logger = DatabaseLogger(connection_string, "myno")
-        except Exception as e:
-            logger.error(f"DB 로거 초기화 실패: {e}")
+    """데이터베이스 로거 인스턴스 반환 (DB 미설정/초기화 실패 시 None)"""
+    global _db_logger, _db_logger_ready
+    if not _db_logger_ready:
+        with _DB_LOCK:
+            if not _db_logger_ready:
+                try:
+                    config = load_yaml("config/settings.yaml")
+                    db_config = config.get("data", {}).get("database", {})
+                    connection_string = db_config.get("connection_string")
+                    if connection_string:
+                        _db_logger = DatabaseLogger(connection_string, "myno")
+                except Exception as e:
+                    logger.error(f"DB 로거 초기화 실패: {e}")
+                _db_logger_ready = True
     return _db_logger
 
 
-@api_bp.route("/status")
-def get_status():
-    """백테스트 상태 조회"""
+def _json_default(value):
+    """표준 json 대체 직렬화 (날짜/시간은 ISO 형식, 그 외는 문자열)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(payload) -> bytes:
+    """DB 행 페이로드를 JSON 바이트로 직렬화 (orjson이 있으면 사용, 날짜/시간은 ISO 형식)"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_json_default, ensure_ascii=False).encode("utf-8")
+
+
+def _json_response(body, status: int = 200) -> Response:
+    """직렬화된 JSON 바이트로 응답 생성"""
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _cached_payload(key: str, producer):
+    """
+    producer() 결과 (본문, ETag)를 TTL 동안 캐시해 공유
+    
+    새 결과가 DB에 저장되면 (results_version 증가) TTL 전이라도 다시 생성.
+    예외가 발생한 결과는 캐시하지 않음.
+    
+    Args:
+        key: 캐시 키
+        producer: (본문 바이트, ETag 또는 None)을 반환하는 함수
+        
+    Returns:
+        (본문 바이트, ETag 또는 None)
+    """
+    now = time.monotonic()
+    version = get_backtest_status().get("results_version", 0)
+    with _CACHE_LOCK:
+        entry = _response_cache.get(key)
+    if entry is not None and entry[0] > now and entry[1] == version:
+        return entry[2], entry[3]
+    
+    body, etag = producer()
+    with _CACHE_LOCK:
+        _response_cache[key] = (now + _RESPONSE_CACHE_TTL, version, body, etag)
+    return body, etag
+
+
+def _fetch_dicts(result) -> list:
+    """쿼리 결과를 컬럼명 딕셔너리 리스트로 변환"""
+    return [dict(row) for row in result.mappings()]
+
+
+def _make_etag(*parts) -> str:
+    """데이터 버전(최신 시각, 행 수 등)으로 ETag 생성"""
+    return hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+
+
+# flask-compress가 압축 응답의 ETag 뒤에 붙이는 접미사
+_COMPRESSED_ETAG_SUFFIXES = (":gzip", ":br")
+
+
+def matching_etag(etag: str) -> Optional[str]:
+    """
+    If-None-Match에서 etag와 일치하는 태그 조회
+    
+    압축 미들웨어가 바꾼 "<etag>:gzip" / "<etag>:br" 형태도 같은 표현으로 본다.
+    
+    Args:
+        etag: 서버가 계산한 ETag
+        
+    Returns:
+        클라이언트가 보낸 일치 태그 (없으면 None)
+    """
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return None
+    for candidate in (etag, *(etag + suffix for suffix in _COMPRESSED_ETAG_SUFFIXES)):
+        if if_none_match.contains(candidate):
+            return candidate
+    return None
+
+
+def _not_modified(etag: str):
+    """클라이언트가 같은 ETag를 가지고 있으면 304 응답 반환 (아니면 None)"""
+    matched = matching_etag(etag)
+    if matched is not None:
+        response = make_response("", 304)
+        response.set_etag(matched)
+        return response
+    return None
+
+
+def _etag_response(body, etag: str):
+    """ETag와 재검증 헤더를 붙인 JSON 응답 (body는 바이트 또는 바이트 조각 생성기)"""
+    response = _json_response(body)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"  # 캐시하되 매번 ETag로 재검증
+    return response
+
+
+def _status_payload() -> dict:
+    """백테스트 상태 응답 본문 생성 (진행률, 예상 남은 시간 포함)"""
     status = get_backtest_status()
     
     # 진행률 계산
@@ -44,16 +179,17 @@ def get_status():
     
     # 예상 남은 시간 계산
     eta = None
-    if status.get("running") and status.get("current_bar", 0) > 0:
-        elapsed = (datetime.now() - datetime.fromisoformat(status.get("start_time", datetime.now().isoformat()))).total_seconds()
+    start_monotonic = status.get("_start_monotonic")
+    if status.get("running") and status.get("current_bar", 0) > 0 and start_monotonic is not None:
+        elapsed = time.monotonic() - start_monotonic
         if elapsed > 0:
             rate = status.get("current_bar", 0) / elapsed
             remaining_bars = status.get("total_bars", 0) - status.get("current_bar", 0)
             if rate > 0:
-                remaining_seconds = remaining_bars / rate
-                eta = f"{int(remaining_seconds // 60)}분 {int(remaining_seconds % 60)}초"
+                minutes, seconds = divmod(int(remaining_bars / rate), 60)
+                eta = f"{minutes}분 {seconds}초"
     
-    return jsonify({
+    return {
         "running": status.get("running", False),
         "progress": progress,
         "current_bar": status.get("current_bar", 0),
@@ -62,7 +198,92 @@ def get_status():
         "start_time": status.get("start_time"),
         "estimated_time_remaining": eta,
         "message": status.get("message", "대기 중"),
-    })
+        "results_version": status.get("results_version", 0),
+    }
+
+
+@api_bp.route("/status")
+def get_status():
+    """백테스트 상태 조회"""
+    return jsonify(_status_payload())
+
+
+@api_bp.route("/status/stream")
+def stream_status():
+    """
+    백테스트 상태 Server-Sent Events 스트림
+    
+    상태가 바뀔 때만 상태 이벤트를 보내고, 결과/일지가 DB에 저장되면
+    다시 불러오도록 'results' 이벤트를 보냄.
+    """
+    def generate():
+        version = -1
+        results_version = None
+        while True:
+            new_version = wait_for_status_change(version, _STATUS_STREAM_KEEPALIVE)
+            if new_version == version:
+                yield ": keepalive\n\n"
+                continue
+            version = new_version
+            
+            payload = _status_payload()
+            yield b"data: " + _dumps(payload) + b"\n\n"
+            
+            # 결과 저장 완료 시 갱신 신호 (종료 상태는 저장 전에 게시되므로 사용하지 않음)
+            if results_version is not None and payload["results_version"] != results_version:
+                yield "event: results\ndata: {}\n\n"
+            results_version = payload["results_version"]
+    
+    response = Response(generate(), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"  # nginx 버퍼링 비활성화
+    return response
+
+
+def _latest_results(db_logger):
+    """최신 백테스트 결과 목록의 (JSON 바이트, ETag) 반환 (응답 캐시 공유)"""
+    def produce():
+        with db_logger.engine.connect() as conn:
+            latest_run_date, total = conn.execute(SQL_RESULTS_VERSION).fetchone()
+            result = conn.execute(SQL_LATEST_RESULTS)
+            return _dumps(_fetch_dicts(result)), _make_etag(latest_run_date, total)
+    
+    return _cached_payload("results/latest", produce)
+
+
+def _latest_reflection(db_logger) -> bytes:
+    """최신 자기반성 일지의 JSON 바이트 반환 (없으면 빈 객체, 응답 캐시 공유)"""
+    def produce():
+        with db_logger.engine.connect() as conn:
+            row = conn.execute(SQL_LATEST_REFLECTION).mappings().fetchone()
+            return _dumps(dict(row) if row else {}), None
+    
+    return _cached_payload("reflection/latest", produce)[0]
+
+
+@api_bp.route("/dashboard")
+def get_dashboard():
+    """대시보드 묶음 조회 (상태 + 최신 결과 + 최신 일지를 한 번의 요청으로)"""
+    results, reflection = b"[]", b"{}"
+    db_logger = get_db_logger()
+    if db_logger:
+        try:
+            results, _ = _latest_results(db_logger)
+        except Exception as e:
+            logger.error(f"결과 조회 실패: {e}")
+        try:
+            reflection = _latest_reflection(db_logger)
+        except Exception as e:
+            logger.error(f"일지 조회 실패: {e}")
+    
+    # 캐시된 직렬화 결과를 그대로 이어 붙여 재직렬화 없이 응답
+    body = b"".join((
+        b'{"status":', _dumps(_status_payload()),
+        b',"results":', results,
+        b',"reflection":', reflection,
+        b"}",
+    ))
+    return _json_response(body)
 
 
 @api_bp.route("/results/latest")
@@ -73,28 +294,11 @@ def get_latest_results():
         return jsonify([])
     
     try:
-        with db_logger.engine.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT * FROM myno_backtest_results 
-                ORDER BY run_date DESC 
-                LIMIT 20
-            """))
-            
-            rows = result.fetchall()
-            columns = result.keys()
-            
-            results = []
-            for row in rows:
-                result_dict = dict(zip(columns, row))
-                # datetime 객체를 문자열로 변환
-                for key, value in result_dict.items():
-                    if isinstance(value, datetime):
-                        result_dict[key] = value.isoformat()
-                    elif isinstance(value, (int, float)) and value is None:
-                        result_dict[key] = 0
-                results.append(result_dict)
-            
-            return jsonify(results)
+        body, etag = _latest_results(db_logger)
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+        return _etag_response(body, etag)
     except Exception as e:
         logger.error(f"결과 조회 실패: {e}")
         return jsonify([])
@@ -109,19 +313,11 @@ def get_result_by_session(session_id):
     
     try:
         with db_logger.engine.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT * FROM myno_backtest_results 
-                WHERE session_id = :session_id
-            """), {"session_id": session_id})
+            result = conn.execute(SQL_RESULT_BY_SESSION, {"session_id": session_id})
             
-            row = result.fetchone()
+            row = result.mappings().fetchone()
             if row:
-                columns = result.keys()
-                result_dict = dict(zip(columns, row))
-                for key, value in result_dict.items():
-                    if isinstance(value, datetime):
-                        result_dict[key] = value.isoformat()
-                return jsonify(result_dict)
+                return _json_response(_dumps(dict(row)))
             else:
                 return jsonify({}), 404
     except Exception as e:
@@ -137,23 +333,7 @@ def get_latest_reflection():
         return jsonify({})
     
     try:
-        with db_logger.engine.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT * FROM myno_reflection_logs 
-                ORDER BY reflection_date DESC, created_at DESC 
-                LIMIT 1
-            """))
-            
-            row = result.fetchone()
-            if row:
-                columns = result.keys()
-                result_dict = dict(zip(columns, row))
-                for key, value in result_dict.items():
-                    if isinstance(value, datetime):
-                        result_dict[key] = value.isoformat()
-                return jsonify(result_dict)
-            else:
-                return jsonify({})
+        return _json_response(_latest_reflection(db_logger))
     except Exception as e:
         logger.error(f"일지 조회 실패: {e}")
         return jsonify({})
@@ -168,21 +348,11 @@ def get_reflection_by_session(session_id):
     
     try:
         with db_logger.engine.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT * FROM myno_reflection_logs 
-                WHERE session_id = :session_id
-                ORDER BY created_at DESC 
-                LIMIT 1
-            """), {"session_id": session_id})
+            result = conn.execute(SQL_REFLECTION_BY_SESSION, {"session_id": session_id})
             
-            row = result.fetchone()
+            row = result.mappings().fetchone()
             if row:
-                columns = result.keys()
-                result_dict = dict(zip(columns, row))
-                for key, value in result_dict.items():
-                    if isinstance(value, datetime):
-                        result_dict[key] = value.isoformat()
-                return jsonify(result_dict)
+                return _json_response(_dumps(dict(row)))
             else:
                 return jsonify({}), 404
     except Exception as e:
@@ -190,6 +360,35 @@ def get_reflection_by_session(session_id):
         return jsonify({}), 500
 
 
+def _stream_trades(db_logger, session_id: str):
+    """
+    세션 거래 기록을 서버 측 커서로 읽으며 JSON 배열 조각 단위로 생성
+    
+    Args:
+        db_logger: 데이터베이스 로거
+        session_id: 세션 ID
+        
+    Yields:
+        JSON 배열 조각 (바이트)
+    """
+    yield b"["
+    try:
+        conn = db_logger.engine.connect().execution_options(stream_results=True, yield_per=_STREAM_YIELD_PER)
+        with conn:
+            result = conn.execute(SQL_TRADES_BY_SESSION, {"session_id": session_id})
+            
+            separator = b""
+            for rows in result.mappings().partitions():
+                yield separator + b",".join(_dumps(dict(row)) for row in rows)
+                separator = b","
+    except Exception as e:
+        # 응답 전송이 이미 시작되어 상태 코드는 바꿀 수 없음.
+        # 배열을 닫지 않고 다시 발생시켜 연결을 끊음 - 잘린 목록이 정상 본문(과 ETag)으로 캐시되지 않도록
+        logger.error(f"거래 기록 스트리밍 실패: {e}")
+        raise
+    yield b"]"
+
+
 @api_bp.route("/trades/<session_id>")
 def get_trades_by_session(session_id):
     """특정 세션의 거래 기록 조회"""
@@ -199,24 +398,14 @@ def get_trades_by_session(session_id):
     
     try:
         with db_logger.engine.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT * FROM myno_trade_details 
-                WHERE session_id = :session_id
-                ORDER BY entry_time
-            """), {"session_id": session_id})
-            
-            rows = result.fetchall()
-            columns = result.keys()
-            
-            trades = []
-            for row in rows:
-                trade_dict = dict(zip(columns, row))
-                for key, value in trade_dict.items():
-                    if isinstance(value, datetime):
-                        trade_dict[key] = value.isoformat()
-                trades.append(trade_dict)
-            
-            return jsonify(trades)
+            version = tuple(conn.execute(SQL_TRADES_VERSION, {"session_id": session_id}).fetchone())
+        
+        etag = _make_etag(session_id, *version)
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+        
+        return _etag_response(_stream_trades(db_logger, session_id), etag)
     except Exception as e:
         logger.error(f"거래 기록 조회 실패: {e}")
         return jsonify([])
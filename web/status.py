@@ -1,11 +1,14 @@
 """백테스트 상태 관리 모듈"""
 
 from datetime import datetime
+import threading
+import time
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # 전역 변수로 백테스트 상태 관리
+# (갱신 시 새 딕셔너리로 교체 - 읽는 쪽은 항상 완성된 스냅샷을 보며, 읽기 전용으로 취급)
 backtest_status = {
     "running": False,
     "progress": 0,
@@ -15,18 +18,69 @@ backtest_status = {
     "start_time": None,
     "estimated_time_remaining": None,
     "message": "대기 중",
+    "results_version": 0,  # 결과/일지가 DB에 저장될 때마다 증가
+    "_start_monotonic": None,  # 경과 시간 계산용 (start_time은 표시용)
 }
 
 
+# 상태 변경 알림 (SSE 구독자가 변경 시에만 깨어나도록)
+_status_changed = threading.Condition()
+_status_version = 0
+
+
 def update_backtest_status(**kwargs):
-    """백테스트 상태 업데이트"""
-    global backtest_status
-    backtest_status.update(kwargs)
-    if kwargs.get("running"):
-        backtest_status["start_time"] = datetime.now().isoformat()
+    """백테스트 상태 업데이트 (새 스냅샷 게시 후 대기 중인 구독자에게 변경 알림)"""
+    global backtest_status, _status_version
+    with _status_changed:
+        new_status = {**backtest_status, **kwargs}
+        if kwargs.get("running") and not backtest_status.get("running"):  # 시작 시점에만 기록
+            new_status["start_time"] = datetime.now().isoformat()
+            new_status["_start_monotonic"] = time.monotonic()
+        backtest_status = new_status
+        _status_version += 1
+        _status_changed.notify_all()
+
+
+def notify_results_saved(session_id=None):
+    """
+    백테스트 결과/거래/일지 DB 저장 완료 알림
+    
+    results_version을 올려 대시보드가 저장된 결과를 다시 불러오도록 함
+    (백테스트 종료 상태는 결과 저장 전에 게시되므로 별도 신호가 필요).
+    
+    Args:
+        session_id: 저장된 세션 ID
+    """
+    with _status_changed:
+        update_backtest_status(
+            session_id=session_id,
+            results_version=backtest_status["results_version"] + 1,
+            message="결과 저장 완료",
+        )
+
+
+def wait_for_status_change(last_version: int, timeout: float) -> int:
+    """
+    상태가 last_version 이후로 바뀔 때까지 대기
+    
+    Args:
+        last_version: 마지막으로 확인한 상태 버전
+        timeout: 최대 대기 시간 (초)
+        
+    Returns:
+        현재 상태 버전 (시간 초과 시 last_version 그대로일 수 있음)
+    """
+    with _status_changed:
+        _status_changed.wait_for(lambda: _status_version != last_version, timeout)
+        return _status_version
+
+
+def get_status_version() -> int:
+    """현재 상태 버전 반환 (상태가 바뀔 때마다 증가)"""
+    return _status_version
 
 
 def get_backtest_status():
-    """백테스트 상태 반환"""
+    """백테스트 상태 스냅샷 반환 (읽기 전용으로 사용)"""
     return backtest_status
 
@@ -1,26 +1,121 @@
 """TradingView 웹훅 핸들러 - 봉 마감 데이터 수신"""
 
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
 from flask import Blueprint, request, jsonify
 from utils.logger import get_logger
+from utils.helpers import parse_iso_datetime
 import hmac
 import hashlib
 import json
+import os
+import queue
+import re
+import threading
+import time
 
 logger = get_logger(__name__)
 
-# TradingView 웹훅을 받을 전역 콜백
+# TradingView 웹훅을 받을 전역 콜백 (봉 단위 / 배치 단위)
 _tradingview_callback: Optional[Callable] = None
+_tradingview_batch_callback: Optional[Callable] = None
+
+# 웹훅 시크릿 (비어 있으면 검증 생략)
+WEBHOOK_SECRET = os.environ.get("TV_WEBHOOK_SECRET", "").encode("utf-8")
+
+# 요청 스레드에서 콜백을 바로 실행할지 여부 (처리 결과/실패를 응답으로 받아야 하는 경우)
+SYNC_CALLBACK = os.environ.get("TV_WEBHOOK_SYNC_CALLBACK", "").lower() in ("1", "true")
+
+# 치환되지 않은 Alert 템플릿 변수 (예: "{{ticker}}")
+_TEMPLATE_RE = re.compile(r"\{\{.*\}\}", re.DOTALL)
+
+# 유닉스 타임스탬프 단위 판별: (하한, 나눗수) - 마이크로초, 밀리초, 초 순
+_TS_DIVISORS = ((1e15, 1_000_000.0), (1e12, 1000.0), (float("-inf"), 1.0))
+
+# 가격 필드 대체 키 순서 (상세 형식 -> 간단한 형식 -> Pine Script 기본 형식)
+_OPEN_KEYS = ("open", "price", "close", "value")
+_CLOSE_KEYS = ("close", "price", "value", "open")
+
+# 수신 봉 버퍼: 요청 스레드는 넣기만 하고, 단일 플러셔 스레드가 도착 순서대로 묶어서 처리
+_BATCH_MAX_SIZE = 64
+_BATCH_MAX_WAIT = 0.2  # 초
+_bar_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=1024)
+_flusher_thread: Optional[threading.Thread] = None
+_FLUSHER_LOCK = threading.Lock()
 
 
 def set_tradingview_callback(callback: Callable):
-    """TradingView 웹훅 콜백 설정"""
+    """TradingView 웹훅 콜백 설정 (봉 하나씩 호출)"""
     global _tradingview_callback
     _tradingview_callback = callback
+    _ensure_flusher()
     logger.info("TradingView 웹훅 콜백 설정 완료")
 
 
+def set_tradingview_batch_callback(callback: Callable):
+    """
+    TradingView 웹훅 배치 콜백 설정
+    
+    설정되면 봉 단위 콜백 대신 최대 64개 / 0.2초 단위로 묶인 봉 리스트로 호출됨.
+    """
+    global _tradingview_batch_callback
+    _tradingview_batch_callback = callback
+    _ensure_flusher()
+    logger.info("TradingView 웹훅 배치 콜백 설정 완료")
+
+
+def _ensure_flusher():
+    """플러셔 스레드를 한 번만 시작"""
+    global _flusher_thread
+    with _FLUSHER_LOCK:
+        if _flusher_thread is None:
+            _flusher_thread = threading.Thread(target=_flush_loop, name="tv-webhook-flusher", daemon=True)
+            _flusher_thread.start()
+
+
+def _next_batch() -> List[Dict[str, Any]]:
+    """첫 봉이 올 때까지 대기 후, 최대 크기 또는 최대 대기 시간까지 모아서 반환"""
+    batch = [_bar_queue.get()]
+    deadline = time.monotonic() + _BATCH_MAX_WAIT
+    while len(batch) < _BATCH_MAX_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_bar_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def _dispatch_batch(batch: List[Dict[str, Any]]):
+    """묶인 봉을 배치 콜백(우선) 또는 봉 단위 콜백으로 전달"""
+    batch_callback = _tradingview_batch_callback
+    if batch_callback:
+        try:
+            batch_callback(batch)
+            logger.info("웹훅 배치 콜백 실행 완료: {}개 봉", len(batch))
+        except Exception as e:
+            logger.error("웹훅 배치 콜백 실행 실패: {}", e)
+        return
+    
+    callback = _tradingview_callback
+    if not callback:
+        return
+    for bar_data in batch:
+        try:
+            callback(bar_data)
+            logger.info("웹훅 콜백 실행 완료: {}", bar_data.get('timestamp'))
+        except Exception as e:
+            logger.error("웹훅 콜백 실행 실패: {}", e)
+
+
+def _flush_loop():
+    """플러셔 스레드 본체 - 버퍼의 봉을 묶어서 콜백으로 전달"""
+    while True:
+        _dispatch_batch(_next_batch())
+
+
 tradingview_bp = Blueprint('tradingview', __name__)
 
 
@@ -53,6 +148,12 @@ def tradingview_webhook():
     }
     """
     try:
+        # 시크릿 검증은 파싱 전에 수행 (인증되지 않은 요청은 파싱 비용 없이 거부)
+        raw = request.get_data(cache=True)
+        if not _verify_webhook_secret(raw, request.headers.get('X-Webhook-Secret', '')):
+            logger.warning("웹훅 시크릿 검증 실패")
+            return jsonify({"error": "unauthorized"}), 401
+        
         # 요청 데이터 파싱
         if request.is_json:
             data = request.get_json()
@@ -63,7 +164,7 @@ def tradingview_webhook():
             if 'data' in data:
                 data = json.loads(data['data'])
         
-        logger.info(f"TradingView 웹훅 수신: {data}")
+        logger.debug("TradingView 웹훅 수신: {}", data)
         
         # 데이터 검증
         if not data:
@@ -75,162 +176,158 @@ def tradingview_webhook():
         if not bar_data:
             return jsonify({"error": "데이터 파싱 실패"}), 400
         
-        # 웹훅 시크릿 검증 (선택적)
-        webhook_secret = request.headers.get('X-Webhook-Secret')
-        if webhook_secret:
-            # 시크릿 검증 로직 (필요시 구현)
-            pass
-        
-        # 콜백 호출
-        if _tradingview_callback:
+        # 동기 모드: 콜백 완료 후 응답 (실패 시 500)
+        if SYNC_CALLBACK:
             try:
-                _tradingview_callback(bar_data)
-                logger.info(f"웹훅 콜백 실행 완료: {bar_data.get('timestamp')}")
+                if _tradingview_batch_callback:
+                    _tradingview_batch_callback([bar_data])
+                elif _tradingview_callback:
+                    _tradingview_callback(bar_data)
             except Exception as e:
-                logger.error(f"웹훅 콜백 실행 실패: {e}")
+                logger.error("웹훅 콜백 실행 실패: {}", e)
                 return jsonify({"error": f"콜백 실행 실패: {str(e)}"}), 500
+            return jsonify({
+                "status": "success",
+                "message": "웹훅 처리 완료",
+                "timestamp": bar_data["timestamp"],
+            }), 200
+        
+        # 콜백은 플러셔에 넘기고 즉시 응답 (TradingView 알림 타임아웃 방지)
+        if _tradingview_callback or _tradingview_batch_callback:
+            try:
+                _bar_queue.put_nowait(bar_data)
+            except queue.Full:
+                logger.error("웹훅 버퍼가 가득 참 - 봉 처리 지연")
+                return jsonify({"error": "웹훅 버퍼가 가득 찼습니다"}), 503
         
+        # 응답에는 원본 데이터를 되돌려 보내지 않음 (TradingView는 상태 코드만 확인)
         return jsonify({
             "status": "success",
-            "message": "웹훅 처리 완료",
-            "data": bar_data
-        }), 200
+            "message": "웹훅 수신 완료",
+            "timestamp": bar_data["timestamp"],
+        }), 202
         
     except Exception as e:
-        logger.error(f"TradingView 웹훅 처리 실패: {e}")
+        logger.error("TradingView 웹훅 처리 실패: {}", e)
         return jsonify({"error": str(e)}), 500
 
 
+def _verify_webhook_secret(raw: bytes, signature: str) -> bool:
+    """
+    X-Webhook-Secret 헤더 검증 (상수 시간 비교)
+    
+    본문의 HMAC-SHA256 hex 서명 또는 시크릿 자체를 허용.
+    
+    Args:
+        raw: 요청 본문 바이트
+        signature: X-Webhook-Secret 헤더 값
+        
+    Returns:
+        검증 통과 여부 (시크릿 미설정 시 항상 True)
+    """
+    if not WEBHOOK_SECRET:
+        return True
+    signature = signature.encode("utf-8")
+    expected = hmac.new(WEBHOOK_SECRET, raw, hashlib.sha256).hexdigest().encode("ascii")
+    # 두 비교를 모두 수행해 어느 쪽이 일치했는지 시간으로 드러나지 않도록 함
+    signed = hmac.compare_digest(signature, expected)
+    shared = hmac.compare_digest(signature, WEBHOOK_SECRET)
+    return signed or shared
+
+
+def _from_epoch(ts_value: float) -> datetime:
+    """초/밀리초/마이크로초 단위 유닉스 타임스탬프를 datetime으로 변환 (크기로 단위 판별)"""
+    divisor = next((d for threshold, d in _TS_DIVISORS if ts_value > threshold), 1.0)
+    return datetime.fromtimestamp(ts_value / divisor)
+
+
+def _template_or(value: str, default: str) -> str:
+    """치환되지 않은 템플릿 변수면 경고 후 기본값 반환"""
+    if _TEMPLATE_RE.fullmatch(value):
+        logger.warning("템플릿 변수가 치환되지 않음: {}. Alert 메시지 설정을 확인하세요.", value)
+        return default
+    return value
+
+
+def _as_float(value: Any) -> float:
+    """float 변환 (JSON 본문에서 이미 float로 파싱된 값은 그대로 반환)"""
+    return value if type(value) is float else float(value)
+
+
+def _first(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """keys 중 data에 처음으로 존재하는 키의 값 반환 (없으면 None)"""
+    for key in keys:
+        if key in data:
+            return data[key]
+    return None
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """
+    TradingView 타임스탬프 파싱
+    
+    Args:
+        value: 유닉스 타임스탬프 (숫자 또는 문자열) 또는 ISO 형식 문자열
+        
+    Returns:
+        파싱된 시각 (없거나 파싱 불가하면 현재 시각)
+    """
+    if isinstance(value, str):
+        if _TEMPLATE_RE.fullmatch(value):
+            logger.warning("템플릿 변수가 치환되지 않음: {}. Alert 메시지 설정을 확인하세요.", value)
+            return datetime.now()
+        # Unix timestamp 문자열 (초, 밀리초, 또는 마이크로초)
+        try:
+            return _from_epoch(float(value))
+        except (ValueError, OverflowError, OSError):
+            # ISO 형식
+            try:
+                return parse_iso_datetime(value)
+            except ValueError:
+                return datetime.now()
+    if isinstance(value, (int, float)):
+        return _from_epoch(value)
+    return datetime.now()
+
+
 def _parse_tradingview_data(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     TradingView 데이터를 표준 형식으로 변환
     
+    상세 형식(symbol/OHLCV), 간단한 형식(ticker/price), Pine Script 기본 형식(close/value)을
+    필드별 대체 키 순서로 한 번에 정규화함.
+    
     Args:
         data: TradingView 웹훅 데이터
         
     Returns:
-        표준화된 봉 데이터
+        표준화된 봉 데이터 (가격 필드가 없거나 파싱 실패 시 None)
     """
     try:
-        # 다양한 TradingView 데이터 형식 지원
-        
-        # 형식 1: 상세 형식
-        if "symbol" in data or "ticker" in data:
-            symbol = data.get("symbol") or data.get("ticker", "UNKNOWN")
-            exchange = data.get("exchange", "BINANCE")
-            timeframe = data.get("timeframe") or data.get("interval", "1m")
-            
-            # 템플릿 변수가 치환되지 않은 경우 처리
-            if symbol.startswith("{{") and symbol.endswith("}}"):
-                logger.warning(f"템플릿 변수가 치환되지 않음: {symbol}. Alert 메시지 설정을 확인하세요.")
-                symbol = "UNKNOWN"  # 기본값 사용
-            if exchange.startswith("{{") and exchange.endswith("}}"):
-                logger.warning(f"템플릿 변수가 치환되지 않음: {exchange}. Alert 메시지 설정을 확인하세요.")
-                exchange = "BINANCE"  # 기본값 사용
-            if timeframe.startswith("{{") and timeframe.endswith("}}"):
-                logger.warning(f"템플릿 변수가 치환되지 않음: {timeframe}. Alert 메시지 설정을 확인하세요.")
-                timeframe = "1m"  # 기본값 사용
-            
-            # 타임스탬프 파싱
-            timestamp_str = data.get("timestamp") or data.get("time")
-            if isinstance(timestamp_str, str):
-                # 템플릿 변수 체크
-                if timestamp_str.startswith("{{") and timestamp_str.endswith("}}"):
-                    logger.warning(f"템플릿 변수가 치환되지 않음: {timestamp_str}. Alert 메시지 설정을 확인하세요.")
-                    timestamp = datetime.now()
-                else:
-                    # Unix timestamp 문자열 (초, 밀리초, 또는 마이크로초)
-                    try:
-                        ts_value = float(timestamp_str)
-                        # 마이크로초인지 확인 (16자리 이상이면 마이크로초)
-                        if ts_value > 1e15:  # 마이크로초
-                            timestamp = datetime.fromtimestamp(ts_value / 1000000)
-                        elif ts_value > 1e12:  # 밀리초
-                            timestamp = datetime.fromtimestamp(ts_value / 1000)
-                        else:  # 초 단위
-                            timestamp = datetime.fromtimestamp(ts_value)
-                    except:
-                        # ISO 형식
-                        try:
-                            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                        except:
-                            timestamp = datetime.now()
-            elif isinstance(timestamp_str, (int, float)):
-                # 마이크로초인지 확인 (16자리 이상이면 마이크로초)
-                if timestamp_str > 1e15:  # 마이크로초
-                    timestamp = datetime.fromtimestamp(timestamp_str / 1000000)
-                elif timestamp_str > 1e12:  # 밀리초
-                    timestamp = datetime.fromtimestamp(timestamp_str / 1000)
-                else:  # 초 단위
-                    timestamp = datetime.fromtimestamp(timestamp_str)
-            else:
-                timestamp = datetime.now()
-            
-            # OHLCV 데이터
-            open_price = float(data.get("open", data.get("price", 0.0)))
-            high = float(data.get("high", open_price))
-            low = float(data.get("low", open_price))
-            close = float(data.get("close", data.get("price", open_price)))
-            volume = float(data.get("volume", 0.0))
-            
-            return {
-                "symbol": symbol,
-                "exchange": exchange,
-                "timeframe": timeframe,
-                "timestamp": timestamp.isoformat(),
-                "open": open_price,
-                "high": high,
-                "low": low,
-                "close": close,
-                "volume": volume,
-                "action": data.get("action"),  # "buy" or "sell" (선택)
-                "strategy_name": data.get("strategy_name"),
-                "raw_data": data,  # 원본 데이터 보관
-            }
+        open_raw = _first(data, _OPEN_KEYS)
+        close_raw = _first(data, _CLOSE_KEYS)
+        if open_raw is None or close_raw is None:
+            logger.warning("가격 데이터를 찾을 수 없음: {}", data)
+            return None
+        open_price = _as_float(open_raw)
         
-        # 형식 2: 간단한 형식
-        elif "price" in data:
-            return {
-                "symbol": data.get("ticker", "UNKNOWN"),
-                "exchange": "BINANCE",
-                "timeframe": "1m",
-                "timestamp": datetime.now().isoformat(),
-                "open": float(data.get("price", 0.0)),
-                "high": float(data.get("price", 0.0)),
-                "low": float(data.get("price", 0.0)),
-                "close": float(data.get("price", 0.0)),
-                "volume": float(data.get("volume", 0.0)),
-                "raw_data": data,
-            }
-        
-        # 형식 3: Pine Script 기본 형식
-        else:
-            # 가능한 모든 필드 확인
-            price = None
-            for key in ["close", "price", "value"]:
-                if key in data:
-                    price = float(data[key])
-                    break
-            
-            if price is None:
-                logger.warning(f"가격 데이터를 찾을 수 없음: {data}")
-                return None
-            
-            return {
-                "symbol": data.get("ticker", data.get("symbol", "UNKNOWN")),
-                "exchange": "BINANCE",
-                "timeframe": data.get("interval", "1m"),
-                "timestamp": datetime.now().isoformat(),
-                "open": price,
-                "high": price,
-                "low": price,
-                "close": price,
-                "volume": float(data.get("volume", 0.0)),
-                "raw_data": data,
-            }
-            
+        return {
+            # 템플릿 변수가 치환되지 않은 경우 기본값 사용
+            "symbol": _template_or(data.get("symbol") or data.get("ticker") or "UNKNOWN", "UNKNOWN"),
+            "exchange": _template_or(data.get("exchange") or "BINANCE", "BINANCE"),
+            "timeframe": _template_or(data.get("timeframe") or data.get("interval") or "1m", "1m"),
+            "timestamp": _parse_timestamp(data.get("timestamp") or data.get("time")).isoformat(),
+            "open": open_price,
+            "high": _as_float(data.get("high", open_price)),
+            "low": _as_float(data.get("low", open_price)),
+            "close": _as_float(close_raw),
+            "volume": _as_float(data.get("volume", 0.0)),
+            "action": data.get("action"),  # "buy" or "sell" (선택)
+            "strategy_name": data.get("strategy_name"),
+            "raw_data": data,  # 원본 데이터 보관
+        }
     except Exception as e:
-        logger.error(f"TradingView 데이터 파싱 실패: {e}, 데이터: {data}")
+        logger.error("TradingView 데이터 파싱 실패: {}, 데이터: {}", e, data)
         return None
 
 